@@ -0,0 +1,46 @@
+import importlib
+import sys
+import tempfile
+import time
+
+from benchmarks.pipeline_benchmark import generate_package
+from foxhound import child_container, start
+
+# python -m benchmarks.child_container_benchmark
+
+_SIZES: tuple[int, ...] = (1_000, 10_000, 50_000)
+_CHILDREN: int = 100
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        sys.path.insert(0, root)
+
+        for size in _SIZES:
+            package: str = generate_package(root, 'diamond', size)
+
+            started: float = time.perf_counter()
+            container = start(package)
+            start_time: float = time.perf_counter() - started
+
+            # A component of the second to last layer - overriding it re-inflates the last layer only, so the
+            # child's cost shouldn't depend on the graph's size
+            name: str = f'Mesh{size - 9}'
+            kind: type = getattr(importlib.import_module(f'{package}.module_{(size - 9) // 500}'), name)
+            child_container(container, {kind: object.__new__(kind)})
+
+            started = time.perf_counter()
+
+            for _ in range(_CHILDREN):
+                child_container(container, {kind: object.__new__(kind)})
+
+            child_time: float = (time.perf_counter() - started) / _CHILDREN
+
+            print(
+                f'diamond/{size:<6}  start {start_time * 1000:9.1f} ms'
+                f'  child overriding {name:<10} {child_time * 1e6:9.1f} us'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+import inspect
+import os
+import tempfile
+import time
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+import yaml
+from pydantic import BaseModel
+
+from foxhound.configuration.binder import ConfigurationBinder
+from foxhound.configuration.configuration_reader import ConfigurationReader
+from foxhound.core.utils.typing import simplify_arguments
+
+_SERVICES: int = 2_000
+_SETTINGS_PER_SERVICE: int = 40
+_LOOKUPS: int = 100_000
+_BINDINGS: int = 50_000
+
+
+class _Credentials(BaseModel):
+    user: str
+    password: str
+
+
+class _Pool(BaseModel):
+    size: int
+    timeout: float
+    credentials: _Credentials
+
+
+class _ServiceSettings:
+    def __init__(self, host: str, port: int, tls: bool, ratio: float, name: str, retries: int, pool: _Pool):
+        pass
+
+
+_SERVICE_SECTION: dict[str, Any] = {
+    'host': 'host-1.internal',
+    'port': 8001,
+    'tls': True,
+    'ratio': 0.25,
+    'name': 'service',
+    'retries': '3',
+    'pool': {'size': 8, 'timeout': 2.5, 'credentials': {'user': 'snake', 'password': 'la-li-lu-le-lo'}},
+    'unrelated': 'ignored',
+}
+
+
+def _generate_configuration(path: str) -> list[str]:
+    configuration: dict = {
+        'services': {
+            f'service_{index}': {
+                'connection': {'host': f'host-{index}.internal', 'port': 8000 + index, 'tls': index % 2 == 0},
+                'settings': {f'setting_{key}': f'value {index}/{key}' for key in range(_SETTINGS_PER_SERVICE)},
+            }
+            for index in range(_SERVICES)
+        }
+    }
+
+    with open(path, 'w') as f:
+        yaml.dump(configuration, f, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper))
+
+    return [f'services.service_{index}.connection' for index in range(0, _SERVICES, 7)]
+
+
+def _walk(configuration: dict, section: str) -> dict:
+    # The section lookup ConfigurationReader used to run on every read
+    target_section: dict = configuration
+
+    for next_section in section.split('.'):
+        target_section = target_section[next_section]
+
+    return target_section
+
+
+def _parse_parameters(target: Any, configuration_section: dict) -> dict[str, Any]:
+    # The binding every configuration inflation used to run
+    parameter_types: dict[str, type[Any]] = simplify_arguments(inspect.signature(target))
+    parsed_parameters: dict[str, Any] = {}
+
+    for key, value in configuration_section.items():
+        if key not in parameter_types:
+            continue
+
+        _type: type[Any] = parameter_types[key]
+
+        if issubclass(_type, BaseModel):
+            parsed_parameters[key] = _type.model_validate(value)
+        else:
+            parsed_parameters[key] = _type(value)
+
+    return parsed_parameters
+
+
+def _time(run: Callable[[], Any]) -> float:
+    started: float = time.perf_counter()
+    run()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        path: str = os.path.join(root, 'application.yaml')
+        sections: list[str] = _generate_configuration(path)
+        os.environ['FOXHOUND_CONFIGURATION_PATH'] = path
+
+        print(f'{os.path.getsize(path) / 2 ** 20:.1f} MiB configuration file')
+
+        with open(path, 'rb') as f:
+            source: bytes = f.read()
+
+        print(f'  yaml.safe_load:         {_time(lambda: yaml.safe_load(source)) * 1000:8.1f} ms')
+
+        reader: ConfigurationReader = ConfigurationReader()
+        print(f'  ConfigurationReader:    {_time(lambda: reader.read(None)) * 1000:8.1f} ms (load and index)')
+
+        os.environ['FOXHOUND_CONFIGURATION_SNAPSHOT_DIR'] = os.path.join(root, 'snapshots')
+        ConfigurationReader().read(None)
+        print(f'  snapshot load:          {_time(lambda: ConfigurationReader().read(None)) * 1000:8.1f} ms (load and index)')
+        del os.environ['FOXHOUND_CONFIGURATION_SNAPSHOT_DIR']
+
+        configuration: dict = reader.read(None)
+        walk: float = timeit.timeit(
+            lambda: [_walk(configuration, section) for section in sections],
+            number=_LOOKUPS // len(sections)
+        )
+        indexed: float = timeit.timeit(
+            lambda: [reader.read(section) for section in sections],
+            number=_LOOKUPS // len(sections)
+        )
+
+        print(f'  section walk:           {walk / _LOOKUPS * 1e9:8.1f} ns/lookup')
+        print(f'  indexed read:           {indexed / _LOOKUPS * 1e9:8.1f} ns/lookup')
+
+    binder: ConfigurationBinder = ConfigurationBinder(_ServiceSettings)
+    assert binder.bind(_SERVICE_SECTION).keys() == _parse_parameters(_ServiceSettings, _SERVICE_SECTION).keys()
+
+    introspected: float = timeit.timeit(
+        lambda: _parse_parameters(_ServiceSettings, _SERVICE_SECTION),
+        number=_BINDINGS
+    )
+    compiled: float = timeit.timeit(lambda: binder.bind(_SERVICE_SECTION), number=_BINDINGS)
+
+    print(f'  introspected binding:   {introspected / _BINDINGS * 1e6:8.2f} us/section')
+    print(f'  compiled binding:       {compiled / _BINDINGS * 1e6:8.2f} us/section')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+import timeit
+
+from foxhound.core.di.context import component_context
+from foxhound.core.di.proxies import ContextProxy
+
+_LOOKUPS: int = 1_000_000
+
+
+class UnitOfWork:
+    def __init__(self) -> None:
+        self.session = object()
+
+
+def main() -> None:
+    proxy: ContextProxy = ContextProxy(UnitOfWork, 'unit_of_work', UnitOfWork)
+    plain: dict[str, UnitOfWork] = {'unit_of_work': UnitOfWork()}
+
+    with component_context():
+        proxied: float = timeit.timeit(lambda: proxy.session, number=_LOOKUPS)
+
+    direct: float = timeit.timeit(lambda: plain['unit_of_work'].session, number=_LOOKUPS)
+
+    print(f'context-scoped attribute lookup x{_LOOKUPS}')
+    print(f'  plain dict:    {direct * 1e9 / _LOOKUPS:6.1f} ns/lookup')
+    print(f'  context proxy: {proxied * 1e9 / _LOOKUPS:6.1f} ns/lookup ({proxied / direct:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
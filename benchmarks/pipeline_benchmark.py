@@ -0,0 +1,356 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections.abc import Callable
+
+# python -m benchmarks.pipeline_benchmark --output results.json
+# python -m benchmarks.pipeline_benchmark --baseline results.json  (exits with 1 on regressions)
+
+# Every component is generated as (name, source, referenced names) - references are imported from wherever
+# the generator placed them, so dependencies freely cross module boundaries like they do in real packages
+ComponentSource = tuple[str, str, list[str]]
+
+SHAPES: tuple[str, ...] = ('chain', 'fan_out', 'diamond', 'multi', 'qualified', 'generic')
+SIZES: tuple[int, ...] = (10, 100, 1_000, 10_000, 50_000)
+PHASES: tuple[str, ...] = ('scan', 'map', 'resolve', 'inflate')
+
+_COMPONENTS_PER_MODULE: int = 500
+_DIAMOND_WIDTH: int = 8
+_MULTI_GROUP_SIZE: int = 10
+_PACKAGE: str = 'synthetic_pipeline'
+_REPOSITORY_ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_BASE_MODULE: str = '''from typing import Generic, TypeVar
+
+from foxhound import component
+
+T = TypeVar('T')
+
+
+class Value:
+    pass
+
+
+class Repository(Generic[T]):
+    pass
+'''
+
+_PROBE: str = '''
+import json, sys, time, tracemalloc
+from foxhound import StartupTracer
+from foxhound.core.di.component_scanner import ComponentScanner
+from foxhound.core.di.container import Container
+from foxhound.core.di.dependency_resolver import DependencyResolver
+from foxhound.core.di.graph.inflator import DependencyGraphInflator
+from foxhound.core.di.graph.mapper import DependencyGraphMapper
+
+trace_memory = {trace_memory!r}
+results = {{}}
+
+def phase(name, run):
+    if trace_memory:
+        tracemalloc.reset_peak()
+    started = time.perf_counter_ns()
+    value = run()
+    results[name] = {{'time': (time.perf_counter_ns() - started) / 1e6}}
+    if trace_memory:
+        results[name]['peak'] = tracemalloc.get_traced_memory()[1]
+    return value
+
+if trace_memory:
+    tracemalloc.start()
+
+try:
+    definitions = phase('scan', lambda: ComponentScanner().scan({{{package!r}}}))
+    tracer = StartupTracer()
+    mapping = phase('map', lambda: DependencyGraphMapper(DependencyResolver(), tracer).map(definitions))
+    results['resolve'] = {{
+        'time': sum(span.duration for span in tracer.spans() if span.name == 'map.resolve') / 1e6
+    }}
+    if not mapping.successful:
+        raise mapping.exception
+    phase('inflate', lambda: DependencyGraphInflator().inflate(mapping.value, Container()))
+except BaseException as e:
+    results['error'] = f'{{type(e).__name__}}: {{str(e)[:200]}}'
+
+print(json.dumps(results))
+'''
+
+
+def _chain(size: int) -> list[ComponentSource]:
+    return [
+        (
+            f'Chain{index}',
+            f'@component()\nclass Chain{index}:\n'
+            + (f'    def __init__(self, previous: Chain{index - 1}):\n        self.previous = previous\n'
+               if index > 0 else '    pass\n'),
+            [] if index == 0 else [f'Chain{index - 1}']
+        )
+        for index in range(size)
+    ]
+
+
+def _fan_out(size: int) -> list[ComponentSource]:
+    hub: ComponentSource = ('Hub', '@component()\nclass Hub:\n    pass\n', [])
+
+    return [hub] + [
+        (
+            f'Spoke{index}',
+            f'@component()\nclass Spoke{index}:\n    def __init__(self, hub: Hub):\n        self.hub = hub\n',
+            ['Hub']
+        )
+        for index in range(1, size)
+    ]
+
+
+def _diamond(size: int) -> list[ComponentSource]:
+    # Layers of _DIAMOND_WIDTH components, each depending on the whole previous layer
+    components: list[ComponentSource] = []
+
+    for index in range(size):
+        layer_start: int = (index // _DIAMOND_WIDTH - 1) * _DIAMOND_WIDTH
+        dependencies: list[str] = [] if layer_start < 0 else [
+            f'Mesh{layer_start + offset}' for offset in range(_DIAMOND_WIDTH)
+        ]
+        parameters: str = ''.join(f', d{offset}: {name}' for offset, name in enumerate(dependencies))
+        components.append((
+            f'Mesh{index}',
+            f'@component()\nclass Mesh{index}:\n    def __init__(self{parameters}):\n        pass\n',
+            dependencies
+        ))
+
+    return components
+
+
+def _multi(size: int) -> list[ComponentSource]:
+    # Groups of plugins implementing a common base, each group collected by a registry via list[T]
+    components: list[ComponentSource] = []
+
+    for index in range(size):
+        group: int = index // _MULTI_GROUP_SIZE
+
+        if index % _MULTI_GROUP_SIZE == 0:
+            components.append((f'Plugin{group}', f'class Plugin{group}:\n    pass\n', []))
+            components.append((
+                f'Registry{group}',
+                f'@component()\nclass Registry{group}:\n'
+                f'    def __init__(self, plugins: list[Plugin{group}]):\n        self.plugins = plugins\n',
+                [f'Plugin{group}']
+            ))
+        else:
+            components.append((
+                f'Plugin{group}Impl{index}',
+                f'@component()\nclass Plugin{group}Impl{index}(Plugin{group}):\n    pass\n',
+                [f'Plugin{group}']
+            ))
+
+    return components
+
+
+def _qualified(size: int) -> list[ComponentSource]:
+    # Every component has the same kind, so each parameter can only be resolved by its qualifier
+    return [
+        (
+            f'value{index}',
+            f'@component(qualifier="value{index}")\ndef value{index}() -> Value:\n    return Value()\n'
+            if index == 0 else
+            f'@component(qualifier="value{index}", param_qualifiers={{"previous": "value{index - 1}"}})\n'
+            f'def value{index}(previous: Value) -> Value:\n    return Value()\n',
+            ['Value']
+        )
+        for index in range(size)
+    ]
+
+
+def _generic(size: int) -> list[ComponentSource]:
+    # Entity/repository/service triples - repositories are registered as Repository[Entity] by their factories
+    components: list[ComponentSource] = []
+
+    for index in range(0, size, 2):
+        components.append((f'Entity{index}', f'class Entity{index}:\n    pass\n', []))
+        components.append((
+            f'entity_repository{index}',
+            f'@component()\ndef entity_repository{index}() -> Repository[Entity{index}]:\n    return Repository()\n',
+            ['Repository', f'Entity{index}']
+        ))
+
+        if index + 1 < size:
+            components.append((
+                f'EntityService{index}',
+                f'@component()\nclass EntityService{index}:\n'
+                f'    def __init__(self, repository: Repository[Entity{index}]):\n'
+                f'        self.repository = repository\n',
+                ['Repository', f'Entity{index}']
+            ))
+
+    return components
+
+
+_GENERATORS: dict[str, Callable[[int], list[ComponentSource]]] = {
+    'chain': _chain,
+    'fan_out': _fan_out,
+    'diamond': _diamond,
+    'multi': _multi,
+    'qualified': _qualified,
+    'generic': _generic,
+}
+
+
+def generate_package(root: str, shape: str, size: int) -> str:
+    package: str = f'{_PACKAGE}_{shape}_{size}'
+    directory: str = os.path.join(root, package)
+    os.makedirs(directory)
+    components: list[ComponentSource] = _GENERATORS[shape](size)
+    locations: dict[str, str] = {}
+
+    with open(os.path.join(directory, '__init__.py'), 'w'):
+        pass
+
+    with open(os.path.join(directory, 'base.py'), 'w') as f:
+        f.write(_BASE_MODULE)
+
+    for start in range(0, len(components), _COMPONENTS_PER_MODULE):
+        module: str = f'module_{start // _COMPONENTS_PER_MODULE}'
+        chunk: list[ComponentSource] = components[start:start + _COMPONENTS_PER_MODULE]
+        imports: dict[str, set[str]] = {}
+
+        for name, _, _ in chunk:
+            locations[name] = module
+
+        for _, _, references in chunk:
+            for reference in references:
+                imported_from: str = locations.get(reference, 'base')
+
+                if imported_from != module:
+                    imports.setdefault(imported_from, set()).add(reference)
+
+        with open(os.path.join(directory, f'{module}.py'), 'w') as f:
+            f.write('from foxhound import component\n')
+
+            for imported_from, names in sorted(imports.items()):
+                f.write(f'from {package}.{imported_from} import {", ".join(sorted(names))}\n')
+
+            f.write('\n\n')
+            f.write('\n\n'.join(source for _, source, _ in chunk))
+
+    return package
+
+
+def _probe(root: str, package: str, trace_memory: bool) -> dict[str, dict[str, float] | str]:
+    # Each measurement runs in a fresh interpreter, so imports and type caches start cold
+    output: str = subprocess.check_output(
+        [sys.executable, '-c', _PROBE.format(package=package, trace_memory=trace_memory)],
+        env={
+            **os.environ,
+            'PYTHONDONTWRITEBYTECODE': '1',
+            'PYTHONPATH': os.pathsep.join([root, _REPOSITORY_ROOT]),
+        },
+        text=True
+    )
+    measurements: dict[str, dict[str, float] | str] = json.loads(output)
+    return measurements
+
+
+def run(shapes: list[str], sizes: list[int]) -> dict[str, dict]:
+    results: dict[str, dict] = {}
+
+    with tempfile.TemporaryDirectory() as root:
+        for shape in shapes:
+            for size in sizes:
+                package: str = generate_package(root, shape, size)
+                timed: dict = _probe(root, package, trace_memory=False)
+                traced: dict = _probe(root, package, trace_memory=True)
+                result: dict = {}
+
+                if 'error' in timed or 'error' in traced:
+                    result['error'] = timed.get('error') or traced.get('error')
+
+                for phase in PHASES:
+                    if phase in timed:
+                        result[f'{phase}_ms'] = round(timed[phase]['time'], 3)
+                    if 'peak' in traced.get(phase, {}):
+                        result[f'{phase}_peak_mib'] = round(traced[phase]['peak'] / 2 ** 20, 3)
+
+                results[f'{shape}/{size}'] = result
+                print(f'{shape + "/" + str(size):<18} {_format(result)}', file=sys.stderr)
+
+    return results
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float, floor: float) -> list[str]:
+    # A metric regresses when it exceeds its baseline by more than the tolerance ratio and the absolute floor,
+    # so noise in sub-millisecond measurements doesn't fail the run
+    regressions: list[str] = []
+
+    for case, metrics in results.items():
+        expected: dict = baseline.get(case, {})
+
+        if 'error' in metrics and 'error' not in expected:
+            regressions.append(f'{case}: {metrics["error"]}')
+
+        for metric, value in metrics.items():
+            reference: float | None = expected.get(metric)
+
+            if metric == 'error' or not isinstance(reference, (int, float)):
+                continue
+
+            if value > reference * tolerance and value - reference > floor:
+                regressions.append(f'{case} {metric}: {value} (baseline {reference}, x{value / reference:.2f})')
+
+    return regressions
+
+
+def _format(result: dict) -> str:
+    if 'error' in result:
+        return f'error: {result["error"]}'
+
+    return '  '.join(
+        f'{phase} {result[f"{phase}_ms"]:.1f} ms'
+        + (f' ({result[f"{phase}_peak_mib"]:.1f} MiB)' if f'{phase}_peak_mib' in result else '')
+        for phase in PHASES
+    )
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Times scanning, mapping, resolution and inflation of synthetic component graphs'
+    )
+    parser.add_argument('--shapes', nargs='+', choices=SHAPES, default=list(SHAPES))
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(SIZES))
+    parser.add_argument('--output', help='write the results as JSON to this path')
+    parser.add_argument('--baseline', help='results JSON of a previous run to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=1.25, help='allowed ratio over the baseline')
+    parser.add_argument('--floor', type=float, default=1.0, help='ignored absolute increase (ms or MiB)')
+    arguments: argparse.Namespace = parser.parse_args()
+
+    cases: dict[str, dict] = run(arguments.shapes, arguments.sizes)
+    results: dict[str, str | dict[str, dict]] = {
+        'python': '.'.join(map(str, sys.version_info[:3])),
+        'cases': cases,
+    }
+    serialized: str = json.dumps(results, indent=2)
+
+    if arguments.output is None:
+        print(serialized)
+    else:
+        with open(arguments.output, 'w') as f:
+            f.write(serialized)
+
+    if arguments.baseline is not None:
+        with open(arguments.baseline) as f:
+            baseline: dict = json.load(f)
+
+        regressions: list[str] = compare(cases, baseline['cases'], arguments.tolerance, arguments.floor)
+
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+
+        if len(regressions) != 0:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+_MODULES: int = 400
+_COMPONENT_EVERY: int = 20
+
+_PROBE: str = '''
+import sys, time, tracemalloc
+sys.path.insert(0, {root!r})
+from foxhound.core.di.component_scanner import ComponentScanner
+from foxhound.core.di.module_index import ModuleIndex
+
+tracemalloc.start()
+started = time.perf_counter()
+definitions = ComponentScanner({module_index}).scan({{'synthetic_app'}})
+elapsed = time.perf_counter() - started
+print(len(definitions), elapsed, tracemalloc.get_traced_memory()[1])
+'''
+
+
+def _generate_package(root: str) -> None:
+    package: str = os.path.join(root, 'synthetic_app')
+    os.makedirs(package)
+
+    with open(os.path.join(package, '__init__.py'), 'w'):
+        pass
+
+    for index in range(_MODULES):
+        with open(os.path.join(package, f'module_{index}.py'), 'w') as f:
+            if index % _COMPONENT_EVERY == 0:
+                f.write(
+                    'from foxhound import component\n\n\n'
+                    f'@component()\nclass Service{index}:\n    pass\n'
+                )
+            else:
+                # Stands in for test helpers and modules with heavy optional dependencies
+                f.write(f'TABLE_{index} = [list(range(200)) for _ in range(200)]\n')
+
+
+def _probe(root: str, module_index: str) -> tuple[int, float, int]:
+    output: str = subprocess.check_output(
+        [sys.executable, '-c', _PROBE.format(root=root, module_index=module_index)],
+        env={**os.environ, 'PYTHONDONTWRITEBYTECODE': '1'},
+        text=True
+    )
+    definitions, elapsed, peak = output.split()
+    return int(definitions), float(elapsed), int(peak)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        _generate_package(root)
+        index_path: str = os.path.join(root, 'module_index.json')
+
+        strategies: dict[str, str] = {
+            'import everything': '',
+            'static (cold index)': f'ModuleIndex({index_path!r})',
+            'static (warm index)': f'ModuleIndex({index_path!r})',
+        }
+
+        print(f'{_MODULES} modules, {_MODULES // _COMPONENT_EVERY} with components')
+
+        for name, module_index in strategies.items():
+            definitions, elapsed, peak = _probe(root, module_index)
+            print(f'  {name:<20} {elapsed * 1000:8.1f} ms  {peak / 2 ** 20:8.1f} MiB peak  ({definitions} definitions)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+import inspect
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from types import ModuleType
+
+from foxhound import define_component, start
+from foxhound.core.di.api import embed_definition
+
+_COMPONENTS: int = 5_000
+_LAYER_WIDTH: int = 100
+_FAN_IN: int = 3
+
+
+def _build_module(size: int) -> ModuleType:
+    # Components are laid out in layers, each depending on _FAN_IN components of the previous layer
+    module: ModuleType = ModuleType('synthetic_components')
+    kinds: list[type] = []
+
+    for index in range(size):
+        kind: type = type(f'Component{index}', (), {})
+        layer_start: int = (index // _LAYER_WIDTH - 1) * _LAYER_WIDTH
+        dependencies: list[type] = [] if layer_start < 0 else [
+            kinds[layer_start + (index + offset * 7) % _LAYER_WIDTH] for offset in range(_FAN_IN)
+        ]
+
+        factory: Callable[..., object] = _factory(kind, dependencies)
+        embed_definition(factory, define_component(factory))
+        setattr(module, factory.__name__, factory)
+        kinds.append(kind)
+
+    sys.modules[module.__name__] = module
+    return module
+
+
+def _factory(kind: type, dependencies: list[type]) -> Callable[..., object]:
+    def factory(**_: object) -> object:
+        return kind()
+
+    factory.__name__ = f'make_{kind.__name__}'
+    factory.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        [
+            inspect.Parameter(f'dependency_{index}', inspect.Parameter.KEYWORD_ONLY, annotation=dependency)
+            for index, dependency in enumerate(dependencies)
+        ],
+        return_annotation=kind
+    )
+    return factory
+
+
+def main() -> None:
+    module: ModuleType = _build_module(_COMPONENTS)
+
+    started: float = time.perf_counter()
+    start(module)
+    elapsed: float = time.perf_counter() - started
+
+    tracemalloc.start()
+    container: object = start(module)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+
+    print(f'start() with {_COMPONENTS} components (layers of {_LAYER_WIDTH}, fan-in {_FAN_IN})')
+    print(f'  wall time:           {elapsed * 1000:8.1f} ms')
+    print(f'  peak traced memory:  {peak / 2 ** 20:8.1f} MiB')
+    print(f'  retained container:  {current / 2 ** 20:8.1f} MiB')
+
+
+if __name__ == '__main__':
+    main()
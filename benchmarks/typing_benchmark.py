@@ -0,0 +1,52 @@
+import timeit
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+from foxhound.core.utils import typing as foxhound_typing
+
+T = TypeVar('T')
+
+_ROUNDS: int = 20_000
+
+
+class Repository(Generic[T]):
+    pass
+
+
+class User:
+    pass
+
+
+class Admin(User):
+    pass
+
+
+_PAIRS: list[tuple[object, object]] = [
+    (list[Repository[User]], list[Repository[User]]),
+    (list[Repository[Admin]], list[Repository[User]]),
+    (dict[str, Repository[User]], dict[str, Repository[User]]),
+    (Repository[User], Repository[User]),
+    (Admin, User),
+    (User, Repository[User]),
+]
+
+
+def _run_pairs(check: Callable[[Any, Any], bool]) -> None:
+    for candidate, requested in _PAIRS:
+        check(candidate, requested)
+
+
+def main() -> None:
+    uncached: float = timeit.timeit(lambda: _run_pairs(foxhound_typing._is_assignable_to), number=_ROUNDS)
+
+    foxhound_typing.clear_type_caches()
+    cached: float = timeit.timeit(lambda: _run_pairs(foxhound_typing.is_assignable_to), number=_ROUNDS)
+
+    checks: int = _ROUNDS * len(_PAIRS)
+    print(f'is_assignable_to x{checks}')
+    print(f'  uncached: {uncached * 1e9 / checks:8.1f} ns/check')
+    print(f'  cached:   {cached * 1e9 / checks:8.1f} ns/check ({uncached / cached:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
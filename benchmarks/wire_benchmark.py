@@ -0,0 +1,48 @@
+import timeit
+from types import ModuleType
+
+from foxhound import Container, define_component, start, wire
+from foxhound.core.di.api import embed_definition
+
+_CALLS: int = 1_000_000
+
+
+class Repository:
+    pass
+
+
+class Service:
+    def __init__(self, repository: Repository):
+        self.repository = repository
+
+
+def handle(service: Service, request_id: int = 0) -> int:
+    return request_id
+
+
+wired_handle = wire()(handle)
+
+
+def main() -> None:
+    module: ModuleType = ModuleType('wire_benchmark_components')
+
+    for target in (Repository, Service):
+        embed_definition(target, define_component(target))
+        setattr(module, target.__name__, target)
+
+    container: Container = start(module)
+    service: Service = container.get(Service)
+    wired_handle()
+
+    bare: float = timeit.timeit(lambda: handle(service), number=_CALLS)
+    wired: float = timeit.timeit(lambda: wired_handle(), number=_CALLS)
+    lookup: float = timeit.timeit(lambda: handle(container.get(Service)), number=_CALLS)
+
+    print(f'handler call x{_CALLS}')
+    print(f'  bare call:             {bare * 1e9 / _CALLS:6.1f} ns/call')
+    print(f'  @wire:                 {wired * 1e9 / _CALLS:6.1f} ns/call')
+    print(f'  inline container.get:  {lookup * 1e9 / _CALLS:6.1f} ns/call')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,9 +2,28 @@
 Foxhound - A lightweight dependency injection framework for Python.
 """
 
-from foxhound.core.di.api import component, define_component, start
+from foxhound.core.di.api import component, define_component, start, start_async
+from foxhound.core.di.child import child_container, child_container_async
 from foxhound.core.di.container import Container
-from foxhound.core.di.models import Component, ComponentDefinition, ComponentMetadata
+from foxhound.core.di.context import component_context
+from foxhound.core.di.lifecycle import shutdown, shutdown_async
+from foxhound.core.di.memory import memory_usage
+from foxhound.core.di.models import (
+    Component,
+    ComponentDefinition,
+    ComponentMetadata,
+    EvictionSettings,
+    EvictionStatistics,
+    MemoryUsage,
+    PoolSettings,
+    PoolStatistics,
+    Scope,
+    TraceSpan,
+)
+from foxhound.core.di.proxies import Lazy
+from foxhound.core.di.reload import reload, reload_async
+from foxhound.core.di.tracing import StartupTracer
+from foxhound.core.di.wire import wire
 from foxhound.core.models import Result
 
 __version__ = '0.2.0'
@@ -13,9 +32,28 @@ __all__ = [
     'component',
     'define_component',
     'start',
+    'start_async',
+    'reload',
+    'reload_async',
+    'child_container',
+    'child_container_async',
+    'shutdown',
+    'shutdown_async',
+    'memory_usage',
+    'component_context',
+    'wire',
     'Component',
     'ComponentDefinition',
     'ComponentMetadata',
+    'EvictionSettings',
+    'EvictionStatistics',
+    'MemoryUsage',
+    'PoolSettings',
+    'PoolStatistics',
+    'Scope',
+    'StartupTracer',
+    'TraceSpan',
     'Container',
+    'Lazy',
     'Result',
 ]
@@ -1,7 +1,10 @@
 from foxhound.configuration.api import configuration
 from foxhound.configuration.configuration_reader import ConfigurationReader
+from foxhound.configuration.watcher import ConfigurationWatcher, watch_configuration
 
 __all__ = [
     'configuration',
-    'ConfigurationReader'
+    'ConfigurationReader',
+    'ConfigurationWatcher',
+    'watch_configuration'
 ]
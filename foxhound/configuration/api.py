@@ -1,30 +1,23 @@
-import inspect
 from collections.abc import Callable
-from typing import Any, TypeVar
-
-from pydantic import BaseModel
+from typing import Any, Generic, TypeVar
 
 from foxhound import ComponentDefinition, define_component
-from foxhound.configuration.configuration_reader import ConfigurationReader, ConfigurationSection
+from foxhound.configuration.binder import ConfigurationBinder
+from foxhound.configuration.configuration_reader import ConfigurationReader
 from foxhound.core.di.api import embed_definition
-from foxhound.core.utils.typing import simplify_arguments
 
 T = TypeVar('T')
+C = TypeVar('C', bound=Callable[..., Any])
 
 def configuration(
         section: str | None = None,
         qualifier: str | None = None,
-        primary: bool = False
-) -> type[T] | Callable[..., T]:
-    def decorator(target: type[T] | Callable[..., T]) -> type[T] | Callable[..., T]:
-        def inflator(reader: ConfigurationReader) -> T:
-            try:
-                return target(**_parse_parameters(target, reader.read(section)))
-            except TypeError as e:
-                raise TypeError(f'Cannot load {target} from configuration at section "{section}"') from e
-
-        component_definition: ComponentDefinition[T] = define_component(target, qualifier, primary)
-        component_definition.inflator = inflator
+        primary: bool = False,
+        lazy: bool = False
+) -> Callable[[C], C]:
+    def decorator(target: C) -> C:
+        component_definition: ComponentDefinition[Any] = define_component(target, qualifier, primary, lazy=lazy)
+        component_definition.inflator = ConfigurationInflator(target, section)
 
         embed_definition(target, component_definition)
 
@@ -33,28 +26,18 @@ def configuration(
     return decorator
 
 
-def _parse_parameters(
-        target: type[T] | Callable[..., T],
-        configuration_section: ConfigurationSection
-) -> dict[str, Any]:
-    parameter_types: dict[str, type[Any]] = simplify_arguments(inspect.signature(target))
-    parsed_parameters: dict[str, Any] = {}
-
-    for key, value in configuration_section.items():
-        if key not in parameter_types:
-            continue
+class ConfigurationInflator(Generic[T]):
+    target: type[T] | Callable[..., T]
+    section: str | None
+    binder: ConfigurationBinder
 
-        _type: type[Any] = parameter_types[key]
+    def __init__(self, target: type[T] | Callable[..., T], section: str | None):
+        self.target = target
+        self.section = section
+        self.binder = ConfigurationBinder(target)
 
+    def __call__(self, reader: ConfigurationReader) -> T:
         try:
-            if issubclass(_type, BaseModel):
-                parsed_parameters[key] = _type.model_validate(value)
-            else:
-                parsed_parameters[key] = _type(value)
-        except ValueError as e:
-            raise TypeError(
-                f'Cannot parse parameter "{key}" of {target} '
-                f'from configuration value "{value}"'
-            ) from e
-
-    return parsed_parameters
+            return self.target(**self.binder.bind(reader.read(self.section)))
+        except TypeError as e:
+            raise TypeError(f'Cannot load {self.target} from configuration at section "{self.section}"') from e
@@ -0,0 +1,87 @@
+import inspect
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+from foxhound.configuration.configuration_reader import ConfigurationSection
+from foxhound.core.utils.typing import simplify_arguments
+
+Coercion = Callable[[Any], Any]
+
+# Calling these on a value of the very same type returns an equal immutable value, so the call is skipped
+_IMMUTABLE_PRIMITIVES: tuple[type, ...] = (str, int, float, bool, bytes)
+_TYPE_ADAPTER_CACHE_SIZE: int = 1024
+
+
+class ConfigurationBinder:
+    target: type[Any] | Callable[..., Any]
+    _coercions: tuple[tuple[str, Coercion], ...]
+
+    def __init__(self, target: type[Any] | Callable[..., Any]):
+        self.target = target
+        self._coercions = tuple(
+            (name, _compile_coercion(kind))
+            for name, kind in simplify_arguments(inspect.signature(target)).items()
+        )
+
+    def bind(self, configuration_section: ConfigurationSection) -> dict[str, Any]:
+        arguments: dict[str, Any] = {}
+
+        for name, coerce in self._coercions:
+            if name not in configuration_section:
+                continue
+
+            value: Any = configuration_section[name]
+
+            try:
+                arguments[name] = coerce(value)
+            except ValueError as e:
+                raise TypeError(
+                    f'Cannot parse parameter "{name}" of {self.target} '
+                    f'from configuration value "{value}"'
+                ) from e
+
+        return arguments
+
+
+def _compile_coercion(kind: Any) -> Coercion:
+    if isinstance(kind, type):
+        if issubclass(kind, BaseModel):
+            return kind.model_validate
+
+        if kind in _IMMUTABLE_PRIMITIVES:
+            return _primitive_coercion(kind)
+
+        return kind
+
+    if get_origin(kind) is not None:
+        return _type_adapter(kind).validate_python
+
+    return _unsupported_coercion(kind)
+
+
+def _primitive_coercion(kind: type) -> Coercion:
+    def coerce(value: Any) -> Any:
+        return value if type(value) is kind else kind(value)
+
+    return coerce
+
+
+def _unsupported_coercion(kind: Any) -> Coercion:
+    def coerce(value: Any) -> Any:
+        raise TypeError(f'Configuration parameters cannot be annotated as {kind!r}')
+
+    return coerce
+
+
+def _type_adapter(kind: Any) -> TypeAdapter:
+    try:
+        return _cached_type_adapter(kind)
+    except TypeError:
+        # Unhashable annotations cannot be memoized
+        return TypeAdapter(kind)
+
+
+_cached_type_adapter = lru_cache(maxsize=_TYPE_ADAPTER_CACHE_SIZE)(TypeAdapter)
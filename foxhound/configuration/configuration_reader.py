@@ -1,45 +1,86 @@
 import os
 from functools import cached_property
-from typing import Union
+from typing import Any, Union
 
 import yaml
 
 from foxhound import component
+from foxhound.configuration.snapshot import ConfigurationSnapshot
 
 _CONFIGURATION_PATH_ENV_VAR = 'FOXHOUND_CONFIGURATION_PATH'
 _DEFAULT_CONFIGURATION_PATH = 'application.yaml'
+_SNAPSHOT_DIRECTORY_ENV_VAR = 'FOXHOUND_CONFIGURATION_SNAPSHOT_DIR'
 
 ConfigurationSection = dict[str, Union[str, 'ConfigurationSection']]
 
+# libyaml's loader is an order of magnitude faster, but PyYAML may be built without it
+_YamlLoader: type = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 @component()
 class ConfigurationReader:
     @cached_property
-    def _configuration(self) -> ConfigurationSection:
-        if _CONFIGURATION_PATH_ENV_VAR in os.environ:
-            configuration_path: str = os.environ[_CONFIGURATION_PATH_ENV_VAR]
-        else:
-            configuration_path: str = _DEFAULT_CONFIGURATION_PATH
+    def path(self) -> str:
+        return os.environ.get(_CONFIGURATION_PATH_ENV_VAR, _DEFAULT_CONFIGURATION_PATH)
 
-        if not os.path.exists(configuration_path):
+    @cached_property
+    def _configuration(self) -> ConfigurationSection:
+        if not os.path.exists(self.path):
             raise FileNotFoundError(
-                f'Cannot load configuration file from "{configuration_path}". '
+                f'Cannot load configuration file from "{self.path}". '
                 f'Consider changing {_CONFIGURATION_PATH_ENV_VAR}'
             )
 
-        with open(configuration_path) as f:
-            loaded_configuration: ConfigurationSection = yaml.safe_load(f)
+        snapshot_directory: str | None = os.environ.get(_SNAPSHOT_DIRECTORY_ENV_VAR)
+        snapshot: ConfigurationSnapshot | None = None
+
+        if snapshot_directory:
+            snapshot = ConfigurationSnapshot(snapshot_directory)
+            snapshot_configuration: ConfigurationSection | None = snapshot.load(self.path)
+
+            if snapshot_configuration is not None:
+                return snapshot_configuration
+
+        with open(self.path, 'rb') as f:
+            source: bytes = f.read()
+
+        loaded_configuration: ConfigurationSection = yaml.load(source, Loader=_YamlLoader)
+        configuration: ConfigurationSection = loaded_configuration if loaded_configuration else ConfigurationSection()
+
+        if snapshot is not None:
+            snapshot.save(self.path, source, configuration)
 
-        return loaded_configuration if loaded_configuration else ConfigurationSection()
+        return configuration
+
+    @cached_property
+    def _sections(self) -> dict[str | None, Any]:
+        return _index_sections(self._configuration)
 
     def read(self, section: str | None) -> ConfigurationSection:
-        sections_breakdown: list[str] = [] if section is None else section.split('.')
-        target_section: ConfigurationSection = self._configuration
+        try:
+            configuration_section: ConfigurationSection = self._sections[section]
+        except KeyError:
+            raise KeyError(f'Section "{section}" not found in configuration file') from None
+
+        return configuration_section
+
+
+def _index_sections(configuration: ConfigurationSection) -> dict[str | None, Any]:
+    sections: dict[str | None, Any] = {None: configuration}
+    pending: list[tuple[str, ConfigurationSection]] = [('', configuration)]
+
+    while len(pending) != 0:
+        prefix, section = pending.pop()
+
+        for key, value in section.items():
+            # Keys containing dots cannot be addressed by a dotted path
+            if not isinstance(key, str) or '.' in key:
+                continue
+
+            path: str = prefix + key
+            sections[path] = value
 
-        for next_section in sections_breakdown:
-            if next_section in target_section:
-                target_section = target_section[next_section]
-            else:
-                raise KeyError(f'Section "{section}" not found in configuration file')
+            if isinstance(value, dict):
+                pending.append((f'{path}.', value))
 
-        return target_section
+    return sections
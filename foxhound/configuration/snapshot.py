@@ -0,0 +1,94 @@
+import contextlib
+import hashlib
+import json
+import os
+import pickle
+import struct
+import tempfile
+from typing import Any
+
+_SNAPSHOT_MAGIC: bytes = b'FOXHOUND-SNAPSHOT'
+_SNAPSHOT_FORMAT_VERSION: int = 2
+# Magic, format version and the size of the JSON header following it
+_SNAPSHOT_PREFIX: struct.Struct = struct.Struct(f'>{len(_SNAPSHOT_MAGIC)}sHI')
+
+
+class ConfigurationSnapshot:
+    _directory: str
+
+    def __init__(self, directory: str):
+        self._directory = directory
+
+    def load(self, source_path: str) -> Any | None:
+        try:
+            stat: os.stat_result = os.stat(source_path)
+
+            with open(self._snapshot_path(source_path), 'rb') as f:
+                prefix: bytes = f.read(_SNAPSHOT_PREFIX.size)
+
+                if len(prefix) != _SNAPSHOT_PREFIX.size:
+                    return None
+
+                magic, version, header_size = _SNAPSHOT_PREFIX.unpack(prefix)
+
+                # Nothing is unpickled from files foxhound didn't write in this format
+                if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_FORMAT_VERSION:
+                    return None
+
+                header: dict[str, Any] = json.loads(f.read(header_size))
+                payload: bytes = f.read()
+
+            if (
+                    header['path'] != os.path.abspath(source_path)
+                    or header['size'] != stat.st_size
+                    or header['payload_digest'] != _digest(payload)
+            ):
+                return None
+
+            if header['mtime'] != stat.st_mtime_ns:
+                # Touched or copied files keep their snapshot when the content is the same
+                with open(source_path, 'rb') as f:
+                    if header['source_digest'] != _digest(f.read()):
+                        return None
+
+                with contextlib.suppress(OSError):
+                    self._write(source_path, stat, header['source_digest'], payload)
+
+            return pickle.loads(payload)
+        except Exception:
+            return None
+
+    def save(self, source_path: str, source: bytes, configuration: Any) -> None:
+        try:
+            stat: os.stat_result = os.stat(source_path)
+            payload: bytes = pickle.dumps(configuration, protocol=pickle.HIGHEST_PROTOCOL)
+            self._write(source_path, stat, _digest(source), payload)
+        except (OSError, pickle.PicklingError, AttributeError, TypeError):
+            return
+
+    def _write(self, source_path: str, stat: os.stat_result, source_digest: str, payload: bytes) -> None:
+        header: dict[str, Any] = {
+            'path': os.path.abspath(source_path),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'source_digest': source_digest,
+            'payload_digest': _digest(payload),
+        }
+
+        encoded_header: bytes = json.dumps(header).encode()
+        os.makedirs(self._directory, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile('wb', dir=self._directory, delete=False) as f:
+            f.write(_SNAPSHOT_PREFIX.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_FORMAT_VERSION, len(encoded_header)))
+            f.write(encoded_header)
+            f.write(payload)
+
+        os.replace(f.name, self._snapshot_path(source_path))
+
+    def _snapshot_path(self, source_path: str) -> str:
+        name: str = hashlib.sha256(os.path.abspath(source_path).encode()).hexdigest()[:32]
+        return os.path.join(self._directory, f'{name}.snapshot')
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
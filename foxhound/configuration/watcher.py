@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from foxhound.configuration.api import ConfigurationInflator
+from foxhound.configuration.configuration_reader import ConfigurationReader
+from foxhound.core.di.container import Container
+from foxhound.core.di.graph.dependency_graph import DependencyGraph
+from foxhound.core.di.graph.inflator import DependencyGraphInflator, is_async_factory
+from foxhound.core.di.lifecycle import finalize_replaced
+from foxhound.core.di.models import Component, ComponentDefinition
+from foxhound.core.di.wire import invalidate_bindings
+
+_MISSING: Any = object()
+
+FileFingerprint = tuple[int, int, int]
+
+
+class ConfigurationWatcher:
+    _container: Container
+    _interval: float
+    _on_error: Callable[[Exception], None]
+    _loop: asyncio.AbstractEventLoop | None
+    _fingerprint: FileFingerprint | None
+    _stopped: threading.Event
+    _thread: threading.Thread | None
+    _lock: threading.Lock
+
+    def __init__(
+            self,
+            container: Container,
+            interval: float = 1.0,
+            on_error: Callable[[Exception], None] | None = None,
+            loop: asyncio.AbstractEventLoop | None = None
+    ):
+        self._container = container
+        self._interval = interval
+        self._on_error = _log_error if on_error is None else on_error
+        self._loop = _running_loop() if loop is None else loop
+        self._fingerprint = _fingerprint(container.get(ConfigurationReader).path)
+        self._stopped = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self) -> 'ConfigurationWatcher':
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._poll, name='foxhound-configuration-watcher', daemon=True)
+            self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def __enter__(self) -> 'ConfigurationWatcher':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def check(self) -> bool:
+        with self._lock:
+            reader: ConfigurationReader = self._container.get(ConfigurationReader)
+            fingerprint: FileFingerprint | None = _fingerprint(reader.path)
+
+            # A missing file is most likely being replaced
+            if fingerprint is None or fingerprint == self._fingerprint:
+                return False
+
+            reloaded: bool = self._reload(reader)
+            # Only once reloaded, so a failed reload is retried on the next check
+            self._fingerprint = fingerprint
+
+            return reloaded
+
+    def _poll(self) -> None:
+        while not self._stopped.wait(self._interval):
+            try:
+                self.check()
+            except Exception as e:
+                self._on_error(e)
+
+    def _reload(self, previous_reader: ConfigurationReader) -> bool:
+        container: Container = self._container
+        graph: DependencyGraph | None = container.graph
+
+        if graph is None:
+            raise RuntimeError('Only containers created by start() can be watched')
+
+        reader: ConfigurationReader = ConfigurationReader()
+
+        if reader.read(None) == previous_reader.read(None):
+            return False
+
+        reader_nodes: list[int] = [
+            node for node, definition in enumerate(graph.definitions)
+            if definition.metadata.kind is ConfigurationReader
+        ]
+        changed_nodes: set[int] = {
+            node for node, definition in enumerate(graph.definitions)
+            if isinstance(definition.inflator, ConfigurationInflator)
+            and _read(previous_reader, definition.inflator.section) != _read(reader, definition.inflator.section)
+        }
+        # Components taking the reader itself could read any section
+        dependents: list[list[int]] = graph.dependents()
+        changed_nodes.update(
+            dependent for node in reader_nodes for dependent in dependents[node]
+            if not isinstance(graph.definitions[dependent].inflator, ConfigurationInflator)
+        )
+
+        reader_components: list[Component[Any]] = [
+            Component(metadata=graph.definitions[node].metadata, value=reader) for node in reader_nodes
+        ]
+        dirty_nodes: set[int] = graph.with_dependents(changed_nodes) if len(changed_nodes) != 0 else set()
+        components: list[Component[Any]] = self._reinflate(graph, dirty_nodes, dict.fromkeys(reader_nodes, reader))
+
+        replaced_definitions: list[ComponentDefinition] = [
+            graph.definitions[node] for node in [*reader_nodes, *dirty_nodes]
+        ]
+        replaced_components: list[Component[Any]] = container.swap_components(
+            [definition.metadata.id for definition in replaced_definitions],
+            reader_components + components
+        )
+        invalidate_bindings(container)
+        finalize_replaced(container, graph, replaced_components)
+
+        return len(dirty_nodes) != 0
+
+    def _reinflate(
+            self,
+            graph: DependencyGraph,
+            nodes: set[int],
+            replaced_values: dict[int, Any]
+    ) -> list[Component[Any]]:
+        if not any(is_async_factory(graph.definitions[node].inflator) for node in nodes):
+            return DependencyGraphInflator().reinflate(graph, self._container, nodes, replaced_values)
+
+        loop: asyncio.AbstractEventLoop | None = self._loop
+
+        if loop is not None and loop.is_running() and _running_loop() is loop:
+            # Waiting for the loop on its own thread would never return
+            raise RuntimeError(
+                'Configuration components with async factories cannot be re-inflated on their event loop\'s thread, '
+                'call check() from another thread (e.g. through asyncio.to_thread)'
+            )
+
+        reinflation: Coroutine[Any, Any, list[Component[Any]]] = DependencyGraphInflator().reinflate_async(
+            graph,
+            self._container,
+            nodes,
+            replaced_values
+        )
+
+        if loop is None or not loop.is_running():
+            return asyncio.run(reinflation)
+
+        return asyncio.run_coroutine_threadsafe(reinflation, loop).result()
+
+
+def watch_configuration(
+        container: Container,
+        interval: float = 1.0,
+        on_error: Callable[[Exception], None] | None = None,
+        loop: asyncio.AbstractEventLoop | None = None
+) -> ConfigurationWatcher:
+    return ConfigurationWatcher(container, interval, on_error, loop).start()
+
+
+def _fingerprint(path: str) -> FileFingerprint | None:
+    try:
+        stat: os.stat_result = os.stat(path)
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _read(reader: ConfigurationReader, section: str | None) -> Any:
+    try:
+        return reader.read(section)
+    except KeyError:
+        return _MISSING
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _log_error(exception: Exception) -> None:
+    logging.getLogger('foxhound').error('Failed to reload the configuration', exc_info=exception)
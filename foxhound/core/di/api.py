@@ -1,30 +1,58 @@
+import collections.abc
 import inspect
+import itertools
+import os
 from collections.abc import Callable
 from types import GenericAlias, ModuleType
-from typing import TypeVar
+from typing import Any, TypeVar, get_args, get_origin
 
-from networkx.classes import DiGraph
-
-from foxhound.core.di.component_scanner import ComponentScanner
+from foxhound.core.di.component_scanner import ComponentScanner, DefinitionLocation
 from foxhound.core.di.consts import OBJECT_COMPONENT_DEFINITION_ATTRIBUTE
 from foxhound.core.di.container import Container
 from foxhound.core.di.dependency_resolver import DependencyResolver
-from foxhound.core.di.graph.inflator import DependencyGraphInflator
+from foxhound.core.di.graph.dependency_graph import DependencyGraph
+from foxhound.core.di.graph.inflator import DependencyGraphInflator, reject_async_factories
 from foxhound.core.di.graph.mapper import DependencyGraphMapper
-from foxhound.core.di.models import ComponentDefinition, ComponentMetadata
-from foxhound.core.models import Result
+from foxhound.core.di.models import ComponentDefinition, ComponentMetadata, EvictionSettings, PoolSettings, Scope
+from foxhound.core.di.module_index import ModuleIndex
+from foxhound.core.di.tracing import StartupTracer, trace_phase
+from foxhound.core.di.wire import activate_container
+from foxhound.core.di.wiring_cache import WiringPlanCache
+from foxhound.core.models import Result, validate_models
 from foxhound.core.utils.typing import validate_concrete_parameters, validate_concrete_return_type
 
 T = TypeVar('T')
+C = TypeVar('C', bound=Callable[..., Any])
+
+_MODULE_INDEX_PATH_ENV_VAR = 'FOXHOUND_MODULE_INDEX_PATH'
+_GENERATOR_ORIGINS: frozenset[type] = frozenset({
+    collections.abc.Iterator,
+    collections.abc.Iterable,
+    collections.abc.Generator,
+    collections.abc.AsyncIterator,
+    collections.abc.AsyncIterable,
+    collections.abc.AsyncGenerator,
+})
 
 
 def component(
         qualifier: str | None = None,
         primary: bool = False,
-        param_qualifiers: dict[str, str] | None = None
-) -> type[T] | Callable[..., T]:
-    def decorator(target: type[T] | Callable[..., T]) -> type[T] | Callable[..., T]:
-        component_definition: ComponentDefinition[T] = define_component(target, qualifier, primary, param_qualifiers)
+        param_qualifiers: dict[str, str] | None = None,
+        lazy: bool = False,
+        scope: Scope | str = Scope.SINGLETON,
+        pool: PoolSettings | None = None
+) -> Callable[[C], C]:
+    def decorator(target: C) -> C:
+        component_definition: ComponentDefinition[Any] = define_component(
+            target,
+            qualifier,
+            primary,
+            param_qualifiers,
+            lazy,
+            scope,
+            pool
+        )
         embed_definition(target, component_definition)
         return target
 
@@ -35,22 +63,60 @@ def define_component(
         target: type[T] | Callable[..., T],
         qualifier: str | None = None,
         primary: bool = False,
-        param_qualifiers: dict[str, str] | None = None
+        param_qualifiers: dict[str, str] | None = None,
+        lazy: bool = False,
+        scope: Scope | str = Scope.SINGLETON,
+        pool: PoolSettings | None = None
 ) -> ComponentDefinition[T]:
     signature: inspect.Signature = inspect.signature(target)
+    scope = Scope(scope)
+
+    if lazy and inspect.iscoroutinefunction(target):
+        raise TypeError('Lazy components cannot be inflated by async factories')
+
+    if scope is not Scope.SINGLETON and inspect.iscoroutinefunction(target):
+        raise TypeError(f'Components scoped as "{scope.value}" cannot be inflated by async factories')
+
+    generator_factory: bool = inspect.isgeneratorfunction(target) or inspect.isasyncgenfunction(target)
+
+    if generator_factory and (lazy or scope is not Scope.SINGLETON):
+        raise TypeError('Only eager singleton components can be inflated by generator factories')
+
+    if pool is not None and scope is not Scope.POOLED:
+        raise ValueError('Pool settings only apply to components scoped as "pooled"')
+
+    return_type: type | GenericAlias
 
     if inspect.isclass(target):
         _validate_ctor_signature(signature)
-        return_type: type = target
+        return_type = target
     else:
         _validate_function_signature(signature)
-        return_type: type | GenericAlias = signature.return_annotation
+        return_type = signature.return_annotation
+
+        if generator_factory:
+            return_type = _yielded_type(return_type)
+
+    if scope is Scope.EVICTABLE and _owns_resources(return_type):
+        raise TypeError(
+            'Components scoped as "evictable" are dropped without being closed, so they cannot define close() or '
+            '__aexit__'
+        )
+
+    if scope is Scope.POOLED and _is_context_manager(return_type):
+        raise TypeError(
+            'Components scoped as "pooled" cannot be context managers, since "with" on their proxy borrows an '
+            'instance - pool a wrapper around them instead'
+        )
 
     return ComponentDefinition(
         metadata=ComponentMetadata(
             id=str(target),
             qualifier=qualifier,
             primary=primary,
+            lazy=lazy,
+            scope=scope,
+            pool=PoolSettings() if pool is None and scope is Scope.POOLED else pool,
             kind=return_type
         ),
         param_qualifiers={} if param_qualifiers is None else param_qualifiers,
@@ -58,7 +124,7 @@ def define_component(
     )
 
 
-def embed_definition(target: type[T] | Callable[..., T], component_definition: ComponentDefinition[T]):
+def embed_definition(target: type[T] | Callable[..., T], component_definition: ComponentDefinition[T]) -> None:
     setattr(target, OBJECT_COMPONENT_DEFINITION_ATTRIBUTE, component_definition)
 
 
@@ -74,6 +140,26 @@ def _validate_function_signature(signature: inspect.Signature) -> None:
         raise TypeError('Function return type must be strongly hinted for DI') from e
 
 
+def _yielded_type(return_annotation: Any) -> type | GenericAlias:
+    if get_origin(return_annotation) not in _GENERATOR_ORIGINS or len(get_args(return_annotation)) == 0:
+        raise TypeError(
+            'Generator factories must be annotated as Iterator[T], Generator[T, None, None] or their async equivalents'
+        )
+
+    yielded_type: type | GenericAlias = get_args(return_annotation)[0]
+    return yielded_type
+
+
+def _owns_resources(kind: type | GenericAlias) -> bool:
+    origin: Any = get_origin(kind) or kind
+    return isinstance(origin, type) and (hasattr(origin, '__aexit__') or callable(getattr(origin, 'close', None)))
+
+
+def _is_context_manager(kind: type | GenericAlias) -> bool:
+    origin: Any = get_origin(kind) or kind
+    return isinstance(origin, type) and hasattr(origin, '__enter__')
+
+
 def _validate_ctor_signature(signature: inspect.Signature) -> None:
     try:
         validate_concrete_parameters(signature)
@@ -81,19 +167,113 @@ def _validate_ctor_signature(signature: inspect.Signature) -> None:
         raise TypeError('Class constructor parameters must be strongly type hinted for DI') from e
 
 
-def start(*scan_modules: str | ModuleType) -> None:
-    component_scanner: ComponentScanner = ComponentScanner()
-    dependency_resolver: DependencyResolver = DependencyResolver()
-    graph_mapper: DependencyGraphMapper = DependencyGraphMapper(dependency_resolver)
+def start(
+        *scan_modules: str | ModuleType,
+        max_workers: int | None = None,
+        wiring_cache_path: str | None = None,
+        static_scan: bool = False,
+        module_index_path: str | None = None,
+        tracer: StartupTracer | None = None,
+        eviction: EvictionSettings | None = None
+) -> Container:
+    container: Container = _create_container(eviction)
+    graph: DependencyGraph = _map_dependency_graph(
+        scan_modules,
+        wiring_cache_path,
+        static_scan,
+        module_index_path,
+        tracer
+    )
+    reject_async_factories(graph, range(len(graph)), 'start_async()')
+
+    with trace_phase(tracer, 'inflate'):
+        DependencyGraphInflator(max_workers, tracer).inflate(graph, container)
 
-    dependency_graph_mapping: Result[DiGraph] = graph_mapper.map(
-        component_scanner.scan(set(scan_modules))
+    container.graph = graph
+    container.inflated = True
+    activate_container(container)
+
+    return container
+
+
+async def start_async(
+        *scan_modules: str | ModuleType,
+        wiring_cache_path: str | None = None,
+        static_scan: bool = False,
+        module_index_path: str | None = None,
+        tracer: StartupTracer | None = None,
+        eviction: EvictionSettings | None = None
+) -> Container:
+    container: Container = _create_container(eviction)
+    graph: DependencyGraph = _map_dependency_graph(
+        scan_modules,
+        wiring_cache_path,
+        static_scan,
+        module_index_path,
+        tracer
     )
 
-    if not dependency_graph_mapping.successful:
-        raise dependency_graph_mapping.exception
+    with trace_phase(tracer, 'inflate'):
+        await DependencyGraphInflator(tracer=tracer).inflate_async(graph, container)
+
+    container.graph = graph
+    container.inflated = True
+    activate_container(container)
+
+    return container
+
+
+def _create_container(eviction: EvictionSettings | None) -> Container:
+    if eviction is not None:
+        validate_models([eviction])
+
+    return Container(eviction=eviction)
+
+
+def _map_dependency_graph(
+        scan_modules: tuple[str | ModuleType, ...],
+        wiring_cache_path: str | None,
+        static_scan: bool,
+        module_index_path: str | None,
+        tracer: StartupTracer | None
+) -> DependencyGraph:
+    if module_index_path is None:
+        module_index_path = os.environ.get(_MODULE_INDEX_PATH_ENV_VAR)
 
-    DependencyGraphInflator().inflate(
-        dependency_graph_mapping.value,
-        Container()
+    component_scanner: ComponentScanner = ComponentScanner(
+        ModuleIndex(module_index_path) if static_scan else None
     )
+    dependency_resolver: DependencyResolver = DependencyResolver()
+    graph_mapper: DependencyGraphMapper = DependencyGraphMapper(dependency_resolver, tracer)
+    roots: set[str | ModuleType] = set(scan_modules)
+
+    wiring_cache: WiringPlanCache | None = None
+
+    if wiring_cache_path is not None:
+        wiring_cache = WiringPlanCache(wiring_cache_path, component_scanner)
+
+        with trace_phase(tracer, 'wiring_cache.load'):
+            cached_graph: DependencyGraph | None = wiring_cache.load(roots)
+
+        if cached_graph is not None:
+            validate_models(itertools.chain(cached_graph.definitions, cached_graph.parameters))
+            return cached_graph
+
+    with trace_phase(tracer, 'scan'):
+        located_definitions: list[tuple[ComponentDefinition, DefinitionLocation]] = component_scanner.scan_locations(
+            roots
+        )
+
+    with trace_phase(tracer, 'map'):
+        dependency_graph_mapping: Result[DependencyGraph] = graph_mapper.map(
+            [definition for definition, _ in located_definitions]
+        )
+
+    graph: DependencyGraph = dependency_graph_mapping.unwrap()
+    validate_models(itertools.chain(graph.definitions, graph.parameters))
+
+    if wiring_cache is not None:
+        with trace_phase(tracer, 'wiring_cache.save'):
+            wiring_cache.save(roots, [location for _, location in located_definitions], graph)
+
+    return graph
@@ -0,0 +1,69 @@
+from types import GenericAlias
+from typing import Any
+
+from foxhound.core.di.container import Container
+from foxhound.core.di.graph.dependency_graph import DependencyGraph
+from foxhound.core.di.graph.inflator import DependencyGraphInflator, reject_async_factories
+from foxhound.core.di.models import Component
+from foxhound.core.models import validate_models
+
+OverrideKey = type | GenericAlias | tuple[type | GenericAlias, str]
+
+
+def child_container(parent: Container, overrides: dict[OverrideKey, Any]) -> Container:
+    graph, replaced_values, dirty_nodes = _plan(parent, overrides)
+    reject_async_factories(graph, dirty_nodes, 'child_container_async()')
+
+    return _derive(
+        parent,
+        graph,
+        replaced_values,
+        DependencyGraphInflator().reinflate(graph, parent, dirty_nodes, replaced_values)
+    )
+
+
+async def child_container_async(parent: Container, overrides: dict[OverrideKey, Any]) -> Container:
+    graph, replaced_values, dirty_nodes = _plan(parent, overrides)
+
+    return _derive(
+        parent,
+        graph,
+        replaced_values,
+        await DependencyGraphInflator().reinflate_async(graph, parent, dirty_nodes, replaced_values)
+    )
+
+
+def _plan(parent: Container, overrides: dict[OverrideKey, Any]) -> tuple[DependencyGraph, dict[int, Any], set[int]]:
+    graph: DependencyGraph | None = parent.graph
+
+    if graph is None:
+        raise RuntimeError('Only containers created by start() can have child containers')
+
+    replaced_values: dict[int, Any] = {}
+
+    for key, value in overrides.items():
+        kind, qualifier = key if isinstance(key, tuple) else (key, None)
+        replaced_values[graph.node_id(parent.find_component(kind, qualifier).metadata.id)] = value
+
+    inherited_overrides: set[int] = {graph.node_id(component_id) for component_id in parent.overridden_ids}
+    dirty_nodes: set[int] = graph.with_dependents(set(replaced_values), inherited_overrides) - replaced_values.keys()
+
+    return graph, replaced_values, dirty_nodes
+
+
+def _derive(
+        parent: Container,
+        graph: DependencyGraph,
+        replaced_values: dict[int, Any],
+        components: list[Component[Any]]
+) -> Container:
+    overridden_components: list[Component[Any]] = [
+        Component(metadata=graph.definitions[node].metadata, value=value) for node, value in replaced_values.items()
+    ]
+    validate_models(overridden_components)
+
+    child: Container = Container(parent)
+    child.swap_components([], overridden_components + components)
+    child.overridden_ids = parent.overridden_ids | {component.metadata.id for component in overridden_components}
+
+    return child
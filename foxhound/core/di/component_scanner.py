@@ -5,23 +5,47 @@ from types import ModuleType
 
 from foxhound.core.di.consts import OBJECT_COMPONENT_DEFINITION_ATTRIBUTE
 from foxhound.core.di.models import ComponentDefinition
+from foxhound.core.di.module_index import ModuleIndex
+
+DefinitionLocation = tuple[str, int]
 
 
 class ComponentScanner:
+    _module_index: ModuleIndex | None
+
+    def __init__(self, module_index: ModuleIndex | None = None):
+        self._module_index = module_index
+
     def scan(self, modules: set[str | ModuleType]) -> list[ComponentDefinition]:
+        return [definition for definition, _ in self.scan_locations(modules)]
+
+    def scan_locations(self, modules: set[str | ModuleType]) -> list[tuple[ComponentDefinition, DefinitionLocation]]:
         seen: set[str] = set()
-        definitions: list[ComponentDefinition] = []
+        definitions: list[tuple[ComponentDefinition, DefinitionLocation]] = []
 
         for module in self._resolve_modules(modules):
-            for definition in self._collect_from_module(module):
+            for index, definition in enumerate(self._collect_from_module(module)):
                 if definition.metadata.id in seen:
                     continue
 
                 seen.add(definition.metadata.id)
-                definitions.append(definition)
+                definitions.append((definition, (module.__name__, index)))
 
         return definitions
 
+    def load(self, location: DefinitionLocation) -> ComponentDefinition:
+        module_name, index = location
+        module: ModuleType = sys.modules.get(module_name) or importlib.import_module(module_name)
+
+        return self._collect_from_module(module)[index]
+
+    def collect_defined(self, module: ModuleType) -> dict[str, ComponentDefinition]:
+        return {
+            name: definition for name, obj in vars(module).items()
+            if type(definition := getattr(obj, OBJECT_COMPONENT_DEFINITION_ATTRIBUTE, None)) is ComponentDefinition
+            and getattr(obj, '__module__', None) == module.__name__
+        }
+
     def _resolve_modules(self, roots: set[str | ModuleType]) -> list[ModuleType]:
         modules: dict[str, ModuleType] = {}
 
@@ -32,11 +56,20 @@ class ComponentScanner:
             is_package: bool = hasattr(module, '__path__')
 
             if is_package:
-                for _, submodule_name, _ in pkgutil.walk_packages(module.__path__, prefix=f'{module.__name__}.'):
+                for submodule_name in self._find_submodules(module):
                     modules[submodule_name] = sys.modules.get(submodule_name) or importlib.import_module(submodule_name)
 
         return list(modules.values())
 
+    def _find_submodules(self, package: ModuleType) -> list[str]:
+        if self._module_index is not None:
+            return self._module_index.find_component_modules(package)
+
+        return [
+            submodule_name
+            for _, submodule_name, _ in pkgutil.walk_packages(package.__path__, prefix=f'{package.__name__}.')
+        ]
+
     def _collect_from_module(self, module: ModuleType) -> list[ComponentDefinition]:
         return [
             definition for obj in vars(module).values()
@@ -1,6 +1,15 @@
-from typing import Any, TypeVar
+import threading
+import typing
+from types import GenericAlias
+from typing import Any, TypeVar, cast
 
-from foxhound.core.di.models import Component
+from foxhound.core.di.eviction import EvictionTracker
+from foxhound.core.di.exceptions import ComponentLookupError
+from foxhound.core.di.graph.dependency_graph import DependencyGraph
+from foxhound.core.di.kind_index import KindIndex
+from foxhound.core.di.models import Component, EvictionSettings
+from foxhound.core.di.pool import ComponentPool
+from foxhound.core.di.proxies import EvictableProxy, PooledProxy
 from foxhound.core.utils.typing import is_assignable_to
 
 T = TypeVar('T')
@@ -8,32 +17,200 @@ T = TypeVar('T')
 
 class Container:
     inflated: bool
+    graph: DependencyGraph | None
+    parent: 'Container | None'
+    overridden_ids: frozenset[str]
+    eviction: EvictionTracker
     _components: dict[str, Component[Any]]
+    _qualified_components: dict[str, Component[Any]]
+    _kind_index: KindIndex[Component[Any]]
+    _lock: threading.Lock
 
-    def __init__(self):
-        self.inflated = False
+    def __init__(self, parent: 'Container | None' = None, eviction: EvictionSettings | None = None):
+        self.inflated = False if parent is None else parent.inflated
+        self.graph = None if parent is None else parent.graph
+        self.parent = parent
+        self.overridden_ids = frozenset() if parent is None else parent.overridden_ids
+        self.eviction = EvictionTracker(eviction) if parent is None else parent.eviction
         self._components = {}
+        self._qualified_components = {}
+        self._kind_index = KindIndex(lambda component: component.metadata.kind)
+        self._lock = threading.Lock()
 
     def register_component(self, component: Component[Any]) -> None:
         qualifier: str | None = component.metadata.qualifier
 
-        if qualifier is not None and self._already_exists(qualifier):
-            raise ValueError(
-                f'A component with qualifier "{qualifier}" already exists'
-            )
+        with self._lock:
+            if qualifier is not None and self._already_exists(qualifier, component.metadata.id):
+                raise ValueError(
+                    f'A component with qualifier "{qualifier}" already exists'
+                )
+
+            self._components[component.metadata.id] = component
+            self._kind_index.add(component)
+
+            if qualifier is not None:
+                self._qualified_components[qualifier] = component
+
+    def swap_components(
+            self,
+            removed_component_ids: list[str],
+            components: list[Component[Any]]
+    ) -> list[Component[Any]]:
+        # Copy-on-write, so every lookup sees either all or none of the swapped components
+        removed_components: list[Component[Any]] = []
+
+        with self._lock:
+            all_components: dict[str, Component[Any]] = dict(self._components)
+            qualified_components: dict[str, Component[Any]] = dict(self._qualified_components)
+            kind_index: KindIndex[Component[Any]] = self._kind_index.copy()
+
+            for component_id in removed_component_ids:
+                removed_component: Component[Any] | None = all_components.pop(component_id, None)
+
+                if removed_component is None:
+                    continue
+
+                removed_components.append(removed_component)
+                kind_index.remove(removed_component)
+
+                if removed_component.metadata.qualifier is not None:
+                    del qualified_components[removed_component.metadata.qualifier]
+
+            for component in components:
+                qualifier: str | None = component.metadata.qualifier
+
+                if qualifier is not None and (
+                        qualifier in qualified_components or self._inherits_qualifier(qualifier, component.metadata.id)
+                ):
+                    raise ValueError(f'A component with qualifier "{qualifier}" already exists')
+
+                all_components[component.metadata.id] = component
+                kind_index.add(component)
+
+                if qualifier is not None:
+                    qualified_components[qualifier] = component
 
-        self._components[component.metadata.id] = component
+            self._components = all_components
+            self._qualified_components = qualified_components
+            self._kind_index = kind_index
+
+        self.eviction.forget(
+            component.value for component in removed_components if isinstance(component.value, EvictableProxy)
+        )
+
+        return removed_components
 
     def get_component(self, component_id: str) -> Component[Any] | None:
-        return self._components.get(component_id)
+        component: Component[Any] | None = self._components.get(component_id)
 
-    def _already_exists(self, qualifier: str) -> bool:
-        return any(component.metadata.qualifier == qualifier for component in self._components.values())
+        if component is None and self.parent is not None:
+            return self.parent.get_component(component_id)
 
-    def get_components(self, kind: type[T]) -> list[Component[T]]:
-        return list(
-            filter(
-                lambda component: is_assignable_to(component.metadata.kind, kind),
-                self._components.values()
-            )
+        return component
+
+    def components(self) -> list[Component[Any]]:
+        if self.parent is None:
+            return list(self._components.values())
+
+        return list({
+            **{component.metadata.id: component for component in self.parent.components()},
+            **self._components
+        }.values())
+
+    def local_components(self) -> list[Component[Any]]:
+        return list(self._components.values())
+
+    def _already_exists(self, qualifier: str, component_id: str) -> bool:
+        return qualifier in self._qualified_components or self._inherits_qualifier(qualifier, component_id)
+
+    def _inherits_qualifier(self, qualifier: str, component_id: str) -> bool:
+        if self.parent is None:
+            return False
+
+        inherited: Component[Any] | None = self.parent._find_qualified(qualifier)
+        return inherited is not None and inherited.metadata.id != component_id
+
+    def _find_qualified(self, qualifier: str) -> Component[Any] | None:
+        component: Component[Any] | None = self._qualified_components.get(qualifier)
+
+        if component is None and self.parent is not None:
+            return self.parent._find_qualified(qualifier)
+
+        return component
+
+    def get_components(self, kind: type[T] | GenericAlias) -> list[Component[T]]:
+        if self.parent is None:
+            return self._kind_index.find(kind)
+
+        inherited: list[Component[Any]] = self.parent.get_components(kind)
+
+        if len(self._components) == 0:
+            return inherited
+
+        inherited_ids: set[str] = {component.metadata.id for component in inherited}
+
+        return [
+            *(self._components.get(component.metadata.id, component) for component in inherited),
+            *(component for component in self._kind_index.find(kind) if component.metadata.id not in inherited_ids)
+        ]
+
+    def get(self, kind: type[T] | GenericAlias, qualifier: str | None = None) -> T:
+        if qualifier is not None:
+            return self._get_qualified(kind, qualifier).value
+
+        matches: list[Component[Any]] = self.get_components(kind)
+
+        if len(matches) == 0 and typing.get_origin(kind) is list:
+            return cast(T, [component.value for component in self.get_components(typing.get_args(kind)[0])])
+
+        return self._select(kind, matches).value
+
+    def find_component(self, kind: type[T] | GenericAlias, qualifier: str | None = None) -> Component[T]:
+        if qualifier is not None:
+            return self._get_qualified(kind, qualifier)
+
+        return self._select(kind, self.get_components(kind))
+
+    def _select(self, kind: type[T] | GenericAlias, matches: list[Component[Any]]) -> Component[T]:
+        if len(matches) == 0:
+            raise ComponentLookupError(f'No registered component matching {kind}')
+
+        if len(matches) == 1:
+            return matches[0]
+
+        primary_matches: list[Component[Any]] = [
+            component for component in matches
+            if component.metadata.primary
+        ]
+
+        if len(primary_matches) == 1:
+            return primary_matches[0]
+
+        raise ComponentLookupError(
+            f'Multiple components matching {kind} were found. Specific component '
+            f'can be selected by specifying a qualifier or exactly one primary component.'
         )
+
+    def _get_qualified(self, kind: type[T] | GenericAlias, qualifier: str) -> Component[T]:
+        component: Component[Any] | None = self._find_qualified(qualifier)
+
+        if component is None:
+            raise ComponentLookupError(f'No registered component with qualifier "{qualifier}"')
+
+        if not is_assignable_to(component.metadata.kind, kind):
+            raise ComponentLookupError(
+                f'Component with qualifier "{qualifier}" is of kind {component.metadata.kind}, '
+                f'which does not match {kind}'
+            )
+
+        return component
+
+    def pool(self, kind: type[T] | GenericAlias, qualifier: str | None = None) -> ComponentPool[T]:
+        value: Any = self.get(kind, qualifier)
+
+        if not isinstance(value, PooledProxy):
+            raise ComponentLookupError(f'Component matching {kind} is not scoped as "pooled"')
+
+        pool: ComponentPool[T] = object.__getattribute__(value, '_foxhound_pool')
+        return pool
@@ -0,0 +1,21 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from foxhound.core.di.finalizers import close_dropped
+
+context_instances: ContextVar[dict[str, Any] | None] = ContextVar('foxhound_context_instances', default=None)
+
+
+@contextmanager
+def component_context() -> Iterator[None]:
+    instances: dict[str, Any] = {}
+    token = context_instances.set(instances)
+
+    try:
+        yield
+    finally:
+        context_instances.reset(token)
+        close_dropped(reversed(list(instances.values())))
+        instances.clear()
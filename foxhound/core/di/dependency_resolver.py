@@ -1,25 +1,65 @@
 import typing
 from types import GenericAlias
 
-from foxhound.core.di.models import ComponentDefinition, Parameter
+from foxhound.core.di.models import ComponentDefinition, Parameter, Scope
+from foxhound.core.di.resolution_index import ResolutionIndex
 from foxhound.core.models import Result
 from foxhound.core.utils.typing import is_assignable_to
 
 
 class DependencyResolver:
-    def try_resolve(self, dependency: Parameter, candidates: list[ComponentDefinition]) -> Result[list[str]]:
+    def try_resolve(self, dependency: Parameter, candidates: ResolutionIndex) -> Result[list[str]]:
+        resolution: Result[list[str]]
+
         if dependency.qualifier is None:
-            return self._find_unqualified_components(dependency, candidates)
+            resolution = self._find_unqualified_components(dependency, candidates)
+        else:
+            resolution = self._find_qualified_component(dependency, candidates)
+
+        if not dependency.lazy or not resolution.successful:
+            return resolution
+
+        return self._assert_deferrable(dependency, resolution.unwrap(), candidates)
+
+    def _assert_deferrable(
+            self,
+            dependency: Parameter,
+            component_ids: list[str],
+            candidates: ResolutionIndex
+    ) -> Result[list[str]]:
+        eager_component_ids: list[str] = [
+            component_id for component_id in component_ids
+            if not candidates.get(component_id).metadata.lazy
+            and candidates.get(component_id).metadata.scope is Scope.SINGLETON
+        ]
 
-        return self._find_qualified_component(dependency, candidates)
+        if len(eager_component_ids) != 0:
+            return Result.fail(
+                f'Annotated as Lazy[{dependency.kind}], but {", ".join(eager_component_ids)} '
+                f'would be inflated at startup anyway. Declare it with lazy=True to defer its inflation, '
+                f'or drop the Lazy annotation.'
+            )
+
+        return Result.ok(component_ids)
 
     def _find_qualified_component(
             self,
             dependency: Parameter,
-            candidates: list[ComponentDefinition]
+            candidates: ResolutionIndex
     ) -> Result[list[str]]:
         kind: type | GenericAlias = dependency.kind
-        qualifier: str = dependency.qualifier
+        qualifier: str | None = dependency.qualifier
+
+        qualified_candidate: ComponentDefinition | None = (
+            None if qualifier is None else candidates.find_qualified(qualifier)
+        )
+
+        if (
+                qualified_candidate is not None
+                and qualified_candidate.metadata.id != dependency.parent_component_id
+                and is_assignable_to(qualified_candidate.metadata.kind, kind)
+        ):
+            return Result.ok([qualified_candidate.metadata.id])
 
         type_matches: list[ComponentDefinition] = self._filter_matching_candidates(
             kind,
@@ -33,10 +73,6 @@ class DependencyResolver:
                 f'In fact, no component matching {kind} has been found at all.'
             )
 
-        for candidate in type_matches:
-            if candidate.metadata.qualifier == qualifier:
-                return Result.ok([candidate.metadata.id])
-
         return Result.fail(
             f'No registered component matching {kind} with qualifier "{qualifier}". '
             f'However, {len(type_matches)} other components matching {kind} are registered.'
@@ -45,7 +81,7 @@ class DependencyResolver:
     def _find_unqualified_components(
             self,
             dependency: Parameter,
-            candidates: list[ComponentDefinition]
+            candidates: ResolutionIndex
     ) -> Result[list[str]]:
         kind: type | GenericAlias = dependency.kind
 
@@ -95,10 +131,6 @@ class DependencyResolver:
             self,
             kind: type | GenericAlias,
             parent_component_id: str,
-            candidates: list[ComponentDefinition]
+            candidates: ResolutionIndex
     ) -> list[ComponentDefinition]:
-        return [
-            candidate for candidate in candidates
-            if is_assignable_to(candidate.metadata.kind, kind)
-               and candidate.metadata.id != parent_component_id
-        ]
+        return candidates.find(kind, excluded_component_id=parent_component_id)
@@ -0,0 +1,130 @@
+import functools
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+from foxhound.core.di.models import EvictionSettings, EvictionStatistics
+from foxhound.core.utils.memory import deep_size, shallow_size
+
+
+class EvictionTracker:
+    settings: EvictionSettings
+    _resident: OrderedDict[int, tuple[Any, int]]
+    _size: int
+    _lock: threading.Lock
+    _statistics: EvictionStatistics
+
+    def __init__(self, settings: EvictionSettings | None = None):
+        self.settings = EvictionSettings() if settings is None else settings
+        self._resident = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._statistics = EvictionStatistics()
+
+    def admit(self, proxy: Any, instance: Any) -> None:
+        size: int = self._measure(proxy, instance)
+
+        with self._lock:
+            previous: tuple[Any, int] | None = self._resident.pop(id(proxy), None)
+
+            if previous is not None:
+                self._size -= previous[1]
+
+            self._resident[id(proxy)] = (proxy, size)
+            self._size += size
+            self._statistics.misses += 1
+            evicted: list[Any] = self._over_budget(keep=id(proxy))
+
+        self._evict(evicted)
+
+    def touch(self, proxy: Any) -> None:
+        with self._lock:
+            if id(proxy) in self._resident:
+                self._resident.move_to_end(id(proxy))
+                self._statistics.hits += 1
+
+    def forget(self, proxies: Iterable[Any]) -> None:
+        with self._lock:
+            for proxy in proxies:
+                resident: tuple[Any, int] | None = self._resident.pop(id(proxy), None)
+
+                if resident is not None:
+                    self._size -= resident[1]
+
+    def enforce(self) -> None:
+        with self._lock:
+            resident: list[Any] = [proxy for proxy, _ in self._resident.values()]
+
+        sizes: dict[int, int] = {
+            id(proxy): self._measure(proxy, object.__getattribute__(proxy, '_foxhound_instance'))
+            for proxy in resident
+        }
+
+        with self._lock:
+            for proxy_id, (proxy, size) in list(self._resident.items()):
+                if proxy_id in sizes:
+                    self._resident[proxy_id] = (proxy, sizes[proxy_id])
+                    self._size += sizes[proxy_id] - size
+
+            evicted: list[Any] = self._over_budget(keep=None)
+
+        self._evict(evicted)
+
+    def evict_all(self) -> None:
+        with self._lock:
+            evicted: list[Any] = [proxy for proxy, _ in self._resident.values()]
+            self._resident.clear()
+            self._size = 0
+            self._statistics.evictions += len(evicted)
+
+        self._evict(evicted)
+
+    def statistics(self) -> EvictionStatistics:
+        with self._lock:
+            return self._statistics.model_copy(update={'resident': len(self._resident), 'size': self._size})
+
+    def _over_budget(self, keep: int | None) -> list[Any]:
+        max_components: int | None = self.settings.max_components
+        max_size: int | None = self.settings.max_size
+        evicted: list[Any] = []
+
+        for proxy_id in list(self._resident):
+            if (
+                    (max_components is None or len(self._resident) <= max_components)
+                    and (max_size is None or self._size <= max_size)
+            ):
+                break
+
+            if proxy_id == keep:
+                continue
+
+            proxy, size = self._resident.pop(proxy_id)
+            self._size -= size
+            evicted.append(proxy)
+
+        self._statistics.evictions += len(evicted)
+        return evicted
+
+    def _measure(self, proxy: Any, instance: Any) -> int:
+        if self.settings.max_size is None:
+            return 0
+
+        if not self.settings.deep:
+            return shallow_size(instance)
+
+        factory: functools.partial = object.__getattribute__(proxy, '_foxhound_factory')
+        dependencies: set[int] = set()
+
+        for argument in factory.keywords.values():
+            dependencies.add(id(argument))
+
+            if isinstance(argument, list):
+                dependencies.update(id(item) for item in argument)
+
+        return deep_size(instance, dependencies)
+
+    @staticmethod
+    def _evict(proxies: list[Any]) -> None:
+        for proxy in proxies:
+            object.__getattribute__(proxy, '_foxhound_evict')()
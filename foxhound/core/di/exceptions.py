@@ -8,3 +8,46 @@ class UnsatisfiedDependenciesError(Exception):
         ])
 
         super().__init__('Dependencies unsatisfied' + listed_hints)
+
+
+class ComponentLookupError(LookupError):
+    pass
+
+
+class PoolExhaustedError(TimeoutError):
+    pass
+
+
+class NoActiveContextError(RuntimeError):
+    pass
+
+
+class IncompleteReloadError(Exception):
+    modules: list[str]
+
+    def __init__(self, component_ids_by_module: dict[str, list[str]]):
+        self.modules = sorted(component_ids_by_module)
+
+        listed_components: str = ''.join([
+            f'\n\t{module}: {", ".join(component_ids_by_module[module])}'
+            for module in self.modules
+        ])
+
+        super().__init__(
+            'Components of modules that were not reloaded are of classes the reload recreated, '
+            'reload these modules as well' + listed_components
+        )
+
+
+class ComponentShutdownError(Exception):
+    failures: dict[str, BaseException]
+
+    def __init__(self, failures: dict[str, BaseException]):
+        self.failures = failures
+
+        listed_failures: str = ''.join([
+            f'\n\t{component_id}: {type(exception).__name__}: {exception}'
+            for component_id, exception in failures.items()
+        ])
+
+        super().__init__(f'Failed to shut down {len(failures)} components' + listed_failures)
@@ -0,0 +1,78 @@
+import asyncio
+import functools
+import inspect
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+Finalizer = Callable[[], Any]
+
+_scheduled_closes: set[asyncio.Task] = set()
+
+
+def value_finalizer(value: Any) -> Finalizer | None:
+    # Looked up on the type, so mocks synthesizing attributes are not mistaken for closeable
+    kind: type = type(value)
+
+    if hasattr(kind, '__aexit__'):
+        return functools.partial(_exit_async, value)
+
+    if callable(getattr(kind, 'close', None)):
+        close: Finalizer = value.close
+        return close
+
+    return None
+
+
+def run_finalizer(finalizer: Finalizer) -> None:
+    result: Any = finalizer()
+
+    if inspect.isawaitable(result):
+        asyncio.run(_await(result))
+
+
+def close_dropped(instances: Iterable[Any]) -> None:
+    for instance in instances:
+        finalizer: Finalizer | None = value_finalizer(instance)
+
+        if finalizer is None:
+            continue
+
+        try:
+            result: Any = finalizer()
+
+            if inspect.isawaitable(result):
+                _close_async(result)
+        except Exception:
+            _log_close_failure(instance)
+
+
+def _close_async(awaitable: Awaitable[Any]) -> None:
+    try:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(_await(awaitable))
+        return
+
+    task: asyncio.Task = loop.create_task(_await(awaitable))
+    _scheduled_closes.add(task)
+    task.add_done_callback(_close_done)
+
+
+def _close_done(task: asyncio.Task) -> None:
+    _scheduled_closes.discard(task)
+
+    if not task.cancelled() and task.exception() is not None:
+        logging.getLogger('foxhound').error('Failed to close a dropped instance', exc_info=task.exception())
+
+
+def _log_close_failure(instance: Any) -> None:
+    logging.getLogger('foxhound').error('Failed to close a dropped %s', type(instance).__name__, exc_info=True)
+
+
+async def _exit_async(value: Any) -> None:
+    await value.__aexit__(None, None, None)
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    return await awaitable
@@ -0,0 +1,232 @@
+from array import array
+from typing import Any
+
+from foxhound.core.di.graph.models import NodeType
+from foxhound.core.di.models import ComponentDefinition, Parameter
+
+
+class DependencyGraph:
+    definitions: list[ComponentDefinition]
+    parameters: list[Parameter]
+    _node_ids: dict[str, int]
+    _parameter_offsets: array
+    _dependency_offsets: array
+    _dependencies: array
+    _topological_order: list[int] | None
+    _topological_positions: array | None
+    _cyclic_components: list[list[int]] | None
+    _dependents: list[list[int]] | None
+
+    def __init__(
+            self,
+            definitions: list[ComponentDefinition],
+            node_parameters: list[list[Parameter]],
+            parameter_dependencies: list[list[int]]
+    ):
+        self.definitions = definitions
+        self.parameters = []
+        self._node_ids = {definition.metadata.id: node for node, definition in enumerate(definitions)}
+        self._parameter_offsets = array('l', [0])
+        self._dependency_offsets = array('l', [0])
+        self._dependencies = array('l')
+        self._topological_order = None
+        self._topological_positions = None
+        self._cyclic_components = None
+        self._dependents = None
+
+        for parameters in node_parameters:
+            self.parameters.extend(parameters)
+            self._parameter_offsets.append(len(self.parameters))
+
+        for dependencies in parameter_dependencies:
+            self._dependencies.extend(dependencies)
+            self._dependency_offsets.append(len(self._dependencies))
+
+    def __len__(self) -> int:
+        return len(self.definitions)
+
+    def node_id(self, component_id: str) -> int:
+        return self._node_ids[component_id]
+
+    def parameter_range(self, node: int) -> range:
+        return range(self._parameter_offsets[node], self._parameter_offsets[node + 1])
+
+    def parameter_dependencies(self, parameter: int) -> array:
+        return self._dependencies[self._dependency_offsets[parameter]:self._dependency_offsets[parameter + 1]]
+
+    def dependencies(self, node: int) -> array:
+        start: int = self._dependency_offsets[self._parameter_offsets[node]]
+        end: int = self._dependency_offsets[self._parameter_offsets[node + 1]]
+        return self._dependencies[start:end]
+
+    def dependents(self) -> list[list[int]]:
+        if self._dependents is None:
+            dependents: list[list[int]] = [[] for _ in range(len(self))]
+
+            for node in range(len(self)):
+                for dependency in self.dependencies(node):
+                    dependents[dependency].append(node)
+
+            self._dependents = dependents
+
+        return self._dependents
+
+    def with_dependents(self, nodes: set[int], excluded: set[int] | frozenset[int] = frozenset()) -> set[int]:
+        dependents: list[list[int]] = self.dependents()
+        affected: set[int] = set(nodes)
+        pending: list[int] = list(nodes)
+
+        while len(pending) != 0:
+            for dependent in dependents[pending.pop()]:
+                if dependent not in affected and dependent not in excluded:
+                    affected.add(dependent)
+                    pending.append(dependent)
+
+        return affected
+
+    def topological_order(self) -> list[int]:
+        # Nodes on or depending on a cycle are left out
+        if self._topological_order is None:
+            self._topological_order, self._cyclic_components = self._analyze()
+
+        return self._topological_order
+
+    def in_topological_order(self, nodes: set[int]) -> list[int]:
+        positions: array | None = self._topological_positions
+
+        if positions is None:
+            positions = array('l', [-1]) * len(self)
+
+            for position, node in enumerate(self.topological_order()):
+                positions[node] = position
+
+            self._topological_positions = positions
+
+        return sorted((node for node in nodes if positions[node] != -1), key=positions.__getitem__)
+
+    def cyclic_components(self) -> list[list[int]]:
+        if self._cyclic_components is None:
+            self._topological_order, self._cyclic_components = self._analyze()
+
+        return self._cyclic_components
+
+    def is_acyclic(self) -> bool:
+        return len(self.cyclic_components()) == 0
+
+    def _analyze(self) -> tuple[list[int], list[list[int]]]:
+        # Iterative Tarjan - components complete dependencies first, so they come out in topological order
+        size: int = len(self)
+        indices: array = array('l', [-1]) * size
+        lowlinks: array = array('l', [0]) * size
+        on_stack: bytearray = bytearray(size)
+        tainted: bytearray = bytearray(size)
+        stack: list[int] = []
+        order: list[int] = []
+        cyclic_components: list[list[int]] = []
+        counter: int = 0
+
+        for root in range(size):
+            if indices[root] != -1:
+                continue
+
+            indices[root] = lowlinks[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            work: list[tuple[int, Any]] = [(root, iter(self.dependencies(root)))]
+
+            while len(work) != 0:
+                node, dependencies = work[-1]
+
+                for dependency in dependencies:
+                    if indices[dependency] == -1:
+                        indices[dependency] = lowlinks[dependency] = counter
+                        counter += 1
+                        stack.append(dependency)
+                        on_stack[dependency] = 1
+                        work.append((dependency, iter(self.dependencies(dependency))))
+                        break
+
+                    if on_stack[dependency] and indices[dependency] < lowlinks[node]:
+                        lowlinks[node] = indices[dependency]
+                else:
+                    work.pop()
+
+                    if len(work) != 0 and lowlinks[node] < lowlinks[work[-1][0]]:
+                        lowlinks[work[-1][0]] = lowlinks[node]
+
+                    if lowlinks[node] != indices[node]:
+                        continue
+
+                    component: list[int] = []
+
+                    while True:
+                        member: int = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+
+                        if member == node:
+                            break
+
+                    cyclic: bool = len(component) > 1 or node in self.dependencies(node)
+                    blocked: bool = cyclic or any(tainted[dependency] for dependency in self.dependencies(node))
+
+                    if cyclic:
+                        cyclic_components.append(component)
+
+                    if blocked:
+                        for member in component:
+                            tainted[member] = 1
+                    else:
+                        order.append(node)
+
+        return order, cyclic_components
+
+    def shortest_cycle(self, component: list[int]) -> list[int]:
+        members: set[int] = set(component)
+        start: int = min(component)
+        predecessors: dict[int, int] = {}
+        frontier: list[int] = [start]
+
+        while len(frontier) != 0:
+            next_frontier: list[int] = []
+
+            for node in frontier:
+                for dependency in self.dependencies(node):
+                    if dependency == start:
+                        cycle: list[int] = [node]
+
+                        while cycle[-1] != start:
+                            cycle.append(predecessors[cycle[-1]])
+
+                        return cycle[::-1]
+
+                    if dependency in members and dependency not in predecessors:
+                        predecessors[dependency] = node
+                        next_frontier.append(dependency)
+
+            frontier = next_frontier
+
+        return [start]
+
+    def to_networkx(self) -> Any:
+        try:
+            from networkx import DiGraph
+        except ImportError as e:
+            raise ImportError('Exporting the dependency graph requires networkx (pip install foxhound[debug])') from e
+
+        graph: DiGraph = DiGraph()
+
+        for node, definition in enumerate(self.definitions):
+            component_node_id: str = definition.metadata.id
+            graph.add_node(component_node_id, type=NodeType.COMPONENT, definition=definition)
+
+            for parameter in self.parameter_range(node):
+                parameter_node_id: str = f'{self.parameters[parameter].name}@{component_node_id}'
+                graph.add_node(parameter_node_id, type=NodeType.PARAMETER, properties=self.parameters[parameter])
+                graph.add_edge(component_node_id, parameter_node_id)
+
+                for dependency in self.parameter_dependencies(parameter):
+                    graph.add_edge(parameter_node_id, self.definitions[dependency].metadata.id)
+
+        return graph
@@ -1,16 +1,40 @@
-from collections.abc import Hashable
-from typing import Any
+from foxhound.core.di.graph.dependency_graph import DependencyGraph
 
-from networkx import DiGraph
-from networkx.algorithms.cycles import simple_cycles
+_MAX_REPORTED_CYCLES: int = 10
 
 
 class CyclicGraphError(Exception):
-    graph: DiGraph
-    cycles: list[Hashable | Any]
+    graph: DependencyGraph
+    clusters: list[list[str]]
+    cycles: list[list[str]]
 
-    def __init__(self, graph: DiGraph):
+    def __init__(self, graph: DependencyGraph, max_cycles: int = _MAX_REPORTED_CYCLES):
+        # Listing every elementary cycle could take exponential time on tangled clusters
         self.graph = graph
-        self.cycles = list(simple_cycles(graph))
-        formatted_cycles: list[str] = [' → '.join(c + c[:1]) for c in self.cycles]
+        cyclic_components: list[list[int]] = sorted(graph.cyclic_components(), key=min)
+        self.clusters = [
+            [graph.definitions[node].metadata.id for node in sorted(component)]
+            for component in cyclic_components
+        ]
+        self.cycles = [
+            [graph.definitions[node].metadata.id for node in graph.shortest_cycle(component)]
+            for component in cyclic_components[:max_cycles]
+        ]
+        formatted_cycles: list[str] = [
+            f'{" → ".join(cycle + cycle[:1])} (cluster of {len(cluster)})'
+            for cycle, cluster in zip(self.cycles, self.clusters[:max_cycles], strict=True)
+        ]
+
+        if len(self.clusters) > max_cycles:
+            formatted_cycles.append(f'{len(self.clusters) - max_cycles} more cyclic clusters')
+
         super().__init__(f'Cyclic dependencies detected: {"; ".join(formatted_cycles)}')
+
+
+class ComponentInflationError(Exception):
+    component_id: str
+
+    def __init__(self, component_id: str):
+        self.component_id = component_id
+        super().__init__(f'Failed to inflate component {component_id}')
+
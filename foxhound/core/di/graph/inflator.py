@@ -1,64 +1,396 @@
-from collections.abc import Hashable
+import asyncio
+import functools
+import inspect
+import time
+from array import array
+from collections.abc import AsyncGenerator, Callable, Generator, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Any
 
-from networkx.classes import DiGraph
-
 from foxhound.core.di.container import Container
-from foxhound.core.di.graph.models import NodeType
-from foxhound.core.di.models import Component, ComponentDefinition
+from foxhound.core.di.exceptions import ComponentLookupError
+from foxhound.core.di.graph.dependency_graph import DependencyGraph
+from foxhound.core.di.graph.exceptions import ComponentInflationError
+from foxhound.core.di.models import (
+    Component,
+    ComponentDefinition,
+    ComponentMetadata,
+    Parameter,
+    PoolSettings,
+    Scope,
+)
+from foxhound.core.di.pool import ComponentPool
+from foxhound.core.di.proxies import ContextProxy, EvictableProxy, Lazy, LazyProxy, PooledProxy
+from foxhound.core.di.tracing import COMPONENT_CATEGORY, StartupTracer
+from foxhound.core.models import validation_enabled
+
+ArgumentSlots = tuple[tuple[tuple[str, int], ...], tuple[tuple[str, tuple[int, ...]], ...], tuple[str, ...]]
 
 
 class DependencyGraphInflator:
-    def inflate(self, graph: DiGraph, container: Container) -> None:
-        root_components: list[Hashable] = [
-            node for node in graph.nodes() if graph.in_degree(node) == 0
-        ]
+    _max_workers: int | None
+    _tracer: StartupTracer | None
+    _validate: bool
+
+    def __init__(self, max_workers: int | None = None, tracer: StartupTracer | None = None):
+        self._max_workers = max_workers
+        self._tracer = tracer
+        self._validate = validation_enabled()
+
+    def inflate(self, graph: DependencyGraph, container: Container) -> None:
+        if self._max_workers is not None:
+            self._inflate_concurrently(graph, container)
+            return
+
+        definitions: list[ComponentDefinition] = graph.definitions
+        slots: list[ArgumentSlots] = _build_argument_slots(graph)
+        values: list[Any] = [None] * len(graph)
 
-        for component_node in root_components:
-            self._inflate_component(component_node, graph, container)
+        for node in graph.topological_order():
+            try:
+                values[node] = self._register(
+                    self._invoke(definitions[node], _collect_arguments(slots[node], values), container),
+                    container
+                )
+            except Exception as e:
+                raise ComponentInflationError(definitions[node].metadata.id) from e
 
-    def _inflate_component(self, component_node: Hashable, graph: DiGraph, container: Container) -> Any:
-        assert graph.nodes[component_node].get('type') == NodeType.COMPONENT
+    def reinflate(
+            self,
+            graph: DependencyGraph,
+            container: Container,
+            nodes: set[int],
+            replaced_values: dict[int, Any] | None = None
+    ) -> list[Component[Any]]:
+        # The new components are returned rather than registered, so they can be swapped in at once
+        definitions: list[ComponentDefinition] = graph.definitions
+        values: dict[int, Any] = _reinflation_values(graph, container, nodes, replaced_values)
+        components: list[Component[Any]] = []
 
-        definition: ComponentDefinition = graph.nodes[component_node].get('definition')
+        for node in graph.in_topological_order(nodes):
+            try:
+                component: Component[Any] = self._invoke(
+                    definitions[node],
+                    _collect_arguments(_argument_slots(graph, node), values),
+                    container
+                )
+            except Exception as e:
+                raise ComponentInflationError(definitions[node].metadata.id) from e
 
-        existing_component: Component[Any] | None = container.get_component(definition.metadata.id)
+            values[node] = component.value
+            components.append(component)
 
-        if existing_component is not None:
-            return existing_component.value
+        return components
 
-        inflated_parameters: dict[str, Any] = {}
+    async def reinflate_async(
+            self,
+            graph: DependencyGraph,
+            container: Container,
+            nodes: set[int],
+            replaced_values: dict[int, Any] | None = None
+    ) -> list[Component[Any]]:
+        values: dict[int, Any] = _reinflation_values(graph, container, nodes, replaced_values)
+        components: list[Component[Any]] = []
 
-        for parameter, dependency_nodes in self._parameter_dependency_nodes(component_node, graph).items():
-            if len(dependency_nodes) == 1:
-                inflated_parameters[parameter] = self._inflate_component(dependency_nodes[0], graph, container)
-            else:
-                inflated_parameters[parameter] = [
-                    self._inflate_component(node, graph, container) for node in dependency_nodes
-                ]
+        for node in graph.in_topological_order(nodes):
+            component: Component[Any] = await self._instantiate_async(
+                graph.definitions[node],
+                _collect_arguments(_argument_slots(graph, node), values),
+                container
+            )
+            values[node] = component.value
+            components.append(component)
+
+        return components
 
-        inflated_value: Any = definition.inflator(**inflated_parameters)
+    async def inflate_async(self, graph: DependencyGraph, container: Container) -> None:
+        tasks: dict[int, asyncio.Task] = {}
+        slots: list[ArgumentSlots] = _build_argument_slots(graph)
+        values: list[Any] = [None] * len(graph)
 
-        container.register_component(
-            Component(
-                metadata=definition.metadata,
-                value=inflated_value,
+        for node in graph.topological_order():
+            tasks[node] = asyncio.ensure_future(
+                self._inflate_component_async(node, graph, container, tasks, slots, values)
             )
+
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    async def _inflate_component_async(
+            self,
+            component_node: int,
+            graph: DependencyGraph,
+            container: Container,
+            tasks: dict[int, asyncio.Task],
+            slots: list[ArgumentSlots],
+            values: list[Any]
+    ) -> Any:
+        await asyncio.gather(*{tasks[node] for node in graph.dependencies(component_node)})
+
+        component: Component[Any] = await self._instantiate_async(
+            graph.definitions[component_node],
+            _collect_arguments(slots[component_node], values),
+            container
         )
+        values[component_node] = self._register(component, container)
+        return values[component_node]
+
+    async def _instantiate_async(
+            self,
+            definition: ComponentDefinition,
+            arguments: dict[str, Any],
+            container: Container
+    ) -> Component[Any]:
+        started: int = time.perf_counter_ns()
+
+        try:
+            if _code_flags(definition.inflator) & inspect.CO_ASYNC_GENERATOR:
+                generator: AsyncGenerator[Any, None] = definition.inflator(**arguments)
+                generated: Component[Any] = Component(
+                    metadata=definition.metadata,
+                    value=await _first_value_async(generator, definition),
+                    cleanup=generator
+                )
+                return self._validated(generated)
+
+            component: Component[Any] = self._instantiate(definition, arguments, container)
+
+            # A sync factory may return an awaitable as the component itself
+            if inspect.iscoroutine(component.value):
+                component.value = await component.value
+
+            return self._validated(component)
+        except Exception as e:
+            raise ComponentInflationError(definition.metadata.id) from e
+        finally:
+            if self._tracer is not None:
+                self._tracer.record(definition.metadata.id, COMPONENT_CATEGORY, started)
+
+    def _inflate_concurrently(self, graph: DependencyGraph, container: Container) -> None:
+        dependents: list[list[int]] = graph.dependents()
+        pending: list[int] = [len(graph.dependencies(node)) for node in range(len(graph))]
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(self._max_workers, thread_name_prefix='foxhound')
+        running: dict[Future, int] = {}
+        slots: list[ArgumentSlots] = _build_argument_slots(graph)
+        values: list[Any] = [None] * len(graph)
+
+        def submit(node: int) -> None:
+            running[executor.submit(self._inflate_ready_component, node, graph, container, slots, values)] = node
+
+        try:
+            for node in range(len(graph)):
+                if pending[node] == 0:
+                    submit(node)
+
+            while len(running) != 0:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    finished_node: int = running.pop(future)
+                    exception: BaseException | None = future.exception()
+
+                    if exception is not None:
+                        raise ComponentInflationError(graph.definitions[finished_node].metadata.id) from exception
+
+                    for dependent in dependents[finished_node]:
+                        pending[dependent] -= 1
+
+                        if pending[dependent] == 0:
+                            submit(dependent)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _inflate_ready_component(
+            self,
+            component_node: int,
+            graph: DependencyGraph,
+            container: Container,
+            slots: list[ArgumentSlots],
+            values: list[Any]
+    ) -> None:
+        definition: ComponentDefinition = graph.definitions[component_node]
+        arguments: dict[str, Any] = _collect_arguments(slots[component_node], values)
+
+        values[component_node] = self._register(self._invoke(definition, arguments, container), container)
+
+    def _invoke(
+            self,
+            definition: ComponentDefinition,
+            inflated_parameters: dict[str, Any],
+            container: Container
+    ) -> Component[Any]:
+        if is_async_factory(definition.inflator):
+            raise TypeError(
+                f'Component {definition.metadata.id} has an async factory and can only be inflated by start_async()'
+            )
+
+        if self._tracer is None:
+            return self._validated(self._instantiate(definition, inflated_parameters, container))
+
+        started: int = time.perf_counter_ns()
+
+        try:
+            return self._validated(self._instantiate(definition, inflated_parameters, container))
+        finally:
+            self._tracer.record(definition.metadata.id, COMPONENT_CATEGORY, started)
+
+    def _validated(self, component: Component[Any]) -> Component[Any]:
+        if self._validate:
+            component.validate()
+
+        return component
+
+    def _instantiate(
+            self,
+            definition: ComponentDefinition,
+            inflated_parameters: dict[str, Any],
+            container: Container
+    ) -> Component[Any]:
+        metadata: ComponentMetadata = definition.metadata
+        inflator: Callable[..., Any] = definition.inflator
+
+        if metadata.scope is Scope.POOLED:
+            pool: ComponentPool[Any] = ComponentPool(
+                functools.partial(inflator, **inflated_parameters),
+                PoolSettings() if metadata.pool is None else metadata.pool,
+                prefill=not metadata.lazy
+            )
+            return Component(metadata=metadata, value=PooledProxy(metadata.kind, pool))
+
+        if metadata.scope is Scope.CONTEXT:
+            return Component(
+                metadata=metadata,
+                value=ContextProxy(metadata.kind, metadata.id, functools.partial(inflator, **inflated_parameters))
+            )
+
+        if metadata.scope is Scope.EVICTABLE:
+            return Component(
+                metadata=metadata,
+                value=EvictableProxy(
+                    metadata.kind,
+                    functools.partial(inflator, **inflated_parameters),
+                    container.eviction
+                )
+            )
+
+        if metadata.lazy:
+            return Component(
+                metadata=metadata,
+                value=LazyProxy(metadata.kind, functools.partial(inflator, **inflated_parameters))
+            )
+
+        if _code_flags(inflator) & inspect.CO_GENERATOR:
+            generator: Generator[Any, None, None] = inflator(**inflated_parameters)
+            return Component(metadata=metadata, value=_first_value(generator, definition), cleanup=generator)
+
+        return Component(metadata=metadata, value=inflator(**inflated_parameters))
+
+    def _register(self, component: Component[Any], container: Container) -> Any:
+        container.register_component(component)
+        return component.value
+
+
+def reject_async_factories(graph: DependencyGraph, nodes: Iterable[int], entry_point: str) -> None:
+    async_ids: list[str] = [
+        graph.definitions[node].metadata.id for node in sorted(nodes)
+        if is_async_factory(graph.definitions[node].inflator)
+    ]
+
+    if len(async_ids) != 0:
+        raise TypeError(
+            f'Components {", ".join(async_ids)} have async factories and can only be inflated by {entry_point}'
+        )
+
+
+def is_async_factory(inflator: Callable[..., Any]) -> bool:
+    return inspect.iscoroutinefunction(inflator) or bool(_code_flags(inflator) & inspect.CO_ASYNC_GENERATOR)
+
+
+def _reinflation_values(
+        graph: DependencyGraph,
+        container: Container,
+        nodes: set[int],
+        replaced_values: dict[int, Any] | None
+) -> dict[int, Any]:
+    definitions: list[ComponentDefinition] = graph.definitions
+    values: dict[int, Any] = {}
+    replaced_values = {} if replaced_values is None else replaced_values
+
+    for node in nodes:
+        for dependency in graph.dependencies(node):
+            if dependency in replaced_values:
+                values[dependency] = replaced_values[dependency]
+            elif dependency not in nodes:
+                values[dependency] = _registered_value(container, definitions[dependency])
+
+    return values
+
+
+def _registered_value(container: Container, definition: ComponentDefinition) -> Any:
+    component: Component[Any] | None = container.get_component(definition.metadata.id)
+
+    if component is None:
+        raise ComponentLookupError(f'Component {definition.metadata.id} is not registered in the container')
+
+    return component.value
+
+
+def _code_flags(inflator: Callable[..., Any]) -> int:
+    code: Any = getattr(inflator, '__code__', None)
+    return code.co_flags if code is not None else 0
+
+
+def _first_value(generator: Generator[Any, None, None], definition: ComponentDefinition) -> Any:
+    try:
+        return next(generator)
+    except StopIteration:
+        raise RuntimeError(f'Generator factory of {definition.metadata.id} did not yield a component') from None
+
+
+async def _first_value_async(generator: AsyncGenerator[Any, None], definition: ComponentDefinition) -> Any:
+    try:
+        return await anext(generator)
+    except StopAsyncIteration:
+        raise RuntimeError(f'Generator factory of {definition.metadata.id} did not yield a component') from None
+
+
+def _build_argument_slots(graph: DependencyGraph) -> list[ArgumentSlots]:
+    return [_argument_slots(graph, node) for node in range(len(graph))]
+
+
+def _argument_slots(graph: DependencyGraph, node: int) -> ArgumentSlots:
+    parameters: list[Parameter] = graph.parameters
+    single: list[tuple[str, int]] = []
+    multiple: list[tuple[str, tuple[int, ...]]] = []
+    lazy: list[str] = []
+
+    for parameter in graph.parameter_range(node):
+        dependencies: array = graph.parameter_dependencies(parameter)
+
+        if len(dependencies) == 1:
+            single.append((parameters[parameter].name, dependencies[0]))
+        else:
+            multiple.append((parameters[parameter].name, tuple(dependencies)))
+
+        if parameters[parameter].lazy:
+            lazy.append(parameters[parameter].name)
+
+    return tuple(single), tuple(multiple), tuple(lazy)
 
-        return inflated_value
 
-    def _parameter_dependency_nodes(self, component_node: Hashable, graph: DiGraph) -> dict[str, list[Hashable]]:
-        assert graph.nodes[component_node].get('type') == NodeType.COMPONENT
+def _collect_arguments(slots: ArgumentSlots, values: list[Any] | dict[int, Any]) -> dict[str, Any]:
+    single, multiple, lazy = slots
+    arguments: dict[str, Any] = {name: values[dependency] for name, dependency in single}
 
-        parameter_nodes: list[Hashable] = list(graph.successors(component_node))
+    for name, dependencies in multiple:
+        arguments[name] = [values[dependency] for dependency in dependencies]
 
-        assert all([
-            graph.nodes[parameter_node].get('type') == NodeType.PARAMETER
-            for parameter_node in parameter_nodes
-        ])
+    for name in lazy:
+        arguments[name] = Lazy(arguments[name])
 
-        return {
-            graph.nodes[parameter_node].get('properties').name: list(graph.successors(parameter_node))
-            for parameter_node in parameter_nodes
-        }
+    return arguments
@@ -1,97 +1,247 @@
-from networkx import DiGraph, is_directed_acyclic_graph
+import operator
+from types import GenericAlias
+from typing import Any, get_args, get_origin
 
 from foxhound.core.di.dependency_resolver import DependencyResolver
 from foxhound.core.di.exceptions import UnsatisfiedDependenciesError
+from foxhound.core.di.graph.dependency_graph import DependencyGraph
 from foxhound.core.di.graph.exceptions import CyclicGraphError
-from foxhound.core.di.graph.models import NodeType
+from foxhound.core.di.kind_index import KindIndex
 from foxhound.core.di.models import ComponentDefinition, Parameter
+from foxhound.core.di.resolution_index import ResolutionIndex
+from foxhound.core.di.tracing import StartupTracer, trace_phase
 from foxhound.core.di.utils.parameters import parse_parameters
 from foxhound.core.models import Result
 
 
 class DependencyGraphMapper:
     _dependency_resolver: DependencyResolver
+    _tracer: StartupTracer | None
 
-    def __init__(self, dependency_resolver: DependencyResolver) -> None:
+    def __init__(self, dependency_resolver: DependencyResolver, tracer: StartupTracer | None = None) -> None:
         self._dependency_resolver = dependency_resolver
+        self._tracer = tracer
+
+    def map(self, component_definitions: list[ComponentDefinition]) -> Result[DependencyGraph]:
+        with trace_phase(self._tracer, 'map.index'):
+            resolution_index: ResolutionIndex = ResolutionIndex(component_definitions)
+            self._assert_unique_qualifiers(resolution_index)
+
+        with trace_phase(self._tracer, 'map.parameters'):
+            node_parameters: list[list[Parameter]] = self._map_components(component_definitions)
+            node_ids: dict[str, int] = {
+                definition.metadata.id: node for node, definition in enumerate(component_definitions)
+            }
+
+        with trace_phase(self._tracer, 'map.resolve'):
+            mapping_failures: dict[str, str] = {}
+            parameter_dependencies: list[list[int]] = self._map_dependencies(
+                node_parameters,
+                node_ids,
+                resolution_index,
+                mapping_failures
+            )
+            graph: DependencyGraph = DependencyGraph(component_definitions, node_parameters, parameter_dependencies)
 
-    def map(self, component_definitions: list[ComponentDefinition]) -> Result[DiGraph]:
-        self._assert_unique_qualifiers(component_definitions)
-
-        graph: DiGraph = DiGraph()
-        self._map_components(graph, component_definitions)
-
-        dependency_mapping: Result[None] = self._map_dependencies(graph, component_definitions)
+        if len(mapping_failures) != 0:
+            return Result.incomplete(graph, UnsatisfiedDependenciesError(mapping_failures))
 
-        if not dependency_mapping.successful:
-            return Result.incomplete(graph, dependency_mapping.exception)
+        with trace_phase(self._tracer, 'map.cycle_detection'):
+            acyclic: bool = graph.is_acyclic()
 
-        if not is_directed_acyclic_graph(graph):
+        if not acyclic:
             return Result.bad(graph, CyclicGraphError(graph))
 
         return Result.ok(graph)
 
-    def _map_components(self, graph: DiGraph, component_definitions: list[ComponentDefinition]) -> None:
-        for definition in component_definitions:
-            component_node_id: str = definition.metadata.id
+    def _map_components(self, component_definitions: list[ComponentDefinition]) -> list[list[Parameter]]:
+        return [parse_parameters(definition) for definition in component_definitions]
+
+    def remap(
+            self,
+            graph: DependencyGraph,
+            removed_nodes: set[int],
+            added_definitions: list[ComponentDefinition],
+            replaced_kinds: dict[type, type] | None = None
+    ) -> Result[tuple[DependencyGraph, set[int]]]:
+        # Only parameters the removed or added components could match are resolved again
+        replaced_kinds = {} if replaced_kinds is None else replaced_kinds
+        kept_nodes: list[int] = [node for node in range(len(graph)) if node not in removed_nodes]
+        changed_definitions: list[ComponentDefinition] = [
+            graph.definitions[node] for node in removed_nodes
+        ] + added_definitions
+        changed_kinds: KindIndex[type | GenericAlias] = KindIndex(lambda kind: kind)
+
+        for definition in changed_definitions:
+            changed_kinds.add(definition.metadata.kind)
+
+        changed_qualifiers: set[str] = {
+            definition.metadata.qualifier for definition in changed_definitions
+            if definition.metadata.qualifier is not None
+        }
 
-            graph.add_node(
-                component_node_id,
-                type=NodeType.COMPONENT,
-                definition=definition
-            )
+        component_definitions: list[ComponentDefinition] = [
+            graph.definitions[node] for node in kept_nodes
+        ] + added_definitions
+        resolution_index: ResolutionIndex = ResolutionIndex(component_definitions)
+        self._assert_unique_qualifiers(resolution_index)
+
+        kind_replacer: _KindReplacer = _KindReplacer(replaced_kinds)
+        node_parameters: list[list[Parameter]] = [
+            [kind_replacer.replace(graph.parameters[parameter]) for parameter in graph.parameter_range(node)]
+            for node in kept_nodes
+        ] + self._map_components(added_definitions)
+        node_ids: dict[str, int] = {
+            definition.metadata.id: node for node, definition in enumerate(component_definitions)
+        }
+        kept_node_ids: dict[int, int] = {previous_node: node for node, previous_node in enumerate(kept_nodes)}
+        may_match: dict[Any, bool] = {}
 
-            parameters: list[Parameter] = parse_parameters(definition)
+        parameter_dependencies: list[list[int]] = []
+        mapping_failures: dict[str, str] = {}
+        rewired_nodes: set[int] = set(range(len(kept_nodes), len(component_definitions)))
+
+        for node, parameters in enumerate(node_parameters):
+            previous_parameters: range | None = graph.parameter_range(kept_nodes[node]) if node < len(kept_nodes) else None
+
+            for offset, parameter in enumerate(parameters):
+                previous_dependencies: list[int] | None = None
+
+                if previous_parameters is not None:
+                    previous_dependencies = [
+                        kept_node_ids[dependency]
+                        for dependency in graph.parameter_dependencies(previous_parameters[offset])
+                        if dependency in kept_node_ids
+                    ]
+
+                    if (
+                            parameter is graph.parameters[previous_parameters[offset]]
+                            and not _may_match(parameter, changed_kinds, changed_qualifiers, may_match)
+                    ):
+                        parameter_dependencies.append(previous_dependencies)
+                        continue
+
+                dependencies: list[int] = self._resolve_parameter(
+                    parameter,
+                    node_ids,
+                    resolution_index,
+                    mapping_failures
+                )
+                parameter_dependencies.append(dependencies)
+
+                if dependencies != previous_dependencies:
+                    rewired_nodes.add(node)
 
-            for parameter in parameters:
-                parameter_node_id: str = f'{parameter.name}@{component_node_id}'
+        remapped_graph: DependencyGraph = DependencyGraph(component_definitions, node_parameters, parameter_dependencies)
+        mapping: tuple[DependencyGraph, set[int]] = (remapped_graph, rewired_nodes)
 
-                graph.add_node(
-                    parameter_node_id,
-                    type=NodeType.PARAMETER,
-                    properties=parameter
+        if len(mapping_failures) != 0:
+            return Result.incomplete(mapping, UnsatisfiedDependenciesError(mapping_failures))
+
+        if not remapped_graph.is_acyclic():
+            return Result.bad(mapping, CyclicGraphError(remapped_graph))
+
+        return Result.ok(mapping)
+
+    def _map_dependencies(
+            self,
+            node_parameters: list[list[Parameter]],
+            node_ids: dict[str, int],
+            resolution_index: ResolutionIndex,
+            mapping_failures: dict[str, str]
+    ) -> list[list[int]]:
+        return [
+            self._resolve_parameter(parameter, node_ids, resolution_index, mapping_failures)
+            for parameters in node_parameters
+            for parameter in parameters
+        ]
+
+    def _resolve_parameter(
+            self,
+            parameter: Parameter,
+            node_ids: dict[str, int],
+            resolution_index: ResolutionIndex,
+            mapping_failures: dict[str, str]
+    ) -> list[int]:
+        dependency_resolution: Result[list[str]] = self._dependency_resolver.try_resolve(parameter, resolution_index)
+
+        if not dependency_resolution.successful:
+            mapping_failures[parameter.name] = str(dependency_resolution.hint)
+            return []
+
+        return [node_ids[component_id] for component_id in dependency_resolution.unwrap()]
+
+    def _assert_unique_qualifiers(self, resolution_index: ResolutionIndex) -> None:
+        for qualifier, definitions in resolution_index.qualified_definitions().items():
+            if len(definitions) > 1:
+                raise ValueError(
+                    f'{len(definitions)} components are qualified with "{qualifier}". '
+                    f'Qualifiers must be unique.'
                 )
 
-                graph.add_edge(component_node_id, parameter_node_id)
 
-    def _map_dependencies(self, graph: DiGraph, definitions: list[ComponentDefinition]) -> Result[None]:
-        all_parameters: dict[str, Parameter] = self._filter_parameter_nodes(graph)
-        mapping_failures: dict[str, str] = {}
+def _may_match(
+        parameter: Parameter,
+        kinds: KindIndex[type | GenericAlias],
+        qualifiers: set[str],
+        memo: dict[Any, bool]
+) -> bool:
+    if parameter.qualifier in qualifiers:
+        return True
 
-        for parameter_node_id, parameter in all_parameters.items():
-            dependency_resolution: Result[list[str]] = self._dependency_resolver.try_resolve(parameter, definitions)
+    try:
+        return memo[parameter.kind]
+    except KeyError:
+        pass
+    except TypeError:
+        return _may_match_kind(parameter.kind, kinds)
 
-            if dependency_resolution.successful:
-                for component_id in dependency_resolution.value:
-                    graph.add_edge(parameter_node_id, component_id)
-            else:
-                mapping_failures[parameter.name] = dependency_resolution.hint
+    memo[parameter.kind] = _may_match_kind(parameter.kind, kinds)
+    return memo[parameter.kind]
 
-        if len(mapping_failures) != 0:
-            return Result.error(UnsatisfiedDependenciesError(mapping_failures))
 
-        return Result.ok(None)
+def _may_match_kind(kind: type | GenericAlias, kinds: KindIndex[type | GenericAlias]) -> bool:
+    if len(kinds.find(kind)) != 0:
+        return True
 
-    def _assert_unique_qualifiers(self, component_definitions: list[ComponentDefinition]) -> None:
-        for definition in component_definitions:
-            qualifier: str | None = definition.metadata.qualifier
+    return get_origin(kind) is list and len(kinds.find(get_args(kind)[0])) != 0
 
-            if qualifier is None:
-                continue
 
-            qualifier_count: int = len([
-                d for d in component_definitions
-                if d.metadata.qualifier == qualifier
-            ])
+class _KindReplacer:
+    _replaced_kinds: dict[Any, type]
+    _replacements: dict[Any, Any]
 
-            if qualifier_count > 1:
-                raise ValueError(
-                    f'{qualifier_count} components are qualified with "{qualifier}". '
-                    f'Qualifiers must be unique.'
-                )
+    def __init__(self, replaced_kinds: dict[type, type]):
+        self._replaced_kinds = replaced_kinds
+        self._replacements = {}
 
-    def _filter_parameter_nodes(self, graph: DiGraph) -> dict[str, Parameter]:
-        return {
-            node_id: additional_data['properties'] for node_id, additional_data in graph.nodes(data=True)
-            if additional_data['type'] == NodeType.PARAMETER
-        }
+    def replace(self, parameter: Parameter) -> Parameter:
+        if len(self._replaced_kinds) == 0:
+            return parameter
+
+        try:
+            kind: type | GenericAlias = self._replacements[parameter.kind]
+        except KeyError:
+            kind = self._replacements[parameter.kind] = self._replace(parameter.kind)
+        except TypeError:
+            kind = self._replace(parameter.kind)
+
+        return parameter if kind is parameter.kind else parameter.model_copy({'kind': kind})
+
+    def _replace(self, kind: type | GenericAlias) -> type | GenericAlias:
+        origin: Any = get_origin(kind)
+
+        if origin is None:
+            return self._replaced_kinds.get(kind, kind)
+
+        arguments: tuple[Any, ...] = get_args(kind)
+        replaced_arguments: tuple[Any, ...] = tuple(self._replace(argument) for argument in arguments)
+        replaced_origin: Any = self._replaced_kinds.get(origin, origin)
+
+        if replaced_origin is origin and all(map(operator.is_, replaced_arguments, arguments)):
+            return kind
+
+        replaced_kind: GenericAlias = replaced_origin[
+            replaced_arguments if len(replaced_arguments) != 1 else replaced_arguments[0]
+        ]
+        return replaced_kind
@@ -0,0 +1,104 @@
+from collections.abc import Callable, Hashable, Iterable
+from types import GenericAlias
+from typing import Any, Generic, TypeVar, get_args, get_origin
+
+from foxhound.core.utils.typing import is_assignable_to, type_cache_generation
+
+T = TypeVar('T')
+
+
+class KindIndex(Generic[T]):
+    _kind_of: Callable[[T], type | GenericAlias]
+    _entries: dict[int, T]
+    _buckets: dict[Hashable, dict[int, T]]
+    _scanned: dict[Hashable, tuple[int, list[T]]]
+    _scanned_generation: int
+    _unindexed: dict[int, T]
+    _version: int
+
+    def __init__(self, kind_of: Callable[[T], type | GenericAlias]):
+        self._kind_of = kind_of
+        self._entries = {}
+        self._buckets = {}
+        self._scanned = {}
+        self._scanned_generation = type_cache_generation()
+        self._unindexed = {}
+        self._version = 0
+
+    def add(self, entry: T) -> None:
+        self._entries[id(entry)] = entry
+        self._version += 1
+        self._scanned.clear()
+
+        try:
+            for key in _index_keys(self._kind_of(entry)):
+                self._buckets.setdefault(key, {})[id(entry)] = entry
+        except TypeError:
+            # Unhashable generic arguments cannot be indexed
+            self._unindexed[id(entry)] = entry
+
+    def remove(self, entry: T) -> None:
+        del self._entries[id(entry)]
+        self._version += 1
+        self._scanned.clear()
+
+        if self._unindexed.pop(id(entry), None) is not None:
+            return
+
+        for key in _index_keys(self._kind_of(entry)):
+            del self._buckets[key][id(entry)]
+
+    def copy(self) -> 'KindIndex[T]':
+        copied: KindIndex[T] = KindIndex(self._kind_of)
+        copied._entries = dict(self._entries)
+        copied._buckets = {key: dict(bucket) for key, bucket in self._buckets.items()}
+        copied._unindexed = dict(self._unindexed)
+        return copied
+
+    def find(self, kind: type | GenericAlias) -> list[T]:
+        try:
+            key: Hashable = _lookup_key(kind)
+
+            if not _requires_scan(kind):
+                bucket: dict[int, T] = self._buckets.get(key, {})
+                return [*bucket.values(), *self._scan(kind, self._unindexed.values())]
+
+            if self._scanned_generation != type_cache_generation():
+                self._scanned.clear()
+                self._scanned_generation = type_cache_generation()
+
+            # Tagged with the version scanned, so a scan racing with add() or remove() is never served again
+            version: int = self._version
+            scanned: tuple[int, list[T]] | None = self._scanned.get(key)
+
+            if scanned is None or scanned[0] != version:
+                scanned = self._scanned[key] = (version, self._scan(kind, list(self._entries.values())))
+
+            return list(scanned[1])
+        except TypeError:
+            return self._scan(kind, self._entries.values())
+
+    def _scan(self, kind: type | GenericAlias, entries: Iterable[T]) -> list[T]:
+        return [entry for entry in entries if is_assignable_to(self._kind_of(entry), kind)]
+
+
+def _index_keys(kind: type | GenericAlias) -> list[Hashable]:
+    origin: Any = get_origin(kind)
+
+    if origin is None:
+        return list(getattr(kind, '__mro__', (kind,)))
+
+    args: tuple[Any, ...] = get_args(kind)
+    return [(base, args) for base in getattr(origin, '__mro__', (origin,))]
+
+
+def _lookup_key(kind: type | GenericAlias) -> Hashable:
+    origin: Any = get_origin(kind)
+    return kind if origin is None else (origin, get_args(kind))
+
+
+def _requires_scan(kind: type | GenericAlias) -> bool:
+    # Virtual subclasses (ABCs, protocols) never show up in an MRO, so only a full check can find them
+    target: Any = get_origin(kind) or kind
+    subclass_check: Any = type(target).__subclasscheck__
+    return subclass_check is not type.__subclasscheck__
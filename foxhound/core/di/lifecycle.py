@@ -0,0 +1,278 @@
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from collections.abc import AsyncGenerator, Awaitable, Generator
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any
+
+from foxhound.core.di.container import Container
+from foxhound.core.di.exceptions import ComponentShutdownError
+from foxhound.core.di.finalizers import Finalizer, run_finalizer, value_finalizer
+from foxhound.core.di.graph.dependency_graph import DependencyGraph
+from foxhound.core.di.models import Component
+from foxhound.core.di.pool import ComponentPool
+from foxhound.core.di.proxies import ContextProxy, LazyProxy, PooledProxy
+
+
+def shutdown(container: Container, timeout: float | None = None) -> None:
+    if not container.inflated:
+        return
+
+    graph: DependencyGraph = _shutdown_graph(container)
+    finalizers: dict[int, Finalizer] = _collect_finalizers(container, graph)
+    pending: list[int] = [len(dependents) for dependents in graph.dependents()]
+    ready: list[int] = [node for node in range(len(graph)) if pending[node] == 0]
+    running: dict[Future, tuple[int, float | None]] = {}
+    failures: dict[str, BaseException] = {}
+
+    while len(ready) != 0 or len(running) != 0:
+        while len(ready) != 0:
+            node: int = ready.pop()
+
+            if node in finalizers:
+                deadline: float | None = None if timeout is None else time.monotonic() + timeout
+                running[_run_in_thread(finalizers[node])] = (node, deadline)
+            else:
+                _release(graph, node, pending, ready)
+
+        if len(running) == 0:
+            break
+
+        deadlines: list[float] = [deadline for _, deadline in running.values() if deadline is not None]
+        done, _ = wait(
+            running,
+            timeout=None if len(deadlines) == 0 else max(min(deadlines) - time.monotonic(), 0),
+            return_when=FIRST_COMPLETED
+        )
+        now: float = time.monotonic()
+
+        for future, (node, deadline) in list(running.items()):
+            if future in done:
+                exception: BaseException | None = future.exception()
+
+                if exception is not None:
+                    failures[graph.definitions[node].metadata.id] = exception
+            elif deadline is not None and now >= deadline:
+                failures[graph.definitions[node].metadata.id] = TimeoutError(
+                    f'Did not shut down within {timeout} seconds'
+                )
+            else:
+                continue
+
+            del running[future]
+            _release(graph, node, pending, ready)
+
+    container.inflated = False
+
+    if len(failures) != 0:
+        raise ComponentShutdownError(failures)
+
+
+async def shutdown_async(container: Container, timeout: float | None = None) -> None:
+    if not container.inflated:
+        return
+
+    graph: DependencyGraph = _shutdown_graph(container)
+    finalizers: dict[int, Finalizer] = _collect_finalizers(container, graph)
+    pending: list[int] = [len(dependents) for dependents in graph.dependents()]
+    ready: list[int] = [node for node in range(len(graph)) if pending[node] == 0]
+    running: dict[asyncio.Task, int] = {}
+    failures: dict[str, BaseException] = {}
+
+    while len(ready) != 0 or len(running) != 0:
+        while len(ready) != 0:
+            node: int = ready.pop()
+
+            if node in finalizers:
+                running[asyncio.ensure_future(_finalize_async(finalizers[node], timeout))] = node
+            else:
+                _release(graph, node, pending, ready)
+
+        if len(running) == 0:
+            break
+
+        done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+        for task in done:
+            node = running.pop(task)
+            exception: BaseException | None = task.exception()
+
+            if exception is not None:
+                failures[graph.definitions[node].metadata.id] = exception
+
+            _release(graph, node, pending, ready)
+
+    container.inflated = False
+
+    if len(failures) != 0:
+        raise ComponentShutdownError(failures)
+
+
+def finalize_replaced(container: Container, graph: DependencyGraph, components: list[Component[Any]]) -> None:
+    finalizers: dict[int, Finalizer] = _replaced_finalizers(container, graph, components)
+    failures: dict[str, BaseException] = {}
+
+    for node in reversed(graph.in_topological_order(set(finalizers))):
+        try:
+            _run_in_thread(finalizers[node]).result()
+        except Exception as e:
+            failures[graph.definitions[node].metadata.id] = e
+
+    if len(failures) != 0:
+        raise ComponentShutdownError(failures)
+
+
+async def finalize_replaced_async(
+        container: Container,
+        graph: DependencyGraph,
+        components: list[Component[Any]]
+) -> None:
+    finalizers: dict[int, Finalizer] = _replaced_finalizers(container, graph, components)
+    failures: dict[str, BaseException] = {}
+
+    for node in reversed(graph.in_topological_order(set(finalizers))):
+        try:
+            await _finalize_async(finalizers[node], None)
+        except Exception as e:
+            failures[graph.definitions[node].metadata.id] = e
+
+    if len(failures) != 0:
+        raise ComponentShutdownError(failures)
+
+
+def _replaced_finalizers(
+        container: Container,
+        graph: DependencyGraph,
+        components: list[Component[Any]]
+) -> dict[int, Finalizer]:
+    finalizers: dict[int, Finalizer] = {}
+
+    for component in components:
+        if component.metadata.id in container.overridden_ids:
+            continue
+
+        finalizer: Finalizer | None = _component_finalizer(component)
+
+        if finalizer is not None:
+            finalizers[graph.node_id(component.metadata.id)] = finalizer
+
+    return finalizers
+
+
+def _shutdown_graph(container: Container) -> DependencyGraph:
+    if container.graph is None:
+        raise RuntimeError('Only containers created by start() can be shut down')
+
+    return container.graph
+
+
+def _collect_finalizers(container: Container, graph: DependencyGraph) -> dict[int, Finalizer]:
+    # Inherited components belong to the parent, overrides to whoever passed them
+    finalizers: dict[int, Finalizer] = {}
+
+    for component in container.local_components():
+        if component.metadata.id in container.overridden_ids:
+            continue
+
+        finalizer: Finalizer | None = _component_finalizer(component)
+
+        if finalizer is not None:
+            finalizers[graph.node_id(component.metadata.id)] = finalizer
+
+    return finalizers
+
+
+def _release(graph: DependencyGraph, node: int, pending: list[int], ready: list[int]) -> None:
+    for dependency in graph.dependencies(node):
+        pending[dependency] -= 1
+
+        if pending[dependency] == 0:
+            ready.append(dependency)
+
+
+def _component_finalizer(component: Component[Any]) -> Finalizer | None:
+    if isinstance(component.cleanup, Generator):
+        return functools.partial(_resume_generator, component.cleanup)
+
+    if isinstance(component.cleanup, AsyncGenerator):
+        return functools.partial(_resume_async_generator, component.cleanup)
+
+    value: Any = component.value
+
+    if isinstance(value, PooledProxy):
+        return functools.partial(_drain_pool, object.__getattribute__(value, '_foxhound_pool'))
+
+    if isinstance(value, ContextProxy):
+        return None
+
+    if isinstance(value, LazyProxy):
+        if not object.__getattribute__(value, '_foxhound_resolved')():
+            return None
+
+        value = object.__getattribute__(value, '_foxhound_instance')
+
+    return value_finalizer(value)
+
+
+def _resume_generator(generator: Generator[Any, None, None]) -> None:
+    try:
+        next(generator)
+    except StopIteration:
+        return
+
+    generator.close()
+    raise RuntimeError('Generator factories must yield exactly once')
+
+
+async def _resume_async_generator(generator: AsyncGenerator[Any, None]) -> None:
+    try:
+        await anext(generator)
+    except StopAsyncIteration:
+        return
+
+    await generator.aclose()
+    raise RuntimeError('Generator factories must yield exactly once')
+
+
+def _drain_pool(pool: ComponentPool[Any]) -> None:
+    finalizers: list[Finalizer] = [
+        finalizer for finalizer in map(value_finalizer, pool.drain())
+        if finalizer is not None
+    ]
+
+    for finalizer in finalizers:
+        run_finalizer(finalizer)
+
+
+async def _finalize_async(finalizer: Finalizer, timeout: float | None) -> None:
+    awaitable: Awaitable[Any]
+
+    if inspect.iscoroutinefunction(finalizer):
+        awaitable = finalizer()
+    else:
+        awaitable = asyncio.wrap_future(_run_in_thread(finalizer))
+
+    try:
+        await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f'Did not shut down within {timeout} seconds') from None
+
+
+def _run_in_thread(finalizer: Finalizer) -> Future:
+    # Daemon threads rather than an executor, so a finalizer that never returns can be abandoned
+    future: Future = Future()
+
+    def run() -> None:
+        future.set_running_or_notify_cancel()
+
+        try:
+            run_finalizer(finalizer)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(None)
+
+    threading.Thread(target=run, name='foxhound-shutdown', daemon=True).start()
+    return future
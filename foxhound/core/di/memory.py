@@ -0,0 +1,62 @@
+import sys
+from collections.abc import Hashable
+from typing import Any
+
+from foxhound.core.di.container import Container
+from foxhound.core.di.models import Component, MemoryUsage
+from foxhound.core.di.pool import ComponentPool
+from foxhound.core.di.proxies import ComponentProxy, ContextProxy, LazyProxy, PooledProxy
+from foxhound.core.utils.memory import deep_size, shallow_size
+
+
+def memory_usage(container: Container, deep: bool = False) -> list[MemoryUsage]:
+    components: list[Component[Any]] = container.components()
+    retained: list[list[Any]] = [_retained_objects(component.value) for component in components]
+    excluded: set[int] = {id(component.value) for component in components}
+    excluded.update(id(instance) for instances in retained for instance in instances)
+    seen: set[int] = set()
+    groups: dict[Hashable, MemoryUsage] = {}
+
+    for component, instances in zip(components, retained, strict=True):
+        size: int = sys.getsizeof(component.value) if isinstance(component.value, ComponentProxy) else 0
+
+        for instance in instances:
+            size += deep_size(instance, excluded, seen) if deep else shallow_size(instance)
+
+        kind: Any = component.metadata.kind
+        qualifier: str | None = component.metadata.qualifier
+        key: Hashable = _group_key(kind, qualifier)
+        group: MemoryUsage | None = groups.get(key)
+
+        if group is None:
+            groups[key] = MemoryUsage(kind=kind, qualifier=qualifier, components=1, size=size)
+        else:
+            group.components += 1
+            group.size += size
+
+    return sorted(groups.values(), key=lambda group: group.size, reverse=True)
+
+
+def _retained_objects(value: Any) -> list[Any]:
+    if isinstance(value, LazyProxy):
+        if not object.__getattribute__(value, '_foxhound_resolved')():
+            return []
+
+        return [object.__getattribute__(value, '_foxhound_instance')]
+
+    if isinstance(value, PooledProxy):
+        pool: ComponentPool[Any] = object.__getattribute__(value, '_foxhound_pool')
+        return pool.idle_instances()
+
+    if isinstance(value, ContextProxy):
+        return []
+
+    return [value]
+
+
+def _group_key(kind: Any, qualifier: str | None) -> Hashable:
+    try:
+        hash(kind)
+        return kind, qualifier
+    except TypeError:
+        return repr(kind), qualifier
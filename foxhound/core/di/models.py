@@ -1,35 +1,130 @@
-from collections.abc import Callable
+import dataclasses
+from collections.abc import AsyncGenerator, Callable, Generator
+from enum import Enum
 from types import GenericAlias
-from typing import Generic, TypeVar, get_origin
-
-from pydantic import model_validator
+from typing import Any, Generic, TypeVar, get_origin
 
 from foxhound.core.models import BaseModel
 
 T = TypeVar('T')
 
+
+class Scope(Enum):
+    SINGLETON = 'singleton'
+    POOLED = 'pooled'
+    CONTEXT = 'context'
+    EVICTABLE = 'evictable'
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class PoolSettings(BaseModel):
+    min_size: int = 0
+    max_size: int = 8
+    borrow_timeout: float | None = None
+    idle_timeout: float | None = None
+
+    def validate(self) -> None:
+        if self.max_size < 1 or not 0 <= self.min_size <= self.max_size:
+            raise ValueError(f'Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1, got {self}')
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class PoolStatistics(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    waits: int = 0
+    wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    evictions: int = 0
+    size: int = 0
+    idle: int = 0
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class EvictionSettings(BaseModel):
+    max_components: int | None = None
+    max_size: int | None = None
+    deep: bool = True
+
+    def validate(self) -> None:
+        if self.max_components is not None and self.max_components < 1:
+            raise ValueError(f'max_components must be at least 1, got {self.max_components}')
+
+        if self.max_size is not None and self.max_size < 1:
+            raise ValueError(f'max_size must be at least 1 byte, got {self.max_size}')
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class EvictionStatistics(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    resident: int = 0
+    size: int = 0
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class MemoryUsage(BaseModel):
+    kind: type | GenericAlias
+    qualifier: str | None = None
+    components: int
+    size: int
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class TraceSpan(BaseModel):
+    name: str
+    category: str
+    start: int
+    duration: int
+    thread_id: int
+    task: str | None = None
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
 class Parameter(BaseModel):
     name: str
     kind: type | GenericAlias
     qualifier: str | None = None
     parent_component_id: str
+    lazy: bool = False
 
+    def validate(self) -> None:
+        _validate_kind(self.kind, f'Parameter "{self.name}" of {self.parent_component_id}')
 
+
+@dataclasses.dataclass(slots=True, kw_only=True)
 class ComponentMetadata(BaseModel):
     id: str
     qualifier: str | None = None
     primary: bool = False
+    lazy: bool = False
+    scope: Scope = Scope.SINGLETON
+    pool: PoolSettings | None = None
     kind: type | GenericAlias
 
+    def validate(self) -> None:
+        if not isinstance(self.id, str):
+            raise ValueError(f'Component id must be a string, but got {type(self.id)}')
+
+        if self.qualifier is not None and not isinstance(self.qualifier, str):
+            raise ValueError(f'Qualifier of {self.id} must be a string, but got {type(self.qualifier)}')
 
+        _validate_kind(self.kind, f'Kind of {self.id}')
+
+        if self.pool is not None:
+            self.pool.validate()
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
 class Component(BaseModel, Generic[T]):
     metadata: ComponentMetadata
     value: T
+    cleanup: Generator[Any, None, None] | AsyncGenerator[Any, None] | None = None
 
-    @model_validator(mode='after')
-    def _validate_type_match(self) -> 'Component[T]':
+    def validate(self) -> None:
         kind: type | GenericAlias = self.metadata.kind
-        expected_type: type | GenericAlias = kind if get_origin(kind) is None else get_origin(kind)
+        expected_type: Any = kind if get_origin(kind) is None else get_origin(kind)
         actual_value: T = self.value
 
         if not isinstance(actual_value, expected_type):
@@ -38,11 +133,20 @@ class Component(BaseModel, Generic[T]):
                 f'but got {type(actual_value)}'
             )
 
-        return self
-
 
+@dataclasses.dataclass(slots=True, kw_only=True)
 class ComponentDefinition(BaseModel, Generic[T]):
     metadata: ComponentMetadata
     inflator: Callable[..., T]
-    param_qualifiers: dict[str, str] = {}
+    param_qualifiers: dict[str, str] = dataclasses.field(default_factory=dict)
+
+    def validate(self) -> None:
+        self.metadata.validate()
+
+        if not callable(self.inflator):
+            raise ValueError(f'Inflator of {self.metadata.id} is not callable')
+
 
+def _validate_kind(kind: Any, subject: str) -> None:
+    if not isinstance(kind, type) and get_origin(kind) is None:
+        raise ValueError(f'{subject} must be a type or a generic alias, but got {kind!r}')
@@ -0,0 +1,141 @@
+import ast
+import contextlib
+import json
+import logging
+import os
+import pkgutil
+import tempfile
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+
+_MARKER_NAMES: frozenset[str] = frozenset({'component', 'configuration', 'define_component', 'embed_definition'})
+
+_PROCESS_POOL_MIN_FILES: int = 256
+
+
+class ModuleIndex:
+    _path: str | None
+    _entries: dict[str, tuple[int, int, bool]]
+    _max_workers: int | None
+
+    def __init__(self, path: str | None = None, max_workers: int | None = None):
+        self._path = path
+        self._entries = {}
+        self._max_workers = max_workers
+
+        if path is not None and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self._entries = {file: tuple(entry) for file, entry in json.load(f).items()}
+            except (OSError, ValueError, TypeError):
+                self._entries = {}
+
+    def find_component_modules(self, package: ModuleType) -> list[str]:
+        sources: dict[str, str | None] = _find_submodule_sources(package.__path__, f'{package.__name__}.')
+        fingerprints: dict[str, tuple[int, int]] = {}
+        stale_files: list[str] = []
+
+        for file in sources.values():
+            if file is None:
+                continue
+
+            stat: os.stat_result = os.stat(file)
+            fingerprints[file] = (stat.st_mtime_ns, stat.st_size)
+            entry: tuple[int, int, bool] | None = self._entries.get(file)
+
+            if entry is None or entry[:2] != fingerprints[file]:
+                stale_files.append(file)
+
+        if len(stale_files) != 0:
+            for file, references in zip(stale_files, self._references_components(stale_files), strict=True):
+                self._entries[file] = (*fingerprints[file], references)
+
+            self._save()
+
+        return [
+            module_name for module_name, file in sources.items()
+            if file is None or self._entries[file][2]
+        ]
+
+    def _references_components(self, files: list[str]) -> list[bool]:
+        workers: int = self._max_workers or os.cpu_count() or 1
+
+        if len(files) >= _PROCESS_POOL_MIN_FILES and workers > 1:
+            try:
+                with ProcessPoolExecutor(workers) as executor:
+                    chunk_size: int = max(len(files) // (4 * workers), 1)
+                    return list(executor.map(_references_components, files, chunksize=chunk_size))
+            except (OSError, BrokenProcessPool):
+                pass
+
+        return [_references_components(file) for file in files]
+
+    def _save(self) -> None:
+        if self._path is None:
+            return
+
+        directory: str = os.path.dirname(os.path.abspath(self._path))
+        temporary_path: str | None = None
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile('w', dir=directory, delete=False) as f:
+                temporary_path = f.name
+                json.dump(self._entries, f)
+
+            os.replace(temporary_path, self._path)
+        except OSError:
+            logging.getLogger('foxhound').warning('Failed to save the module index to %s', self._path, exc_info=True)
+
+            if temporary_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(temporary_path)
+
+
+def _find_submodule_sources(paths: Iterable[str], prefix: str) -> dict[str, str | None]:
+    sources: dict[str, str | None] = {}
+
+    for module_info in pkgutil.iter_modules(paths, prefix):
+        spec: ModuleSpec | None = module_info.module_finder.find_spec(module_info.name, None)
+
+        if spec is None:
+            continue
+
+        origin: str | None = spec.origin if spec.origin is not None and spec.origin.endswith('.py') else None
+        sources[module_info.name] = origin
+
+        if module_info.ispkg and spec.submodule_search_locations is not None:
+            sources.update(_find_submodule_sources(spec.submodule_search_locations, f'{module_info.name}.'))
+
+    return sources
+
+
+def _references_components(file: str) -> bool:
+    with open(file, 'rb') as f:
+        source: bytes = f.read()
+
+    if not any(marker.encode() in source for marker in _MARKER_NAMES):
+        return False
+
+    try:
+        tree: ast.Module = ast.parse(source, filename=file)
+    except SyntaxError:
+        return True
+
+    aliases: set[str] = set(_MARKER_NAMES)
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            aliases.update(alias.asname for alias in node.names if alias.name in _MARKER_NAMES and alias.asname)
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id in aliases:
+            return True
+        if isinstance(node, ast.Attribute) and node.attr in _MARKER_NAMES:
+            return True
+
+    return False
@@ -0,0 +1,138 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from foxhound.core.di.exceptions import PoolExhaustedError
+from foxhound.core.di.finalizers import close_dropped
+from foxhound.core.di.models import PoolSettings, PoolStatistics
+
+T = TypeVar('T')
+
+
+class ComponentPool(Generic[T]):
+    _factory: Callable[[], T]
+    _settings: PoolSettings
+    _idle: deque[tuple[T, float]]
+    _size: int
+    _condition: threading.Condition
+    _statistics: PoolStatistics
+    _sweep: threading.Timer | None
+    _drained: bool
+
+    def __init__(self, factory: Callable[[], T], settings: PoolSettings, prefill: bool = True):
+        self._factory = factory
+        self._settings = settings
+        self._idle = deque()
+        self._size = 0
+        self._condition = threading.Condition()
+        self._statistics = PoolStatistics()
+        self._sweep = None
+        self._drained = False
+
+        if prefill:
+            for _ in range(settings.min_size):
+                self._idle.append((factory(), time.monotonic()))
+                self._size += 1
+
+    def borrow(self) -> T:
+        started: float = time.monotonic()
+        deadline: float | None = None
+
+        if self._settings.borrow_timeout is not None:
+            deadline = started + self._settings.borrow_timeout
+
+        waited: bool = False
+
+        with self._condition:
+            while len(self._idle) == 0 and self._size >= self._settings.max_size:
+                remaining: float | None = None if deadline is None else deadline - time.monotonic()
+
+                if remaining is not None and remaining <= 0:
+                    raise PoolExhaustedError(
+                        f'No pooled instance became available within {self._settings.borrow_timeout} seconds'
+                    )
+
+                waited = True
+                self._condition.wait(remaining)
+
+            if waited:
+                wait_time: float = time.monotonic() - started
+                self._statistics.waits += 1
+                self._statistics.wait_time += wait_time
+                self._statistics.max_wait_time = max(self._statistics.max_wait_time, wait_time)
+
+            if len(self._idle) != 0:
+                self._statistics.hits += 1
+                return self._idle.pop()[0]
+
+            self._statistics.misses += 1
+            self._size += 1
+
+        try:
+            return self._factory()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, instance: T) -> None:
+        now: float = time.monotonic()
+
+        with self._condition:
+            if self._drained:
+                self._size -= 1
+                self._condition.notify()
+                evicted: list[T] = [instance]
+            else:
+                self._idle.append((instance, now))
+                self._condition.notify()
+                evicted = self._evict_idle(now)
+
+        close_dropped(evicted)
+
+    def idle_instances(self) -> list[T]:
+        with self._condition:
+            return [instance for instance, _ in self._idle]
+
+    def drain(self) -> list[T]:
+        with self._condition:
+            self._drained = True
+            instances: list[T] = [instance for instance, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(instances)
+            return instances
+
+    def statistics(self) -> PoolStatistics:
+        with self._condition:
+            return self._statistics.model_copy(update={'size': self._size, 'idle': len(self._idle)})
+
+    def _evict_idle(self, now: float) -> list[T]:
+        # Called with the lock held
+        idle_timeout: float | None = self._settings.idle_timeout
+        evicted: list[T] = []
+
+        if idle_timeout is None:
+            return evicted
+
+        while len(self._idle) != 0 and self._size > self._settings.min_size and now - self._idle[0][1] >= idle_timeout:
+            evicted.append(self._idle.popleft()[0])
+            self._size -= 1
+            self._statistics.evictions += 1
+
+        if self._sweep is None and len(self._idle) != 0 and self._size > self._settings.min_size:
+            self._sweep = threading.Timer(self._idle[0][1] + idle_timeout - now, self._sweep_idle)
+            self._sweep.name = 'foxhound-pool-sweep'
+            self._sweep.daemon = True
+            self._sweep.start()
+
+        return evicted
+
+    def _sweep_idle(self) -> None:
+        with self._condition:
+            self._sweep = None
+            evicted: list[T] = self._evict_idle(time.monotonic())
+
+        close_dropped(evicted)
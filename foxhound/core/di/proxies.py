@@ -0,0 +1,348 @@
+import abc
+import threading
+from collections.abc import Callable
+from contextvars import ContextVar
+from types import GenericAlias
+from typing import Any, Generic, TypeVar, cast, get_origin
+
+from foxhound.core.di.context import context_instances
+from foxhound.core.di.eviction import EvictionTracker
+from foxhound.core.di.exceptions import NoActiveContextError
+from foxhound.core.di.finalizers import close_dropped
+from foxhound.core.di.pool import ComponentPool
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+_UNRESOLVED: Any = object()
+
+# Served by the proxy itself, every other attribute is looked up on the proxied instance
+_PROXY_ATTRIBUTES: frozenset[str] = frozenset({
+    '__class__',
+    '_foxhound_kind',
+    '_foxhound_target',
+    '_foxhound_apply',
+    '_foxhound_factory',
+    '_foxhound_instance',
+    '_foxhound_lock',
+    '_foxhound_resolved',
+    '_foxhound_pool',
+    '_foxhound_borrowed',
+    '_foxhound_component_id',
+    '_foxhound_tracker',
+    '_foxhound_evict',
+})
+
+
+class ComponentProxy(abc.ABC):
+    __slots__ = ('_foxhound_kind',)
+
+    _foxhound_kind: type | GenericAlias
+
+    def __init__(self, kind: type | GenericAlias):
+        object.__setattr__(self, '_foxhound_kind', kind)
+
+    @abc.abstractmethod
+    def _foxhound_target(self) -> Any:
+        ...
+
+    def _foxhound_apply(self, operation: Callable[[Any], R]) -> R:
+        return operation(self._foxhound_target())
+
+    # Read-only on purpose - assigning __class__ goes through __setattr__, which forwards it to the instance
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:
+        kind: type | GenericAlias = object.__getattribute__(self, '_foxhound_kind')
+        return get_origin(kind) or cast(type, kind)
+
+    def __getattribute__(self, name: str) -> Any:
+        if name in _PROXY_ATTRIBUTES:
+            return object.__getattribute__(self, name)
+
+        return getattr(object.__getattribute__(self, '_foxhound_target')(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._foxhound_apply(lambda target: setattr(target, name, value))
+
+    def __delattr__(self, name: str) -> None:
+        self._foxhound_apply(lambda target: delattr(target, name))
+
+    def __repr__(self) -> str:
+        return self._foxhound_apply(repr)
+
+    def __str__(self) -> str:
+        return self._foxhound_apply(str)
+
+    def __bool__(self) -> bool:
+        return self._foxhound_apply(bool)
+
+    def __eq__(self, other: object) -> Any:
+        return self._foxhound_apply(lambda target: target == other)
+
+    def __hash__(self) -> int:
+        return self._foxhound_apply(hash)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._foxhound_apply(lambda target: target(*args, **kwargs))
+
+    def __len__(self) -> int:
+        return self._foxhound_apply(len)
+
+    def __iter__(self) -> Any:
+        return self._foxhound_apply(iter)
+
+    def __contains__(self, item: object) -> bool:
+        return self._foxhound_apply(lambda target: item in target)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._foxhound_apply(lambda target: target[key])
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._foxhound_apply(lambda target: target.__setitem__(key, value))
+
+    def __delitem__(self, key: Any) -> None:
+        self._foxhound_apply(lambda target: target.__delitem__(key))
+
+    def __enter__(self) -> Any:
+        return self._foxhound_apply(lambda target: target.__enter__())
+
+    def __exit__(self, *exc_info: Any) -> Any:
+        return self._foxhound_apply(lambda target: target.__exit__(*exc_info))
+
+
+class LazyProxy(ComponentProxy):
+    __slots__ = ('_foxhound_factory', '_foxhound_instance', '_foxhound_lock')
+
+    _foxhound_factory: Callable[[], Any] | None
+    _foxhound_instance: Any
+    _foxhound_lock: threading.Lock
+
+    def __init__(self, kind: type | GenericAlias, factory: Callable[[], Any]):
+        super().__init__(kind)
+        object.__setattr__(self, '_foxhound_factory', factory)
+        object.__setattr__(self, '_foxhound_instance', _UNRESOLVED)
+        object.__setattr__(self, '_foxhound_lock', threading.Lock())
+
+    def __getattribute__(self, name: str) -> Any:
+        if name in _PROXY_ATTRIBUTES:
+            return object.__getattribute__(self, name)
+
+        instance: Any = object.__getattribute__(self, '_foxhound_instance')
+
+        if instance is _UNRESOLVED:
+            instance = object.__getattribute__(self, '_foxhound_target')()
+
+        return getattr(instance, name)
+
+    def _foxhound_target(self) -> Any:
+        instance: Any = object.__getattribute__(self, '_foxhound_instance')
+
+        if instance is not _UNRESOLVED:
+            return instance
+
+        with object.__getattribute__(self, '_foxhound_lock'):
+            instance = object.__getattribute__(self, '_foxhound_instance')
+
+            if instance is _UNRESOLVED:
+                instance = object.__getattribute__(self, '_foxhound_factory')()
+                object.__setattr__(self, '_foxhound_instance', instance)
+                object.__setattr__(self, '_foxhound_factory', None)
+
+        return instance
+
+    def _foxhound_resolved(self) -> bool:
+        return object.__getattribute__(self, '_foxhound_instance') is not _UNRESOLVED
+
+
+class Lazy(Generic[T]):
+    __slots__ = ('_value',)
+
+    _value: Any
+
+    def __init__(self, value: Any):
+        self._value = value
+
+    def get(self) -> T:
+        instance: T = _unwrap(self._value)
+        return instance
+
+
+def _unwrap(value: Any) -> Any:
+    # Evictable, pooled and context instances must not be held on to
+    if type(value) is LazyProxy:
+        return object.__getattribute__(value, '_foxhound_target')()
+
+    if type(value) is list:
+        return [_unwrap(item) for item in value]
+
+    return value
+
+
+class EvictableProxy(LazyProxy):
+    __slots__ = ('_foxhound_tracker',)
+
+    _foxhound_tracker: EvictionTracker
+
+    def __init__(self, kind: type | GenericAlias, factory: Callable[[], Any], tracker: EvictionTracker):
+        super().__init__(kind, factory)
+        object.__setattr__(self, '_foxhound_tracker', tracker)
+
+    def __getattribute__(self, name: str) -> Any:
+        if name in _PROXY_ATTRIBUTES:
+            return object.__getattribute__(self, name)
+
+        return getattr(object.__getattribute__(self, '_foxhound_target')(), name)
+
+    def _foxhound_target(self) -> Any:
+        instance: Any = object.__getattribute__(self, '_foxhound_instance')
+        tracker: EvictionTracker = object.__getattribute__(self, '_foxhound_tracker')
+
+        if instance is not _UNRESOLVED:
+            tracker.touch(self)
+            return instance
+
+        inflated: bool = False
+
+        with object.__getattribute__(self, '_foxhound_lock'):
+            instance = object.__getattribute__(self, '_foxhound_instance')
+
+            if instance is _UNRESOLVED:
+                instance = object.__getattribute__(self, '_foxhound_factory')()
+                object.__setattr__(self, '_foxhound_instance', instance)
+                inflated = True
+
+        # Admitted outside of the lock, since the tracker takes proxy locks while evicting
+        if inflated:
+            tracker.admit(self, instance)
+        else:
+            tracker.touch(self)
+
+        return instance
+
+    def _foxhound_evict(self) -> None:
+        # Never closed, whoever still holds the previous instance keeps using it
+        with object.__getattribute__(self, '_foxhound_lock'):
+            object.__setattr__(self, '_foxhound_instance', _UNRESOLVED)
+
+
+class PooledProxy(ComponentProxy):
+    __slots__ = ('_foxhound_pool', '_foxhound_borrowed')
+
+    _foxhound_pool: ComponentPool[Any]
+    _foxhound_borrowed: ContextVar[tuple[Any, ...]]
+
+    def __init__(self, kind: type | GenericAlias, pool: ComponentPool[Any]):
+        super().__init__(kind)
+        object.__setattr__(self, '_foxhound_pool', pool)
+        object.__setattr__(self, '_foxhound_borrowed', ContextVar('foxhound_borrowed', default=()))
+
+    def _foxhound_target(self) -> Any:
+        borrowed: tuple[Any, ...] = object.__getattribute__(self, '_foxhound_borrowed').get()
+
+        if len(borrowed) == 0:
+            raise RuntimeError('A pooled component only has a single instance within "with proxy as instance:"')
+
+        return borrowed[-1]
+
+    def _foxhound_apply(self, operation: Callable[[Any], R]) -> R:
+        borrowed: tuple[Any, ...] = object.__getattribute__(self, '_foxhound_borrowed').get()
+
+        if len(borrowed) != 0:
+            return operation(borrowed[-1])
+
+        pool: ComponentPool[Any] = object.__getattribute__(self, '_foxhound_pool')
+        instance: Any = pool.borrow()
+
+        try:
+            return operation(instance)
+        finally:
+            pool.release(instance)
+
+    def __getattribute__(self, name: str) -> Any:
+        if name in _PROXY_ATTRIBUTES:
+            return object.__getattribute__(self, name)
+
+        borrowed: tuple[Any, ...] = object.__getattribute__(self, '_foxhound_borrowed').get()
+
+        if len(borrowed) != 0:
+            return getattr(borrowed[-1], name)
+
+        # Decided per instance, so callables set on it are never handed out unborrowed
+        apply: Callable[[Callable[[Any], Any]], Any] = object.__getattribute__(self, '_foxhound_apply')
+        value: Any = apply(lambda target: getattr(target, name))
+
+        if not callable(value):
+            return value
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return apply(lambda target: getattr(target, name)(*args, **kwargs))
+
+        return call
+
+    def __repr__(self) -> str:
+        kind: type | GenericAlias = object.__getattribute__(self, '_foxhound_kind')
+        return f'<pooled {kind!r} proxy at {id(self):#x}>'
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+    def __hash__(self) -> int:
+        return id(self)
+
+    def __enter__(self) -> Any:
+        borrowed_var: ContextVar[tuple[Any, ...]] = object.__getattribute__(self, '_foxhound_borrowed')
+        instance: Any = object.__getattribute__(self, '_foxhound_pool').borrow()
+        borrowed_var.set(borrowed_var.get() + (instance,))
+        return instance
+
+    def __exit__(self, *exc_info: Any) -> None:
+        borrowed_var: ContextVar[tuple[Any, ...]] = object.__getattribute__(self, '_foxhound_borrowed')
+        borrowed: tuple[Any, ...] = borrowed_var.get()
+        borrowed_var.set(borrowed[:-1])
+        object.__getattribute__(self, '_foxhound_pool').release(borrowed[-1])
+
+
+class ContextProxy(ComponentProxy):
+    __slots__ = ('_foxhound_component_id', '_foxhound_factory')
+
+    _foxhound_component_id: str
+    _foxhound_factory: Callable[[], Any]
+
+    def __init__(self, kind: type | GenericAlias, component_id: str, factory: Callable[[], Any]):
+        super().__init__(kind)
+        object.__setattr__(self, '_foxhound_component_id', component_id)
+        object.__setattr__(self, '_foxhound_factory', factory)
+
+    def __getattribute__(self, name: str) -> Any:
+        if name in _PROXY_ATTRIBUTES:
+            return object.__getattribute__(self, name)
+
+        instances: dict[str, Any] | None = context_instances.get()
+
+        if instances is not None:
+            instance: Any = instances.get(object.__getattribute__(self, '_foxhound_component_id'), _UNRESOLVED)
+
+            if instance is not _UNRESOLVED:
+                return getattr(instance, name)
+
+        return getattr(object.__getattribute__(self, '_foxhound_target')(), name)
+
+    def _foxhound_target(self) -> Any:
+        instances: dict[str, Any] | None = context_instances.get()
+        component_id: str = object.__getattribute__(self, '_foxhound_component_id')
+
+        if instances is None:
+            raise NoActiveContextError(
+                f'Component {component_id} is scoped as "context" and can only be used within component_context()'
+            )
+
+        instance: Any = instances.get(component_id, _UNRESOLVED)
+
+        if instance is _UNRESOLVED:
+            created: Any = object.__getattribute__(self, '_foxhound_factory')()
+            instance = instances.setdefault(component_id, created)
+
+            if instance is not created:
+                close_dropped([created])
+
+        return instance
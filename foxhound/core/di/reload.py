@@ -0,0 +1,286 @@
+import importlib
+import sys
+import types
+from types import ModuleType
+from typing import Any, get_args, get_origin
+
+from foxhound.core.di.component_scanner import ComponentScanner
+from foxhound.core.di.container import Container
+from foxhound.core.di.dependency_resolver import DependencyResolver
+from foxhound.core.di.exceptions import IncompleteReloadError
+from foxhound.core.di.graph.dependency_graph import DependencyGraph
+from foxhound.core.di.graph.inflator import DependencyGraphInflator, reject_async_factories
+from foxhound.core.di.graph.mapper import DependencyGraphMapper
+from foxhound.core.di.lifecycle import finalize_replaced, finalize_replaced_async
+from foxhound.core.di.models import Component, ComponentDefinition
+from foxhound.core.di.utils.parameters import parse_parameters
+from foxhound.core.di.wire import invalidate_bindings
+from foxhound.core.models import Result
+from foxhound.core.utils.typing import clear_type_caches
+
+_IMMUTABLE_TYPES: tuple[type, ...] = (int, float, complex, str, bytes, bool, type(None), frozenset)
+
+
+def reload(container: Container, *modules: str | ModuleType) -> Container:
+    graph, remapped_graph, removed_nodes, dirty_nodes = _reimport(
+        container,
+        modules,
+        async_factory_entry_point='reload_async()'
+    )
+    components: list[Component[Any]] = DependencyGraphInflator().reinflate(remapped_graph, container, dirty_nodes)
+    replaced_components: list[Component[Any]] = _swap(
+        container,
+        graph,
+        remapped_graph,
+        removed_nodes,
+        dirty_nodes,
+        components
+    )
+    finalize_replaced(container, graph, replaced_components)
+
+    return container
+
+
+async def reload_async(container: Container, *modules: str | ModuleType) -> Container:
+    graph, remapped_graph, removed_nodes, dirty_nodes = _reimport(
+        container,
+        modules,
+        async_factory_entry_point=None
+    )
+    components: list[Component[Any]] = await DependencyGraphInflator().reinflate_async(
+        remapped_graph,
+        container,
+        dirty_nodes
+    )
+    replaced_components: list[Component[Any]] = _swap(
+        container,
+        graph,
+        remapped_graph,
+        removed_nodes,
+        dirty_nodes,
+        components
+    )
+    await finalize_replaced_async(container, graph, replaced_components)
+
+    return container
+
+
+def _reimport(
+        container: Container,
+        modules: tuple[str | ModuleType, ...],
+        *,
+        # The entry point to use instead when reloading would inflate async factories, or None if they're supported
+        async_factory_entry_point: str | None
+) -> tuple[DependencyGraph, DependencyGraph, set[int], set[int]]:
+    graph: DependencyGraph | None = container.graph
+
+    if graph is None:
+        raise RuntimeError('Only containers created by start() can be reloaded')
+
+    module_names: list[str] = [module if isinstance(module, str) else module.__name__ for module in modules]
+    _check_complete(graph, module_names)
+
+    if async_factory_entry_point is not None:
+        reject_async_factories(
+            graph,
+            graph.with_dependents({
+                node for node, definition in enumerate(graph.definitions)
+                if _defining_module(definition) in module_names
+            }),
+            async_factory_entry_point
+        )
+
+    component_scanner: ComponentScanner = ComponentScanner()
+    nodes: dict[int, int] = {id(definition): node for node, definition in enumerate(graph.definitions)}
+    removed_nodes: set[int] = set()
+    added_definitions: list[ComponentDefinition] = []
+    replaced_kinds: dict[type, type] = {}
+
+    for module_name in module_names:
+        previous_module: ModuleType | None = sys.modules.get(module_name)
+        previous_definitions: dict[str, ComponentDefinition] = {}
+        previous_namespace: dict[str, Any] = {}
+        reloaded_module: ModuleType
+
+        if previous_module is None:
+            reloaded_module = importlib.import_module(module_name)
+        else:
+            previous_definitions = component_scanner.collect_defined(previous_module)
+            previous_namespace = dict(vars(previous_module))
+            reloaded_module = importlib.reload(previous_module)
+
+        definitions: dict[str, ComponentDefinition] = component_scanner.collect_defined(reloaded_module)
+        replaced_kinds.update(_replaced_classes(module_name, previous_namespace, vars(reloaded_module)))
+
+        for name, previous_definition in previous_definitions.items():
+            node: int | None = nodes.get(id(previous_definition))
+
+            if node is None:
+                continue
+
+            definition: ComponentDefinition | None = definitions.get(name)
+
+            if definition is not None and _unchanged(
+                    previous_definition,
+                    definition,
+                    previous_namespace,
+                    vars(reloaded_module)
+            ):
+                setattr(reloaded_module, name, previous_namespace[name])
+                del definitions[name]
+            else:
+                removed_nodes.add(node)
+
+        added_definitions.extend(definitions.values())
+
+    clear_type_caches()
+    mapping: Result[tuple[DependencyGraph, set[int]]] = DependencyGraphMapper(DependencyResolver()).remap(
+        graph,
+        removed_nodes,
+        added_definitions,
+        replaced_kinds
+    )
+    remapped_graph, rewired_nodes = mapping.unwrap()
+    dirty_nodes: set[int] = remapped_graph.with_dependents(rewired_nodes)
+
+    if async_factory_entry_point is not None:
+        reject_async_factories(remapped_graph, dirty_nodes, async_factory_entry_point)
+
+    return graph, remapped_graph, removed_nodes, dirty_nodes
+
+
+def _swap(
+        container: Container,
+        graph: DependencyGraph,
+        remapped_graph: DependencyGraph,
+        removed_nodes: set[int],
+        dirty_nodes: set[int],
+        components: list[Component[Any]]
+) -> list[Component[Any]]:
+    replaced_components: list[Component[Any]] = container.swap_components(
+        [graph.definitions[node].metadata.id for node in removed_nodes]
+        + [remapped_graph.definitions[node].metadata.id for node in dirty_nodes],
+        components
+    )
+    container.graph = remapped_graph
+    invalidate_bindings(container)
+
+    return replaced_components
+
+
+def _replaced_classes(
+        module_name: str,
+        previous_namespace: dict[str, Any],
+        namespace: dict[str, Any]
+) -> dict[type, type]:
+    return {
+        previous: namespace[name] for name, previous in previous_namespace.items()
+        if isinstance(previous, type) and previous.__module__ == module_name
+        and isinstance(namespace.get(name), type) and namespace[name] is not previous
+    }
+
+
+def _check_complete(graph: DependencyGraph, module_names: list[str]) -> None:
+    # Components of other modules must not keep producing instances of the recreated classes
+    recreated_classes: list[type] = []
+
+    for module_name in module_names:
+        module: ModuleType | None = sys.modules.get(module_name)
+
+        if module is not None:
+            recreated_classes.extend(
+                value for value in vars(module).values()
+                if isinstance(value, type) and value.__module__ == module_name
+            )
+
+    stale_components: dict[str, list[str]] = {}
+
+    for definition in graph.definitions:
+        defining_module: str = _defining_module(definition)
+
+        if defining_module not in module_names and _refers_to(definition.metadata.kind, tuple(recreated_classes)):
+            stale_components.setdefault(defining_module, []).append(definition.metadata.id)
+
+    if len(stale_components) != 0:
+        raise IncompleteReloadError(stale_components)
+
+
+def _defining_module(definition: ComponentDefinition) -> str:
+    return getattr(definition.inflator, '__module__', None) or repr(definition.inflator)
+
+
+def _refers_to(kind: Any, classes: tuple[type, ...]) -> bool:
+    if len(classes) == 0:
+        return False
+
+    origin: Any = get_origin(kind)
+
+    if origin is not None:
+        return _refers_to(origin, classes) or any(_refers_to(argument, classes) for argument in get_args(kind))
+
+    return isinstance(kind, type) and issubclass(kind, classes)
+
+
+def _unchanged(
+        previous: ComponentDefinition,
+        current: ComponentDefinition,
+        previous_namespace: dict[str, Any],
+        namespace: dict[str, Any]
+) -> bool:
+    # Only factory functions whose code, defaults and referenced globals are unchanged survive a reload
+    previous_inflator: Any = previous.inflator
+    inflator: Any = current.inflator
+
+    if type(previous_inflator) is not types.FunctionType or type(inflator) is not types.FunctionType:
+        return False
+
+    if (
+            previous_inflator.__code__ != inflator.__code__
+            or previous_inflator.__defaults__ != inflator.__defaults__
+            or previous_inflator.__kwdefaults__ != inflator.__kwdefaults__
+            or previous.param_qualifiers != current.param_qualifiers
+            or previous.metadata.model_copy({'id': current.metadata.id}) != current.metadata
+    ):
+        return False
+
+    previous_cells: tuple[Any, ...] = tuple(cell.cell_contents for cell in previous_inflator.__closure__ or ())
+    cells: tuple[Any, ...] = tuple(cell.cell_contents for cell in inflator.__closure__ or ())
+
+    if len(previous_cells) != len(cells) or not all(map(_same, previous_cells, cells)):
+        return False
+
+    previous_parameters: list[tuple[str, Any, bool]] = [
+        (parameter.name, parameter.kind, parameter.lazy) for parameter in parse_parameters(previous)
+    ]
+    parameters: list[tuple[str, Any, bool]] = [
+        (parameter.name, parameter.kind, parameter.lazy) for parameter in parse_parameters(current)
+    ]
+
+    if len(previous_parameters) != len(parameters) or not all(
+            name == previous_name and previous_kind == kind and previous_lazy == lazy
+            for (previous_name, previous_kind, previous_lazy), (name, kind, lazy)
+            in zip(previous_parameters, parameters, strict=True)
+    ):
+        return False
+
+    return all(
+        _same(previous_namespace.get(name), namespace.get(name))
+        for name in _referenced_names(inflator.__code__)
+    )
+
+
+def _referenced_names(code: types.CodeType) -> set[str]:
+    names: set[str] = set(code.co_names)
+
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            names.update(_referenced_names(constant))
+
+    return names
+
+
+def _same(previous: Any, current: Any) -> bool:
+    if previous is current:
+        return True
+
+    return type(previous) is type(current) and type(current) in _IMMUTABLE_TYPES and previous == current
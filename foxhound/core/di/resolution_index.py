@@ -0,0 +1,38 @@
+from types import GenericAlias
+
+from foxhound.core.di.kind_index import KindIndex
+from foxhound.core.di.models import ComponentDefinition
+
+
+class ResolutionIndex:
+    _definitions: dict[str, ComponentDefinition]
+    _kind_index: KindIndex[ComponentDefinition]
+    _qualified_definitions: dict[str, list[ComponentDefinition]]
+
+    def __init__(self, definitions: list[ComponentDefinition]):
+        self._definitions = {}
+        self._kind_index = KindIndex(lambda definition: definition.metadata.kind)
+        self._qualified_definitions = {}
+
+        for definition in definitions:
+            self._definitions[definition.metadata.id] = definition
+            self._kind_index.add(definition)
+
+            if definition.metadata.qualifier is not None:
+                self._qualified_definitions.setdefault(definition.metadata.qualifier, []).append(definition)
+
+    def get(self, component_id: str) -> ComponentDefinition:
+        return self._definitions[component_id]
+
+    def find(self, kind: type | GenericAlias, excluded_component_id: str | None = None) -> list[ComponentDefinition]:
+        return [
+            definition for definition in self._kind_index.find(kind)
+            if definition.metadata.id != excluded_component_id
+        ]
+
+    def find_qualified(self, qualifier: str) -> ComponentDefinition | None:
+        definitions: list[ComponentDefinition] | None = self._qualified_definitions.get(qualifier)
+        return None if definitions is None else definitions[0]
+
+    def qualified_definitions(self) -> dict[str, list[ComponentDefinition]]:
+        return self._qualified_definitions
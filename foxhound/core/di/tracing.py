@@ -0,0 +1,119 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any
+
+from foxhound.core.di.models import TraceSpan
+
+PHASE_CATEGORY = 'phase'
+COMPONENT_CATEGORY = 'component'
+
+
+class StartupTracer:
+    _spans: list[TraceSpan]
+    _listeners: list[Callable[[TraceSpan], None]]
+    _lock: threading.Lock
+    _origin: int
+
+    def __init__(self) -> None:
+        self._spans = []
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+
+    def add_listener(self, listener: Callable[[TraceSpan], None]) -> None:
+        self._listeners.append(listener)
+
+    def spans(self) -> list[TraceSpan]:
+        with self._lock:
+            return list(self._spans)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started: int = time.perf_counter_ns()
+
+        try:
+            yield
+        finally:
+            self.record(name, PHASE_CATEGORY, started)
+
+    def record(self, name: str, category: str, started: int) -> TraceSpan:
+        ended: int = time.perf_counter_ns()
+        span: TraceSpan = TraceSpan(
+            name=name,
+            category=category,
+            start=started - self._origin,
+            duration=ended - started,
+            thread_id=threading.get_ident(),
+            task=_current_task_name()
+        )
+
+        with self._lock:
+            self._spans.append(span)
+
+        for listener in self._listeners:
+            listener(span)
+
+        return span
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        pid: int = os.getpid()
+
+        return {
+            'traceEvents': [
+                {
+                    'name': span.name,
+                    'cat': span.category,
+                    'ph': 'X',
+                    'ts': span.start / 1000,
+                    'dur': span.duration / 1000,
+                    'pid': pid,
+                    'tid': span.thread_id,
+                    'args': {} if span.task is None else {'task': span.task}
+                }
+                for span in self.spans()
+            ],
+            'displayTimeUnit': 'ms'
+        }
+
+    def export_chrome_trace(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def report(self, limit: int | None = None) -> str:
+        spans: list[TraceSpan] = sorted(
+            self.spans(),
+            key=lambda span: (span.category != PHASE_CATEGORY, -span.duration)
+        )
+        lines: list[str] = []
+
+        for category in (PHASE_CATEGORY, COMPONENT_CATEGORY):
+            category_spans: list[TraceSpan] = [span for span in spans if span.category == category]
+
+            if len(category_spans) == 0:
+                continue
+
+            lines.append(f'{category}s ({len(category_spans)}):')
+            lines.extend(
+                f'  {span.duration / 1_000_000:>10.3f} ms  {span.name}'
+                for span in category_spans[:limit]
+            )
+
+        return '\n'.join(lines)
+
+
+def trace_phase(tracer: StartupTracer | None, name: str) -> AbstractContextManager[None]:
+    return nullcontext() if tracer is None else tracer.phase(name)
+
+
+def _current_task_name() -> str | None:
+    try:
+        task: asyncio.Task | None = asyncio.current_task()
+    except RuntimeError:
+        return None
+
+    return None if task is None else task.get_name()
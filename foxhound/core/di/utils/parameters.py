@@ -1,7 +1,8 @@
 import inspect
-from typing import Any
+from typing import Any, get_args, get_origin
 
 from foxhound.core.di.models import ComponentDefinition, Parameter
+from foxhound.core.di.proxies import Lazy
 from foxhound.core.utils.typing import simplify_arguments
 
 
@@ -13,12 +14,15 @@ def parse_parameters(component_definition: ComponentDefinition) -> list[Paramete
     )
 
     for name, kind in arguments.items():
+        lazy: bool = get_origin(kind) is Lazy
+
         parameters.append(
             Parameter(
                 name=name,
-                kind=kind,
+                kind=get_args(kind)[0] if lazy else kind,
                 qualifier=component_definition.param_qualifiers.get(name),
-                parent_component_id=component_definition.metadata.id
+                parent_component_id=component_definition.metadata.id,
+                lazy=lazy
             )
         )
 
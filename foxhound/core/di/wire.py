@@ -0,0 +1,146 @@
+import functools
+import inspect
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar, cast
+
+from foxhound.core.di.container import Container
+from foxhound.core.di.exceptions import ComponentLookupError
+
+T = TypeVar('T')
+
+_active_container: Container | None = None
+# Keyed by the wired function, which is all that keeps its binder alive
+_binders: 'weakref.WeakKeyDictionary[Callable[..., Any], _ParameterBinder]' = weakref.WeakKeyDictionary()
+
+
+def activate_container(container: Container) -> None:
+    # Wired functions resolve their parameters again on their next call after a new start()
+    global _active_container
+    _active_container = container
+
+    for binder in list(_binders.values()):
+        binder.reset()
+
+
+def invalidate_bindings(container: Container) -> None:
+    # Components of the active container were swapped, so wired functions resolve their parameters again
+    if container is _active_container:
+        for binder in list(_binders.values()):
+            binder.reset()
+
+
+def wire(param_qualifiers: dict[str, str] | None = None) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    def decorator(target: Callable[..., T]) -> Callable[..., T]:
+        return _wire_forwarding(target, {} if param_qualifiers is None else param_qualifiers)
+
+    return decorator
+
+
+def _wire_forwarding(target: Callable[..., T], param_qualifiers: dict[str, str]) -> Callable[..., T]:
+    # Calls whatever the binder compiled through a closure cell, so a reset never races a call half-way
+    call: Callable[..., T]
+
+    def rebind(compiled: Callable[..., T]) -> None:
+        nonlocal call
+        call = compiled
+
+    binder: _ParameterBinder = _ParameterBinder(target, param_qualifiers, rebind)
+    wired: Callable[..., T]
+
+    if inspect.iscoroutinefunction(target):
+        async def wired_coroutine(*args: Any, **kwargs: Any) -> Any:
+            return await cast(Callable[..., Awaitable[Any]], call)(*args, **kwargs)
+
+        wired = cast(Callable[..., T], wired_coroutine)
+    else:
+        def wired_function(*args: Any, **kwargs: Any) -> T:
+            return call(*args, **kwargs)
+
+        wired = wired_function
+
+    _binders[wired] = binder
+    return functools.wraps(target)(wired)
+
+
+class _ParameterBinder:
+    _target: Callable[..., Any]
+    _rebind: Callable[[Callable[..., Any]], None]
+    _param_qualifiers: dict[str, str]
+    _signature: inspect.Signature
+    _positional_names: list[str]
+
+    def __init__(
+            self,
+            target: Callable[..., Any],
+            param_qualifiers: dict[str, str],
+            rebind: Callable[[Callable[..., Any]], None]
+    ):
+        self._target = target
+        self._rebind = rebind
+        self._param_qualifiers = param_qualifiers
+        self._signature = inspect.signature(target)
+        self._positional_names = [
+            name for name, parameter in self._signature.parameters.items()
+            if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        ]
+        self.reset()
+
+        unknown_parameters: set[str] = set(param_qualifiers) - set(self._signature.parameters)
+
+        if len(unknown_parameters) != 0:
+            raise TypeError(f'Qualified parameters {sorted(unknown_parameters)} are not parameters of {target}')
+
+    def reset(self) -> None:
+        self._rebind(self._compile_and_call)
+
+    def _compile_and_call(self, *args: Any, **kwargs: Any) -> Any:
+        compiled: Callable[..., Any] = self._compile()
+        self._rebind(compiled)
+        return compiled(*args, **kwargs)
+
+    def _compile(self) -> Callable[..., Any]:
+        container: Container | None = _active_container
+
+        if container is None:
+            raise RuntimeError(f'{self._target} is wired, but start() has not been called yet')
+
+        injected: dict[str, Any] = {}
+
+        for name, parameter in self._signature.parameters.items():
+            qualifier: str | None = self._param_qualifiers.get(name)
+
+            # Defaults written in the signature are kept, unless the parameter is explicitly qualified
+            if parameter.annotation is inspect.Parameter.empty or (
+                    parameter.default is not inspect.Parameter.empty and qualifier is None
+            ):
+                continue
+
+            try:
+                injected[name] = container.get(parameter.annotation, qualifier)
+            except ComponentLookupError:
+                # Parameters no component matches at all are left for the caller to supply
+                if qualifier is not None or len(container.get_components(parameter.annotation)) != 0:
+                    raise
+
+        return self._bind(injected)
+
+    def _bind(self, injected: dict[str, Any]) -> Callable[..., Any]:
+        # Only the returned closure holds on to the components, so resetting the binding releases them
+        target: Callable[..., Any] = self._target
+        positional_names: list[str] = self._positional_names
+
+        def bound(*args: Any, **kwargs: Any) -> Any:
+            if len(args) == 0 and len(kwargs) == 0:
+                return target(**injected)
+
+            # Positional arguments override the injected values of the parameters they fill
+            overridden: list[str] = positional_names[:len(args)]
+            arguments: dict[str, Any] = {
+                name: value for name, value in injected.items()
+                if name not in overridden
+            }
+
+            return target(*args, **{**arguments, **kwargs})
+
+        return bound
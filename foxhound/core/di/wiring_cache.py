@@ -0,0 +1,204 @@
+import hashlib
+import importlib.util
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any
+
+from foxhound.core.di.component_scanner import ComponentScanner, DefinitionLocation
+from foxhound.core.di.graph.dependency_graph import DependencyGraph
+from foxhound.core.di.models import ComponentDefinition, Parameter
+
+_PLAN_FORMAT_VERSION: int = 3
+
+
+class WiringPlanCache:
+    _path: str
+    _component_scanner: ComponentScanner
+    _fingerprints: dict[frozenset[str | ModuleType], str | None]
+
+    def __init__(self, path: str, component_scanner: ComponentScanner):
+        self._path = path
+        self._component_scanner = component_scanner
+        self._fingerprints = {}
+
+    def load(self, scan_modules: set[str | ModuleType]) -> DependencyGraph | None:
+        fingerprint: str | None = self._fingerprint(scan_modules)
+
+        if fingerprint is None:
+            return None
+
+        try:
+            with open(self._path, 'rb') as f:
+                plan: dict[str, Any] = pickle.load(f)
+
+            if plan['version'] != _PLAN_FORMAT_VERSION or plan['fingerprint'] != fingerprint:
+                return None
+
+            if any(_file_stat(path) != stat for path, stat in plan['files'].items()):
+                return None
+
+            definitions: list[ComponentDefinition] = [
+                self._component_scanner.load(location) for location in plan['locations']
+            ]
+            node_parameters: list[list[Parameter]] = [
+                [
+                    Parameter(
+                        name=name,
+                        kind=kind,
+                        qualifier=qualifier,
+                        parent_component_id=definition.metadata.id,
+                        lazy=lazy
+                    )
+                    for name, kind, qualifier, lazy in bindings
+                ]
+                for definition, bindings in zip(definitions, plan['bindings'], strict=True)
+            ]
+        except Exception:
+            return None
+
+        return DependencyGraph(definitions, node_parameters, plan['dependencies'])
+
+    def save(
+            self,
+            scan_modules: set[str | ModuleType],
+            locations: list[DefinitionLocation],
+            graph: DependencyGraph
+    ) -> None:
+        fingerprint: str | None = self._fingerprint(scan_modules)
+
+        if fingerprint is None:
+            return
+
+        try:
+            files: dict[str, tuple[int, int]] = {path: _file_stat(path) for path in _definition_files(graph)}
+        except OSError:
+            return
+
+        plan: dict[str, Any] = {
+            'version': _PLAN_FORMAT_VERSION,
+            'fingerprint': fingerprint,
+            'locations': locations,
+            'files': files,
+            'bindings': [
+                [
+                    (graph.parameters[parameter].name, graph.parameters[parameter].kind,
+                     graph.parameters[parameter].qualifier, graph.parameters[parameter].lazy)
+                    for parameter in graph.parameter_range(node)
+                ]
+                for node in range(len(graph))
+            ],
+            'dependencies': [
+                list(graph.parameter_dependencies(parameter)) for parameter in range(len(graph.parameters))
+            ]
+        }
+
+        try:
+            serialized_plan: bytes = pickle.dumps(plan)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return
+
+        directory: str = os.path.dirname(os.path.abspath(self._path))
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile('wb', dir=directory, delete=False) as f:
+                f.write(serialized_plan)
+
+            os.replace(f.name, self._path)
+        except OSError:
+            logging.getLogger('foxhound').warning('Failed to save the wiring plan to %s', self._path, exc_info=True)
+
+    def _fingerprint(self, scan_modules: set[str | ModuleType]) -> str | None:
+        # Taken before scanning, so a file changing while it is scanned invalidates the saved plan
+        key: frozenset[str | ModuleType] = frozenset(scan_modules)
+
+        if key not in self._fingerprints:
+            try:
+                self._fingerprints[key] = _fingerprint(scan_modules)
+            except Exception:
+                logging.getLogger('foxhound').warning(
+                    'Cannot fingerprint the scanned modules, the wiring cache is not used',
+                    exc_info=True
+                )
+                self._fingerprints[key] = None
+
+        return self._fingerprints[key]
+
+
+def _fingerprint(scan_modules: set[str | ModuleType]) -> str:
+    digest = hashlib.sha256(repr(sys.version_info[:2]).encode())
+
+    for module in sorted(scan_modules, key=_root_name):
+        digest.update(_root_name(module).encode())
+
+        for path in sorted(_source_files(module)):
+            stat: os.stat_result = os.stat(path)
+            digest.update(f'{path}:{stat.st_mtime_ns}:{stat.st_size}'.encode())
+
+    return digest.hexdigest()
+
+
+def _definition_files(graph: DependencyGraph) -> set[str]:
+    module_names: set[str | None] = set()
+
+    for definition in graph.definitions:
+        module_names.add(getattr(definition.inflator, '__module__', None))
+        module_names.add(getattr(definition.metadata.kind, '__module__', None))
+
+    for parameter in graph.parameters:
+        module_names.add(getattr(parameter.kind, '__module__', None))
+
+    files: set[str] = set()
+
+    for module_name in module_names:
+        module: ModuleType | None = None if module_name is None else sys.modules.get(module_name)
+        file: str | None = getattr(module, '__file__', None)
+
+        if file is not None:
+            files.add(file)
+
+    return files
+
+
+def _file_stat(path: str) -> tuple[int, int]:
+    stat: os.stat_result = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _root_name(module: str | ModuleType) -> str:
+    return module if isinstance(module, str) else module.__name__
+
+
+def _source_files(module: str | ModuleType) -> list[str]:
+    if isinstance(module, ModuleType) and module.__spec__ is None:
+        file: str | None = getattr(module, '__file__', None)
+
+        if file is None:
+            raise ModuleNotFoundError(f'Cannot locate the source of module "{module.__name__}"')
+
+        return [file]
+
+    root: str = _root_name(module)
+    spec: ModuleSpec | None = importlib.util.find_spec(root)
+
+    if spec is None:
+        raise ModuleNotFoundError(f'Cannot locate module "{root}"')
+
+    if spec.submodule_search_locations is None:
+        return [spec.origin] if spec.origin is not None else []
+
+    files: list[str] = []
+
+    for location in spec.submodule_search_locations:
+        for directory, directory_names, file_names in os.walk(location):
+            directory_names[:] = [name for name in directory_names if name != '__pycache__']
+            files.append(directory)
+            files.extend(os.path.join(directory, name) for name in file_names if name.endswith('.py'))
+
+    return files
@@ -1,12 +1,31 @@
-from typing import Generic, TypeVar
-
-from pydantic import BaseModel as PydanticBaseModel
+import dataclasses
+import os
+from collections.abc import Iterable
+from typing import Any, ClassVar, Generic, TypeVar, cast
 
 T = TypeVar('T')
+M = TypeVar('M', bound='BaseModel')
+
+_VALIDATION_ENV_VAR = 'FOXHOUND_VALIDATION'
+
+
+class BaseModel:
+    __slots__ = ()
+
+    # Declared so type checkers treat models as dataclasses
+    __dataclass_fields__: ClassVar[dict[str, dataclasses.Field[Any]]]
+
+    def validate(self) -> None:
+        pass
+
+    def model_dump(self) -> dict[str, Any]:
+        return {field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
 
-class BaseModel(PydanticBaseModel):
-    model_config = {'arbitrary_types_allowed': True}
+    def model_copy(self: M, update: dict[str, Any] | None = None) -> M:
+        return dataclasses.replace(self, **({} if update is None else update))
 
+
+@dataclasses.dataclass(slots=True, kw_only=True)
 class Result(BaseModel, Generic[T]):
     successful: bool
     value: T | None = None
@@ -33,3 +52,20 @@ class Result(BaseModel, Generic[T]):
     def error(cls, exception: Exception, hint: str | None = None) -> 'Result[T]':
         return cls(successful=False, exception=exception, hint=hint)
 
+    def unwrap(self) -> T:
+        if not self.successful:
+            raise self.exception if self.exception is not None else ValueError(self.hint)
+
+        return cast(T, self.value)
+
+
+def validation_enabled() -> bool:
+    return os.environ.get(_VALIDATION_ENV_VAR, 'true').lower() not in ('0', 'false', 'off')
+
+
+def validate_models(models: Iterable[BaseModel]) -> None:
+    if not validation_enabled():
+        return
+
+    for model in models:
+        model.validate()
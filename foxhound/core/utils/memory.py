@@ -0,0 +1,48 @@
+import contextlib
+import gc
+import sys
+import types
+from typing import Any
+
+# Code and classes are shared by the whole process, so they're never attributed to a single object
+_SHARED_TYPES: tuple[type, ...] = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.CodeType,
+)
+
+
+def shallow_size(value: Any) -> int:
+    size: int = sys.getsizeof(value)
+
+    with contextlib.suppress(AttributeError, TypeError):
+        size += sys.getsizeof(object.__getattribute__(value, '__dict__'))
+
+    return size
+
+
+def deep_size(value: Any, excluded: set[int] | frozenset[int] = frozenset(), seen: set[int] | None = None) -> int:
+    seen = set() if seen is None else seen
+
+    if id(value) in seen:
+        return 0
+
+    seen.add(id(value))
+    size: int = sys.getsizeof(value)
+    pending: list[Any] = list(gc.get_referents(value))
+
+    while len(pending) != 0:
+        referent: Any = pending.pop()
+        referent_id: int = id(referent)
+
+        # type() rather than isinstance(), so proxies are never asked for their __class__
+        if referent_id in seen or referent_id in excluded or issubclass(type(referent), _SHARED_TYPES):
+            continue
+
+        seen.add(referent_id)
+        size += sys.getsizeof(referent)
+        pending.extend(gc.get_referents(referent))
+
+    return size
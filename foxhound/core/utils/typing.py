@@ -1,7 +1,13 @@
 import inspect
+from functools import lru_cache
 from inspect import Signature
+from types import GenericAlias
 from typing import Any, Union, get_args, get_origin
 
+_TYPE_CACHE_SIZE: int = 4096
+
+_type_cache_generation: int = 0
+
 
 def validate_concrete_parameters(signature: inspect.Signature) -> None:
     for name, parameter in signature.parameters.items():
@@ -19,11 +25,46 @@ def validate_concrete_return_type(signature: inspect.Signature) -> None:
 
 
 def is_union_type(annotation: Any) -> bool:
-    origin: type = get_origin(annotation)
+    try:
+        return _cached_is_union_type(annotation)
+    except TypeError:
+        # Unhashable annotations cannot be memoized
+        return _is_union_type(annotation)
+
+
+def is_assignable_to(candidate: type | GenericAlias, requested: type | GenericAlias) -> bool:
+    try:
+        return _cached_is_assignable_to(candidate, requested)
+    except TypeError:
+        return _is_assignable_to(candidate, requested)
+
+
+def is_generic(target: type) -> bool:
+    try:
+        return _cached_is_generic(target)
+    except TypeError:
+        return _is_generic(target)
+
+
+def clear_type_caches() -> None:
+    # Memoized results go stale when classes are redefined (hot reload) or registered on an ABC
+    global _type_cache_generation
+    _type_cache_generation += 1
+    _cached_is_union_type.cache_clear()
+    _cached_is_assignable_to.cache_clear()
+    _cached_is_generic.cache_clear()
+
+
+def type_cache_generation() -> int:
+    return _type_cache_generation
+
+
+def _is_union_type(annotation: Any) -> bool:
+    origin: Any = get_origin(annotation)
     return origin is Union or (hasattr(origin, '__name__') and origin.__name__ == 'UnionType')
 
 
-def is_assignable_to(candidate: type, requested: type) -> bool:
+def _is_assignable_to(candidate: Any, requested: Any) -> bool:
     target_generic: bool = is_generic(candidate)
     request_generic: bool = is_generic(requested)
 
@@ -39,10 +80,15 @@ def is_assignable_to(candidate: type, requested: type) -> bool:
     return get_args(candidate) == get_args(requested)
 
 
-def is_generic(target: type) -> bool:
+def _is_generic(target: type) -> bool:
     return get_origin(target) is not None
 
 
+_cached_is_union_type = lru_cache(maxsize=_TYPE_CACHE_SIZE)(_is_union_type)
+_cached_is_assignable_to = lru_cache(maxsize=_TYPE_CACHE_SIZE)(_is_assignable_to)
+_cached_is_generic = lru_cache(maxsize=_TYPE_CACHE_SIZE)(_is_generic)
+
+
 def simplify_arguments(signature: Signature) -> dict[str, type[Any]]:
     return {
         name: param.annotation
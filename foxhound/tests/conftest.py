@@ -0,0 +1,77 @@
+import importlib
+import os
+import sys
+import textwrap
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from foxhound import define_component
+from foxhound.core.di.api import embed_definition
+
+# Writes a module (by dotted name) under a temporary source root, returning the path of its file
+WriteModule = Callable[[str, str], Path]
+# Builds a module to start from - targets are (re)defined as components with the given options, per-target options
+# taking precedence, while members (e.g. configuration classes) are added as they are
+ComponentModule = Callable[..., ModuleType]
+
+
+@pytest.fixture
+def component_module() -> ComponentModule:
+    def build(
+            *targets: Any,
+            members: Iterable[Any] = (),
+            target_options: dict[Any, dict[str, Any]] | None = None,
+            **options: Any
+    ) -> ModuleType:
+        module: ModuleType = ModuleType('test_components')
+
+        for target in targets:
+            embed_definition(target, define_component(target, **{**options, **(target_options or {}).get(target, {})}))
+            setattr(module, target.__name__, target)
+
+        for member in members:
+            setattr(module, member.__name__, member)
+
+        return module
+
+    return build
+
+
+@pytest.fixture
+def write_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[WriteModule]:
+    source_root: Path = tmp_path / 'src'
+    source_root.mkdir()
+    monkeypatch.syspath_prepend(str(source_root))
+    written: set[str] = set()
+
+    def write(module_name: str, source: str) -> Path:
+        parts: list[str] = module_name.split('.')
+        directory: Path = source_root.joinpath(*parts[:-1])
+        directory.mkdir(parents=True, exist_ok=True)
+
+        for depth in range(1, len(parts)):
+            init: Path = source_root.joinpath(*parts[:depth], '__init__.py')
+
+            if not init.exists():
+                init.write_text('')
+
+        path: Path = directory / f'{parts[-1]}.py'
+        previous_mtime: int = path.stat().st_mtime_ns if path.exists() else 0
+        path.write_text(textwrap.dedent(source))
+        # Rewrites within the filesystem's timestamp resolution must still look changed
+        mtime: int = max(path.stat().st_mtime_ns, previous_mtime + 1_000_000_000)
+        os.utime(path, ns=(mtime, mtime))
+        importlib.invalidate_caches()
+        written.add(parts[0])
+
+        return path
+
+    yield write
+
+    for module_name in list(sys.modules):
+        if module_name.split('.')[0] in written:
+            del sys.modules[module_name]
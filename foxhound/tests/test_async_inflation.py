@@ -0,0 +1,88 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from foxhound import Container, shutdown_async, start, start_async
+from foxhound.tests.conftest import ComponentModule
+
+events: list[str] = []
+
+
+class Clock:
+    pass
+
+
+class Database:
+    def __init__(self, clock: Clock) -> None:
+        self.clock = clock
+
+
+class Cache:
+    pass
+
+
+class Service:
+    def __init__(self, database: Database, cache: Cache) -> None:
+        self.database = database
+        self.cache = cache
+
+
+async def database(clock: Clock) -> Database:
+    await asyncio.sleep(0)
+    return Database(clock)
+
+
+async def cache() -> AsyncIterator[Cache]:
+    events.append('cache opened')
+    yield Cache()
+    events.append('cache closed')
+
+
+def clock() -> Iterator[Clock]:
+    events.append('clock opened')
+    yield Clock()
+    events.append('clock closed')
+
+
+def service(database: Database, cache: Cache) -> Service:
+    return Service(database, cache)
+
+
+def test_async_and_sync_factories_depend_on_each_other(component_module: ComponentModule) -> None:
+    events.clear()
+
+    async def run() -> None:
+        container: Container = await start_async(component_module(clock, database, cache, service))
+        result: Service = container.get(Service)
+
+        assert result.database is container.get(Database)
+        assert result.database.clock is container.get(Clock)
+        assert result.cache is container.get(Cache)
+
+        await shutdown_async(container)
+
+    asyncio.run(run())
+
+    assert sorted(events) == ['cache closed', 'cache opened', 'clock closed', 'clock opened']
+
+
+def test_sync_factory_returning_an_awaitable_is_not_awaited(component_module: ComponentModule) -> None:
+    def pending() -> asyncio.Future:
+        return asyncio.get_running_loop().create_future()
+
+    async def run() -> None:
+        container: Container = await start_async(component_module(pending))
+
+        assert not container.get(asyncio.Future).done()
+
+    asyncio.run(run())
+
+
+def test_start_rejects_async_factories_before_inflating_anything(component_module: ComponentModule) -> None:
+    events.clear()
+
+    with pytest.raises(TypeError, match='start_async'):
+        start(component_module(clock, database))
+
+    assert events == []
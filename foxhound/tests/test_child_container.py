@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from foxhound import Container, child_container, child_container_async, start, start_async
+from foxhound.tests.conftest import ComponentModule
+
+
+class Db:
+    pass
+
+
+class FakeDb(Db):
+    pass
+
+
+class Clock:
+    pass
+
+
+class UserService:
+    def __init__(self, db: Db, clock: Clock) -> None:
+        self.db = db
+        self.clock = clock
+
+
+class Report:
+    def __init__(self, users: UserService) -> None:
+        self.users = users
+
+
+async def report(users: UserService) -> Report:
+    await asyncio.sleep(0)
+    return Report(users)
+
+
+def test_overrides_and_their_dependents_are_replaced_within_the_child_only(component_module: ComponentModule) -> None:
+    container: Container = start(component_module(Db, Clock, UserService, Report))
+    fake_db: FakeDb = FakeDb()
+    child: Container = child_container(container, {Db: fake_db})
+
+    assert child.get(Db) is fake_db
+    assert child.get(UserService).db is fake_db
+    assert child.get(Report).users is child.get(UserService)
+    assert child.get(Clock) is container.get(Clock)
+    assert container.get(UserService).db is container.get(Db)
+    assert container.get(Report).users is container.get(UserService)
+
+
+def test_overrides_by_kind_and_qualifier(component_module: ComponentModule) -> None:
+    container: Container = start(
+        component_module(Db, Clock, UserService, target_options={Clock: {'qualifier': 'wall'}})
+    )
+    clock: Clock = Clock()
+    child: Container = child_container(container, {(Clock, 'wall'): clock})
+
+    assert child.get(Clock, 'wall') is clock
+    assert child.get(UserService).clock is clock
+
+
+def test_grandchildren_keep_the_overrides_of_their_ancestors(component_module: ComponentModule) -> None:
+    container: Container = start(component_module(Db, Clock, UserService))
+    fake_db: FakeDb = FakeDb()
+    clock: Clock = Clock()
+    grandchild: Container = child_container(child_container(container, {Db: fake_db}), {Clock: clock})
+    users: UserService = grandchild.get(UserService)
+
+    assert users.db is fake_db
+    assert users.clock is clock
+
+
+def test_sync_child_of_async_dependents_is_refused_up_front(component_module: ComponentModule) -> None:
+    container: Container = asyncio.run(start_async(component_module(Db, Clock, UserService, report)))
+
+    with pytest.raises(TypeError, match='child_container_async'):
+        child_container(container, {Db: FakeDb()})
+
+
+def test_async_child_awaits_async_dependents(component_module: ComponentModule) -> None:
+    async def run() -> tuple[Container, Container]:
+        container: Container = await start_async(component_module(Db, Clock, UserService, report))
+        return container, await child_container_async(container, {Db: FakeDb()})
+
+    container, child = asyncio.run(run())
+
+    assert isinstance(child.get(Report).users.db, FakeDb)
+    assert child.get(Report) is not container.get(Report)
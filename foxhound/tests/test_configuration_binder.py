@@ -0,0 +1,114 @@
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, TypeVar
+
+import pytest
+from pydantic import BaseModel
+
+from foxhound.configuration.binder import ConfigurationBinder, _cached_type_adapter, _compile_coercion
+
+# Neither a class nor a generic alias, so there's nothing to coerce configuration values to
+Label = TypeVar('Label')
+
+
+class Credentials(BaseModel):
+    user: str
+    password: str
+
+
+class DatabaseSettings:
+    def __init__(
+            self,
+            host: str,
+            port: int,
+            timeout: float,
+            debug: bool,
+            data_directory: Path,
+            credentials: Credentials,
+            replicas: list[str],
+            weights: dict[str, int],
+            label: Label
+    ) -> None:
+        pass
+
+
+@pytest.fixture
+def type_adapters() -> Iterator[None]:
+    _cached_type_adapter.cache_clear()
+    yield
+    _cached_type_adapter.cache_clear()
+
+
+def test_each_parameter_is_coerced_to_its_annotation() -> None:
+    host: str = 'db.internal'
+    section: dict[str, Any] = {
+        'host': host,
+        'port': '5432',
+        'timeout': 3,
+        'debug': 1,
+        'data_directory': '/var/lib/db',
+        'credentials': {'user': 'app', 'password': 'secret'},
+        'replicas': ['replica-1', 'replica-2'],
+        'weights': {'replica-1': '2'}
+    }
+    arguments: dict[str, Any] = ConfigurationBinder(DatabaseSettings).bind(section)
+
+    assert arguments == {
+        'host': host,
+        'port': 5432,
+        'timeout': 3.0,
+        'debug': True,
+        'data_directory': Path('/var/lib/db'),
+        'credentials': Credentials(user='app', password='secret'),
+        'replicas': ['replica-1', 'replica-2'],
+        'weights': {'replica-1': 2}
+    }
+    assert arguments['host'] is host
+    assert type(arguments['timeout']) is float
+
+
+def test_parameters_missing_from_the_section_are_left_out() -> None:
+    section: dict[str, Any] = {'port': 5432, 'unknown': 'value'}
+
+    assert ConfigurationBinder(DatabaseSettings).bind(section) == {'port': 5432}
+
+
+@pytest.mark.parametrize(('name', 'value'), [
+    ('port', 'not-a-port'),
+    ('credentials', {'user': 'app'}),
+    ('weights', {'replica-1': 'heavy'})
+])
+def test_invalid_values_name_the_offending_parameter(name: str, value: Any) -> None:
+    with pytest.raises(TypeError, match=f'Cannot parse parameter "{name}" of .*DatabaseSettings') as error:
+        ConfigurationBinder(DatabaseSettings).bind({name: value})
+
+    assert isinstance(error.value.__cause__, ValueError)
+
+
+def test_unsupported_annotations_are_rejected_when_bound() -> None:
+    binder: ConfigurationBinder = ConfigurationBinder(DatabaseSettings)
+
+    assert binder.bind({}) == {}
+
+    with pytest.raises(TypeError, match='cannot be annotated as ~Label'):
+        binder.bind({'label': 'primary'})
+
+    with pytest.raises(TypeError, match='cannot be annotated as ~Label'):
+        _compile_coercion(Label)('primary')
+
+
+def test_type_adapters_are_reused_across_binders_and_binds(type_adapters: None) -> None:
+    first: ConfigurationBinder = ConfigurationBinder(DatabaseSettings)
+    second: ConfigurationBinder = ConfigurationBinder(DatabaseSettings)
+
+    # One adapter each for list[str] and dict[str, int]
+    assert _cached_type_adapter.cache_info().misses == 2
+    assert _cached_type_adapter.cache_info().hits == 2
+
+    section: dict[str, Any] = {'replicas': ('replica-1',)}
+
+    for binder in (first, second, first):
+        assert binder.bind(section) == {'replicas': ['replica-1']}
+
+    assert _cached_type_adapter.cache_info().misses == 2
+    assert _cached_type_adapter.cache_info().hits == 2
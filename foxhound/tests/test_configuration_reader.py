@@ -0,0 +1,72 @@
+import importlib.util
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+import yaml
+
+from foxhound.configuration import ConfigurationReader
+from foxhound.configuration.configuration_reader import ConfigurationSection, _index_sections
+
+_CONFIGURATION: str = '''
+database:
+  primary:
+    host: db.internal
+    port: 5432
+  pool.size: 10
+mail:
+  sender: ops@example.com
+'''
+
+
+@pytest.fixture
+def configuration_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path: Path = tmp_path / 'application.yaml'
+    path.write_text(_CONFIGURATION)
+    monkeypatch.setenv('FOXHOUND_CONFIGURATION_PATH', str(path))
+    monkeypatch.delenv('FOXHOUND_CONFIGURATION_SNAPSHOT_DIR', raising=False)
+
+    return path
+
+
+def test_sections_are_indexed_by_dotted_path() -> None:
+    primary: dict[str, Any] = {'host': 'db.internal'}
+    configuration: dict[Any, Any] = {'database': {'primary': primary, 'pool.size': 10}, 1: 'one'}
+    sections: dict[str | None, Any] = _index_sections(configuration)
+
+    assert sections[None] is configuration
+    assert sections['database.primary'] is primary
+    assert sections['database.primary.host'] == 'db.internal'
+    # Neither 'pool.size' nor 1 can be addressed by a dotted path
+    assert sorted(path for path in sections if path is not None) == [
+        'database', 'database.primary', 'database.primary.host'
+    ]
+
+
+def test_nested_sections_are_read_by_dotted_path(configuration_path: Path) -> None:
+    reader: ConfigurationReader = ConfigurationReader()
+
+    assert reader.read('database.primary') == {'host': 'db.internal', 'port': 5432}
+    assert reader.read('mail') == {'sender': 'ops@example.com'}
+    assert reader.read(None)['mail'] is reader.read('mail')
+
+
+@pytest.mark.parametrize('section', ['database.replica', 'database.primary.user', 'database.pool', 'missing'])
+def test_missing_sections_are_reported(configuration_path: Path, section: str) -> None:
+    with pytest.raises(KeyError, match=f'Section "{section}" not found'):
+        ConfigurationReader().read(section)
+
+
+def test_safe_loader_is_used_without_libyaml(configuration_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delattr(yaml, 'CSafeLoader', raising=False)
+    # A fresh copy of the module, so the registered reader component is left alone
+    spec: ModuleSpec | None = importlib.util.find_spec('foxhound.configuration.configuration_reader')
+    assert spec is not None and spec.loader is not None
+    module: ModuleType = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    section: ConfigurationSection = module.ConfigurationReader().read('database.primary')
+
+    assert module._YamlLoader is yaml.SafeLoader
+    assert section == {'host': 'db.internal', 'port': 5432}
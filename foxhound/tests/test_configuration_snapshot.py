@@ -0,0 +1,117 @@
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from foxhound.configuration.snapshot import ConfigurationSnapshot
+
+_CONFIGURATION: dict[str, Any] = {'database': {'url': 'sqlite://first'}}
+
+unpickled: list[str] = []
+
+
+def record_unpickling(name: str) -> None:
+    unpickled.append(name)
+
+
+class Exploit:
+    def __reduce__(self) -> tuple[Any, ...]:
+        return record_unpickling, ('exploit',)
+
+
+@pytest.fixture
+def source_path(tmp_path: Path) -> Path:
+    path: Path = tmp_path / 'application.yaml'
+    path.write_text('database:\n  url: sqlite://first\n')
+
+    return path
+
+
+def _snapshot(tmp_path: Path, source_path: Path) -> tuple[ConfigurationSnapshot, Path]:
+    snapshot: ConfigurationSnapshot = ConfigurationSnapshot(str(tmp_path / 'snapshots'))
+    snapshot.save(str(source_path), source_path.read_bytes(), _CONFIGURATION)
+    [snapshot_path] = (tmp_path / 'snapshots').iterdir()
+
+    return snapshot, snapshot_path
+
+
+def _touch(path: Path) -> None:
+    mtime: int = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_saved_snapshot_is_loaded(tmp_path: Path, source_path: Path) -> None:
+    snapshot, _ = _snapshot(tmp_path, source_path)
+
+    assert snapshot.load(str(source_path)) == _CONFIGURATION
+
+
+def test_touched_file_with_the_same_content_keeps_its_snapshot(tmp_path: Path, source_path: Path) -> None:
+    snapshot, snapshot_path = _snapshot(tmp_path, source_path)
+    content: bytes = snapshot_path.read_bytes()
+    _touch(source_path)
+
+    assert snapshot.load(str(source_path)) == _CONFIGURATION
+    # Rewritten with the new mtime, so the content isn't hashed again next time
+    assert snapshot_path.read_bytes() != content
+    assert snapshot.load(str(source_path)) == _CONFIGURATION
+
+
+def test_snapshot_with_a_stale_source_digest_is_ignored(tmp_path: Path, source_path: Path) -> None:
+    snapshot, _ = _snapshot(tmp_path, source_path)
+    # Same size, different content
+    source_path.write_text('database:\n  url: sqlite://secnd\n')
+    _touch(source_path)
+
+    assert snapshot.load(str(source_path)) is None
+
+
+def test_snapshot_with_a_corrupt_payload_is_ignored(tmp_path: Path, source_path: Path) -> None:
+    snapshot, snapshot_path = _snapshot(tmp_path, source_path)
+    content: bytes = snapshot_path.read_bytes()
+    snapshot_path.write_bytes(content[:-1] + bytes([content[-1] ^ 1]))
+
+    assert snapshot.load(str(source_path)) is None
+
+
+def test_truncated_snapshot_is_ignored(tmp_path: Path, source_path: Path) -> None:
+    snapshot, snapshot_path = _snapshot(tmp_path, source_path)
+    content: bytes = snapshot_path.read_bytes()
+
+    # Cut within the prefix, the header and the payload
+    for size in (0, 10, 30, len(content) // 2, len(content) - 1):
+        snapshot_path.write_bytes(content[:size])
+
+        assert snapshot.load(str(source_path)) is None
+
+
+def test_foreign_snapshot_is_never_unpickled(tmp_path: Path, source_path: Path) -> None:
+    snapshot, snapshot_path = _snapshot(tmp_path, source_path)
+    unpickled.clear()
+    snapshot_path.write_bytes(pickle.dumps(Exploit()))
+
+    assert snapshot.load(str(source_path)) is None
+    assert unpickled == []
+
+
+def test_snapshot_of_another_format_version_is_ignored(tmp_path: Path, source_path: Path) -> None:
+    snapshot, snapshot_path = _snapshot(tmp_path, source_path)
+    content: bytes = snapshot_path.read_bytes()
+    version_offset: int = len(b'FOXHOUND-SNAPSHOT')
+    snapshot_path.write_bytes(content[:version_offset] + b'\x00\x01' + content[version_offset + 2:])
+
+    assert snapshot.load(str(source_path)) is None
+
+
+def test_unwritable_directory_is_ignored(tmp_path: Path, source_path: Path) -> None:
+    # A file where the directory should be cannot be written to by anyone, root included
+    directory: Path = tmp_path / 'snapshots'
+    directory.write_text('')
+    snapshot: ConfigurationSnapshot = ConfigurationSnapshot(str(directory))
+
+    snapshot.save(str(source_path), source_path.read_bytes(), _CONFIGURATION)
+
+    assert snapshot.load(str(source_path)) is None
+    assert directory.read_text() == ''
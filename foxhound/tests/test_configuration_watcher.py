@@ -0,0 +1,147 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from foxhound import Container, start, start_async
+from foxhound.configuration import ConfigurationReader, ConfigurationWatcher, configuration
+from foxhound.core.di.graph.exceptions import ComponentInflationError
+from foxhound.tests.conftest import ComponentModule
+
+
+@configuration(section='database')
+class DatabaseSettings:
+    def __init__(self, url: str):
+        self.url = url
+
+
+@configuration(section='mail')
+class MailSettings:
+    def __init__(self, sender: str):
+        self.sender = sender
+
+
+class Repository:
+    def __init__(self, settings: DatabaseSettings) -> None:
+        self.settings = settings
+
+
+class FeatureFlags:
+    def __init__(self, reader: ConfigurationReader) -> None:
+        self.reader = reader
+
+
+class Client:
+    def __init__(self, settings: DatabaseSettings) -> None:
+        self.settings = settings
+
+
+class Gateway:
+    def __init__(self, settings: DatabaseSettings) -> None:
+        if len(gateway_failures) != 0:
+            raise gateway_failures.pop()
+
+        self.settings = settings
+
+
+client_loops: list[asyncio.AbstractEventLoop] = []
+gateway_failures: list[Exception] = []
+# Scanned along with the components of every test
+_configuration: list[Any] = [ConfigurationReader, DatabaseSettings, MailSettings]
+
+
+async def client(settings: DatabaseSettings) -> Client:
+    client_loops.append(asyncio.get_running_loop())
+    return Client(settings)
+
+
+def _write(path: Path, database_url: str) -> None:
+    previous_mtime: int = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(f'database:\n  url: {database_url}\nmail:\n  sender: ops@example.com\n')
+    # Rewrites within the filesystem's timestamp resolution must still look changed
+    os.utime(path, ns=(previous_mtime + 1_000_000_000,) * 2)
+
+
+@pytest.fixture
+def configuration_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path: Path = tmp_path / 'application.yaml'
+    _write(path, 'sqlite://first')
+    monkeypatch.setenv('FOXHOUND_CONFIGURATION_PATH', str(path))
+    monkeypatch.delenv('FOXHOUND_CONFIGURATION_SNAPSHOT_DIR', raising=False)
+
+    return path
+
+
+def test_only_components_of_changed_sections_are_reinflated(
+        configuration_path: Path,
+        component_module: ComponentModule
+) -> None:
+    container: Container = start(component_module(Repository, FeatureFlags, members=_configuration))
+    mail_settings: MailSettings = container.get(MailSettings)
+    watcher: ConfigurationWatcher = ConfigurationWatcher(container)
+
+    _write(configuration_path, 'sqlite://second')
+
+    assert watcher.check()
+    assert container.get(Repository).settings.url == 'sqlite://second'
+    assert container.get(Repository).settings is container.get(DatabaseSettings)
+    assert container.get(MailSettings) is mail_settings
+    assert container.get(FeatureFlags).reader is container.get(ConfigurationReader)
+
+
+def test_unchanged_content_reinflates_nothing(configuration_path: Path, component_module: ComponentModule) -> None:
+    container: Container = start(component_module(Repository, FeatureFlags, members=_configuration))
+    flags: FeatureFlags = container.get(FeatureFlags)
+    reader: ConfigurationReader = container.get(ConfigurationReader)
+    watcher: ConfigurationWatcher = ConfigurationWatcher(container)
+
+    _write(configuration_path, 'sqlite://first')
+
+    assert not watcher.check()
+    assert container.get(FeatureFlags) is flags
+    assert container.get(ConfigurationReader) is reader
+
+
+def test_failed_reload_is_retried_on_the_next_check(
+        configuration_path: Path,
+        component_module: ComponentModule
+) -> None:
+    container: Container = start(component_module(Gateway, members=_configuration))
+    watcher: ConfigurationWatcher = ConfigurationWatcher(container)
+
+    _write(configuration_path, 'sqlite://second')
+    gateway_failures.append(ConnectionError('database unreachable'))
+
+    with pytest.raises(ComponentInflationError):
+        watcher.check()
+
+    assert container.get(Gateway).settings.url == 'sqlite://first'
+    assert watcher.check()
+    assert container.get(Gateway).settings.url == 'sqlite://second'
+    assert not watcher.check()
+
+
+def test_async_factories_are_awaited_on_the_watchers_event_loop(
+        configuration_path: Path,
+        component_module: ComponentModule
+) -> None:
+    client_loops.clear()
+
+    async def run() -> str:
+        container: Container = await start_async(component_module(client, members=_configuration))
+        watcher: ConfigurationWatcher = ConfigurationWatcher(container)
+        _write(configuration_path, 'sqlite://second')
+
+        with pytest.raises(RuntimeError, match='another thread'):
+            watcher.check()
+
+        _write(configuration_path, 'sqlite://third')
+
+        assert await asyncio.to_thread(watcher.check)
+        assert client_loops == [asyncio.get_running_loop()] * 2
+
+        return container.get(Client).settings.url
+
+    assert asyncio.run(run()) == 'sqlite://third'
@@ -0,0 +1,114 @@
+from typing import Any
+
+import pytest
+
+from foxhound import Container
+from foxhound.core.di.exceptions import ComponentLookupError
+from foxhound.core.di.models import Component, ComponentMetadata
+
+
+class Notifier:
+    pass
+
+
+class EmailNotifier(Notifier):
+    pass
+
+
+class SmsNotifier(Notifier):
+    pass
+
+
+class Clock:
+    pass
+
+
+def _component(value: Any, qualifier: str | None = None, primary: bool = False) -> Component[Any]:
+    return Component(
+        metadata=ComponentMetadata(
+            id=f'{type(value).__name__}:{qualifier}',
+            qualifier=qualifier,
+            primary=primary,
+            kind=type(value)
+        ),
+        value=value
+    )
+
+
+def _container(*components: Component[Any]) -> Container:
+    container: Container = Container()
+
+    for component in components:
+        container.register_component(component)
+
+    return container
+
+
+def test_qualified_lookup_selects_among_components_of_the_same_kind() -> None:
+    email: EmailNotifier = EmailNotifier()
+    sms: SmsNotifier = SmsNotifier()
+    container: Container = _container(_component(email, 'email'), _component(sms, 'sms'))
+
+    assert container.get(Notifier, 'sms') is sms
+    assert container.find_component(Notifier, 'email').value is email
+
+
+def test_qualified_lookup_checks_the_kind() -> None:
+    container: Container = _container(_component(EmailNotifier(), 'email'))
+
+    with pytest.raises(ComponentLookupError, match='does not match'):
+        container.get(Clock, 'email')
+
+
+def test_lookup_by_supertype() -> None:
+    email: EmailNotifier = EmailNotifier()
+    container: Container = _container(_component(email), _component(Clock()))
+
+    assert container.get(Notifier) is email
+    assert container.find_component(EmailNotifier).value is email
+
+
+def test_list_lookup_falls_back_to_every_component_of_the_item_kind() -> None:
+    email: EmailNotifier = EmailNotifier()
+    sms: SmsNotifier = SmsNotifier()
+    container: Container = _container(_component(email), _component(sms), _component(Clock()))
+
+    assert container.get(list[Notifier]) == [email, sms]
+    assert container.get(list[EmailNotifier]) == [email]
+
+
+def test_primary_component_breaks_ambiguity() -> None:
+    sms: SmsNotifier = SmsNotifier()
+    container: Container = _container(_component(EmailNotifier()), _component(sms, primary=True))
+
+    assert container.get(Notifier) is sms
+
+
+def test_ambiguous_lookup_is_rejected() -> None:
+    container: Container = _container(_component(EmailNotifier()), _component(SmsNotifier()))
+
+    with pytest.raises(ComponentLookupError, match='Multiple components'):
+        container.get(Notifier)
+
+    with pytest.raises(ComponentLookupError, match='Multiple components'):
+        container.find_component(Notifier)
+
+
+def test_missing_component_is_a_lookup_error() -> None:
+    container: Container = _container(_component(EmailNotifier(), 'email'))
+
+    with pytest.raises(ComponentLookupError, match='No registered component matching'):
+        container.get(Clock)
+
+    with pytest.raises(ComponentLookupError, match='No registered component with qualifier "sms"'):
+        container.get(Notifier, 'sms')
+
+    with pytest.raises(ComponentLookupError):
+        container.find_component(Clock)
+
+
+def test_duplicate_qualifiers_are_rejected() -> None:
+    container: Container = _container(_component(EmailNotifier(), 'notifier'))
+
+    with pytest.raises(ValueError, match='already exists'):
+        container.register_component(_component(SmsNotifier(), 'notifier'))
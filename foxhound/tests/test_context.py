@@ -0,0 +1,112 @@
+import asyncio
+import contextvars
+import threading
+from typing import Any
+
+import pytest
+
+from foxhound import Container, component_context, start
+from foxhound.core.di.exceptions import NoActiveContextError
+from foxhound.tests.conftest import ComponentModule
+
+# Set by tests that need every factory call to overlap with another one
+_overlapping: list[threading.Barrier] = []
+created: list['UnitOfWork'] = []
+
+
+class Database:
+    pass
+
+
+class UnitOfWork:
+    def __init__(self, database: Database) -> None:
+        self.database = database
+        self.closed = False
+        created.append(self)
+
+        for barrier in _overlapping:
+            barrier.wait()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+_context_scoped: dict[Any, dict[str, Any]] = {UnitOfWork: {'scope': 'context'}}
+
+
+def _instance(proxy: Any) -> UnitOfWork:
+    instance: UnitOfWork = object.__getattribute__(proxy, '_foxhound_target')()
+    return instance
+
+
+def test_instance_is_shared_within_a_context_and_closed_when_it_exits(component_module: ComponentModule) -> None:
+    container: Container = start(component_module(Database, UnitOfWork, target_options=_context_scoped))
+    proxy: UnitOfWork = container.get(UnitOfWork)
+
+    with component_context():
+        instance: UnitOfWork = _instance(proxy)
+
+        assert _instance(proxy) is instance
+        assert proxy.database is container.get(Database)
+
+    assert instance.closed
+
+    with component_context():
+        assert _instance(proxy) is not instance
+
+
+def test_use_outside_of_a_context_fails(component_module: ComponentModule) -> None:
+    proxy: UnitOfWork = start(component_module(Database, UnitOfWork, target_options=_context_scoped)).get(UnitOfWork)
+
+    with pytest.raises(NoActiveContextError):
+        _ = proxy.database
+
+
+def test_concurrent_tasks_get_their_own_instances(component_module: ComponentModule) -> None:
+    proxy: UnitOfWork = start(component_module(Database, UnitOfWork, target_options=_context_scoped)).get(UnitOfWork)
+
+    async def handle() -> UnitOfWork:
+        with component_context():
+            await asyncio.sleep(0)
+            return _instance(proxy)
+
+    async def run() -> tuple[UnitOfWork, UnitOfWork]:
+        return await asyncio.gather(handle(), handle())
+
+    first, second = asyncio.run(run())
+
+    assert first is not second
+    assert first.closed and second.closed
+
+
+def test_instance_losing_a_race_between_threads_is_closed(component_module: ComponentModule) -> None:
+    proxy: UnitOfWork = start(component_module(Database, UnitOfWork, target_options=_context_scoped)).get(UnitOfWork)
+    _overlapping.append(threading.Barrier(2, timeout=5))
+    created.clear()
+    instances: list[UnitOfWork] = []
+
+    def use() -> None:
+        instances.append(_instance(proxy))
+
+    try:
+        with component_context():
+            # Copies of the current context share its instances
+            threads: list[threading.Thread] = [
+                threading.Thread(target=contextvars.copy_context().run, args=(use,)) for _ in range(2)
+            ]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+            loser: UnitOfWork = next(instance for instance in created if instance is not instances[0])
+
+            assert instances[0] is instances[1]
+            assert loser.closed
+            assert not instances[0].closed
+    finally:
+        _overlapping.clear()
+
+    assert instances[0].closed
@@ -0,0 +1,184 @@
+import sys
+
+import pytest
+
+from foxhound.core.di.graph.dependency_graph import DependencyGraph
+from foxhound.core.di.graph.exceptions import CyclicGraphError
+from foxhound.core.di.models import ComponentDefinition, ComponentMetadata, Parameter
+
+
+def _graph(nodes: dict[str, list[list[str]]]) -> DependencyGraph:
+    # Each node lists the components every one of its parameters resolved to
+    node_ids: dict[str, int] = {component_id: node for node, component_id in enumerate(nodes)}
+
+    return DependencyGraph(
+        [
+            ComponentDefinition(metadata=ComponentMetadata(id=component_id, kind=object), inflator=object)
+            for component_id in nodes
+        ],
+        [
+            [
+                Parameter(name=f'p{index}', kind=object, parent_component_id=component_id)
+                for index in range(len(parameters))
+            ]
+            for component_id, parameters in nodes.items()
+        ],
+        [
+            [node_ids[dependency] for dependency in dependencies]
+            for parameters in nodes.values()
+            for dependencies in parameters
+        ]
+    )
+
+
+def _service_graph() -> DependencyGraph:
+    # Declared dependents first, so index order and topological order differ
+    return _graph({
+        'service': [['repository'], ['database']],
+        'repository': [['database', 'cache'], []],
+        'cache': [['database']],
+        'database': [],
+        'clock': []
+    })
+
+
+def _cyclic_graph() -> DependencyGraph:
+    return _graph({
+        'a': [['b']],
+        'b': [['c', 'a']],
+        'c': [['a']],
+        'd': [['e']],
+        'e': [['f']],
+        'f': [['d', 'e']],
+        'g': [['g']],
+        'h': [['a']],
+        'i': []
+    })
+
+
+def test_node_ids_follow_definition_order() -> None:
+    graph: DependencyGraph = _service_graph()
+
+    assert len(graph) == 5
+    assert [graph.node_id(component_id) for component_id in ('service', 'database', 'clock')] == [0, 3, 4]
+
+    with pytest.raises(KeyError):
+        graph.node_id('missing')
+
+
+def test_parameter_ranges_are_contiguous_per_node() -> None:
+    graph: DependencyGraph = _service_graph()
+
+    assert [graph.parameter_range(node) for node in range(len(graph))] == [
+        range(0, 2), range(2, 4), range(4, 5), range(5, 5), range(5, 5)
+    ]
+    assert [graph.parameters[parameter].parent_component_id for parameter in graph.parameter_range(1)] == [
+        'repository', 'repository'
+    ]
+
+
+def test_parameter_dependencies_are_sliced_per_parameter() -> None:
+    graph: DependencyGraph = _service_graph()
+
+    assert [list(graph.parameter_dependencies(parameter)) for parameter in range(5)] == [[1], [3], [3, 2], [], [3]]
+
+
+def test_dependencies_and_dependents_are_mirrored() -> None:
+    graph: DependencyGraph = _service_graph()
+
+    assert [list(graph.dependencies(node)) for node in range(len(graph))] == [[1, 3], [3, 2], [3], [], []]
+    assert graph.dependents() == [[], [0], [1], [0, 1, 2], []]
+
+
+def test_with_dependents_follows_transitive_dependents() -> None:
+    graph: DependencyGraph = _service_graph()
+
+    assert graph.with_dependents({2}) == {2, 1, 0}
+    assert graph.with_dependents({3}) == {3, 2, 1, 0}
+    assert graph.with_dependents({4}) == {4}
+
+
+def test_with_dependents_stops_at_excluded_nodes() -> None:
+    graph: DependencyGraph = _service_graph()
+
+    # The service still depends on the database directly
+    assert graph.with_dependents({3}, excluded={1}) == {3, 2, 0}
+    assert graph.with_dependents({2}, excluded={1}) == {2}
+
+
+def test_topological_order_puts_dependencies_first() -> None:
+    graph: DependencyGraph = _service_graph()
+    order: list[int] = graph.topological_order()
+    positions: dict[int, int] = {node: position for position, node in enumerate(order)}
+
+    assert sorted(order) == list(range(len(graph)))
+    assert all(
+        positions[dependency] < positions[node]
+        for node in range(len(graph))
+        for dependency in graph.dependencies(node)
+    )
+    assert graph.is_acyclic()
+
+
+def test_in_topological_order_orders_a_subset() -> None:
+    graph: DependencyGraph = _service_graph()
+
+    assert graph.in_topological_order({0, 2, 3}) == [3, 2, 0]
+    assert graph.in_topological_order(set()) == []
+
+
+def test_to_networkx_requires_the_debug_extra(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, 'networkx', None)
+
+    with pytest.raises(ImportError, match=r'foxhound\[debug\]'):
+        _service_graph().to_networkx()
+
+
+def test_to_networkx_links_components_through_their_parameters() -> None:
+    pytest.importorskip('networkx')
+    exported = _service_graph().to_networkx()
+
+    assert set(exported.successors('repository')) == {'p0@repository', 'p1@repository'}
+    assert set(exported.successors('p0@repository')) == {'database', 'cache'}
+    assert set(exported.successors('p1@repository')) == set()
+    assert set(exported.successors('clock')) == set()
+
+
+def test_analysis_finds_every_cyclic_cluster_and_leaves_them_out_of_the_order() -> None:
+    graph: DependencyGraph = _cyclic_graph()
+
+    assert sorted(sorted(component) for component in graph.cyclic_components()) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert graph.topological_order() == [8]
+    assert graph.in_topological_order({0, 7, 8}) == [8]
+    assert not graph.is_acyclic()
+
+
+def test_shortest_cycle_starts_at_the_first_node_of_the_cluster() -> None:
+    graph: DependencyGraph = _cyclic_graph()
+
+    # The shorter e → f → e cycle doesn't pass through d
+    assert graph.shortest_cycle([2, 1, 0]) == [0, 1]
+    assert graph.shortest_cycle([5, 4, 3]) == [3, 4, 5]
+    assert graph.shortest_cycle([6]) == [6]
+
+
+def test_cyclic_graph_error_reports_the_shortest_cycle_of_each_cluster() -> None:
+    error: CyclicGraphError = CyclicGraphError(_cyclic_graph())
+
+    assert error.clusters == [['a', 'b', 'c'], ['d', 'e', 'f'], ['g']]
+    assert error.cycles == [['a', 'b'], ['d', 'e', 'f'], ['g']]
+    assert str(error) == (
+        'Cyclic dependencies detected: '
+        'a → b → a (cluster of 3); d → e → f → d (cluster of 3); g → g (cluster of 1)'
+    )
+
+
+def test_cyclic_graph_error_truncates_clusters_beyond_the_cap() -> None:
+    error: CyclicGraphError = CyclicGraphError(_cyclic_graph(), max_cycles=2)
+
+    assert len(error.clusters) == 3
+    assert error.cycles == [['a', 'b'], ['d', 'e', 'f']]
+    assert str(error) == (
+        'Cyclic dependencies detected: '
+        'a → b → a (cluster of 3); d → e → f → d (cluster of 3); 1 more cyclic clusters'
+    )
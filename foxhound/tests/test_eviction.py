@@ -0,0 +1,57 @@
+from typing import Any
+
+import pytest
+
+from foxhound import Component, Container, EvictionSettings, define_component, start
+from foxhound.tests.conftest import ComponentModule
+
+
+class Report:
+    def __init__(self) -> None:
+        self.lines = ['header']
+
+
+class Summary:
+    def __init__(self, report: Report) -> None:
+        self.report = report
+        self.totals = [1, 2, 3]
+
+    def compute(self) -> int:
+        # Inflating the report evicts this very instance, whose method is still running
+        self.report.lines.append('footer')
+        return sum(self.totals) + len(self.report.lines)
+
+
+def test_instance_evicted_while_in_use_keeps_working(component_module: ComponentModule) -> None:
+    container: Container = start(
+        component_module(Report, Summary, scope='evictable'),
+        eviction=EvictionSettings(max_components=1)
+    )
+    summary: Any = container.get(Summary)
+
+    assert summary.compute() == 8
+    assert container.eviction.statistics().evictions == 1
+
+
+def test_swapped_out_components_stop_counting_against_the_budget(component_module: ComponentModule) -> None:
+    container: Container = start(
+        component_module(Report, scope='evictable'),
+        eviction=EvictionSettings(max_components=1)
+    )
+    report: Component[Report] = container.find_component(Report)
+
+    assert report.value.lines == ['header']
+    assert container.eviction.statistics().resident == 1
+
+    container.swap_components([report.metadata.id], [Component(metadata=report.metadata, value=Report())])
+
+    assert container.eviction.statistics().resident == 0
+
+
+def test_evictable_components_cannot_own_resources() -> None:
+    class Connection:
+        def close(self) -> None:
+            pass
+
+    with pytest.raises(TypeError, match='evictable'):
+        define_component(Connection, scope='evictable')
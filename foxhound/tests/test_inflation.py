@@ -0,0 +1,71 @@
+import sys
+from collections import Counter
+from typing import Any
+
+import pytest
+
+from foxhound import Container, start
+from foxhound.core.di.graph.exceptions import ComponentInflationError
+from foxhound.tests.conftest import ComponentModule
+
+inflated: Counter[str] = Counter()
+
+
+def _link(index: int, previous: type | None) -> type:
+    # One class per link, each depending on the one before it
+    def initialize(self: Any) -> None:
+        inflated[type(self).__name__] += 1
+        self.previous = None
+
+    def initialize_linked(self: Any, previous_link: Any) -> None:
+        inflated[type(self).__name__] += 1
+        self.previous = previous_link
+
+    if previous is not None:
+        initialize_linked.__annotations__['previous_link'] = previous
+
+    return type(f'Link{index}', (), {'__init__': initialize if previous is None else initialize_linked})
+
+
+def _chain(length: int) -> list[type]:
+    links: list[type] = []
+
+    for index in range(length):
+        links.append(_link(index, links[-1] if len(links) != 0 else None))
+
+    return links
+
+
+@pytest.mark.parametrize('max_workers', [None, 4])
+def test_chain_deeper_than_the_recursion_limit_inflates_each_link_once(
+        component_module: ComponentModule,
+        max_workers: int | None
+) -> None:
+    links: list[type] = _chain(sys.getrecursionlimit() + 100)
+    inflated.clear()
+
+    container: Container = start(component_module(*links), max_workers=max_workers)
+    last: Any = container.get(links[-1])
+
+    assert inflated == Counter({link.__name__: 1 for link in links})
+    assert last.previous is container.get(links[-2])
+
+
+def test_failing_factory_in_a_chain_names_its_component(component_module: ComponentModule) -> None:
+    links: list[type] = _chain(2)
+
+    def fail(self: Any, previous_link: Any) -> None:
+        inflated['BrokenLink'] += 1
+        raise ValueError('broken factory')
+
+    fail.__annotations__['previous_link'] = links[1]
+    broken: type = type('BrokenLink', (), {'__init__': fail})
+    dependent: type = _link(5, broken)
+    inflated.clear()
+
+    with pytest.raises(ComponentInflationError) as error:
+        start(component_module(*links, broken, dependent))
+
+    assert error.value.component_id == str(broken)
+    assert isinstance(error.value.__cause__, ValueError)
+    assert inflated == Counter({'Link0': 1, 'Link1': 1, 'BrokenLink': 1})
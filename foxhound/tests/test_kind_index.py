@@ -0,0 +1,91 @@
+import abc
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import pytest
+
+from foxhound.core.di.kind_index import KindIndex
+from foxhound.core.utils.typing import clear_type_caches, type_cache_generation
+
+
+class Storage(abc.ABC):
+    @abc.abstractmethod
+    def read(self) -> bytes:
+        ...
+
+
+class Cache(abc.ABC):
+    @abc.abstractmethod
+    def read(self) -> bytes:
+        ...
+
+
+class Volume(abc.ABC):
+    @abc.abstractmethod
+    def read(self) -> bytes:
+        ...
+
+
+class DiskStorage:
+    def read(self) -> bytes:
+        return b''
+
+
+class LocalDisk(DiskStorage):
+    pass
+
+
+def test_finds_subclasses_through_the_mro() -> None:
+    index: KindIndex[type] = KindIndex(lambda kind: kind)
+    index.add(LocalDisk)
+
+    assert index.find(DiskStorage) == [LocalDisk]
+    assert index.find(LocalDisk) == [LocalDisk]
+
+
+def test_virtual_subclasses_registered_later_are_found_once_type_caches_are_cleared() -> None:
+    index: KindIndex[type] = KindIndex(lambda kind: kind)
+    index.add(DiskStorage)
+
+    assert index.find(Storage) == []
+
+    Storage.register(DiskStorage)
+    clear_type_caches()
+
+    assert index.find(Storage) == [DiskStorage]
+
+
+def test_clearing_type_caches_drops_memoized_scans() -> None:
+    index: KindIndex[type] = KindIndex(lambda kind: kind)
+    index.add(LocalDisk)
+    generation: int = type_cache_generation()
+
+    assert index.find(Cache) == []
+
+    Cache.register(LocalDisk)
+    assert index.find(Cache) == []
+
+    clear_type_caches()
+
+    assert type_cache_generation() == generation + 1
+    assert index.find(Cache) == [LocalDisk]
+
+
+
+def test_scan_racing_with_an_added_entry_is_not_served_again(monkeypatch: pytest.MonkeyPatch) -> None:
+    Volume.register(DiskStorage)
+    clear_type_caches()
+    index: KindIndex[type] = KindIndex(lambda kind: kind)
+    index.add(DiskStorage)
+    scan: Callable[[Any, Iterable[type]], list[type]] = index._scan
+
+    def racing_scan(kind: Any, entries: Iterable[type]) -> list[type]:
+        # Another thread registers an entry while this one scans
+        index.add(LocalDisk)
+        return scan(kind, entries)
+
+    monkeypatch.setattr(index, '_scan', racing_scan)
+    assert index.find(Volume) == [DiskStorage]
+
+    monkeypatch.setattr(index, '_scan', scan)
+    assert index.find(Volume) == [DiskStorage, LocalDisk]
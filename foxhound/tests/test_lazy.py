@@ -0,0 +1,77 @@
+
+import pytest
+
+from foxhound import Container, Lazy, define_component, start
+from foxhound.core.di.exceptions import UnsatisfiedDependenciesError
+from foxhound.tests.conftest import ComponentModule
+
+inflated: list[str] = []
+
+
+class Exporter:
+    def __init__(self) -> None:
+        inflated.append('exporter')
+        self.exported = 0
+
+    def export(self) -> int:
+        self.exported += 1
+        return self.exported
+
+
+class Clock:
+    pass
+
+
+class ReportJob:
+    def __init__(self, exporter: Lazy[Exporter]) -> None:
+        self.exporter = exporter
+
+
+class Scheduler:
+    def __init__(self, clock: Lazy[Clock]) -> None:
+        self.clock = clock
+
+
+class Printer:
+    def __init__(self, exporter: Exporter) -> None:
+        self.exporter = exporter
+
+
+def test_lazy_component_is_inflated_on_first_use(component_module: ComponentModule) -> None:
+    inflated.clear()
+    container: Container = start(component_module(Exporter, Printer, target_options={Exporter: {'lazy': True}}))
+    printer: Printer = container.get(Printer)
+
+    assert isinstance(printer.exporter, Exporter)
+    assert inflated == []
+
+    assert printer.exporter.export() == 1
+    assert printer.exporter.export() == 2
+    assert inflated == ['exporter']
+
+
+def test_lazy_parameter_returns_the_instance_itself(component_module: ComponentModule) -> None:
+    inflated.clear()
+    container: Container = start(component_module(Exporter, ReportJob, target_options={Exporter: {'lazy': True}}))
+    job: ReportJob = container.get(ReportJob)
+
+    assert inflated == []
+
+    exporter: Exporter = job.exporter.get()
+
+    assert type(exporter) is Exporter
+    assert job.exporter.get() is exporter
+    assert inflated == ['exporter']
+
+
+def test_lazy_parameter_of_an_eager_component_is_rejected(component_module: ComponentModule) -> None:
+    with pytest.raises(UnsatisfiedDependenciesError, match='lazy=True'):
+        start(component_module(Clock, Scheduler))
+
+
+def test_lazy_components_cannot_have_async_factories() -> None:
+    async def exporter() -> Exporter:
+        return Exporter()
+
+    with pytest.raises(TypeError, match='Lazy'):
+        define_component(exporter, lazy=True)
@@ -0,0 +1,102 @@
+import sys
+from typing import Any
+
+from foxhound import Container, memory_usage
+from foxhound.core.di.models import Component, ComponentMetadata, MemoryUsage
+from foxhound.core.utils.memory import deep_size, shallow_size
+
+_BLOB_SIZE: int = 100_000
+
+
+class Cache:
+    def __init__(self, blob: bytes) -> None:
+        self.blob = blob
+        # Components may well reference themselves
+        self.cache = self
+
+
+class Service:
+    def __init__(self, cache: Cache) -> None:
+        self.cache = cache
+
+
+def _container(*values: tuple[Any, str | None]) -> Container:
+    container: Container = Container()
+
+    for index, (value, qualifier) in enumerate(values):
+        container.register_component(
+            Component(
+                metadata=ComponentMetadata(
+                    id=f'{type(value).__name__}:{index}',
+                    qualifier=qualifier,
+                    kind=type(value)
+                ),
+                value=value
+            )
+        )
+
+    return container
+
+
+def test_deep_size_counts_shared_referents_once() -> None:
+    blob: bytes = bytes(_BLOB_SIZE)
+    values: list[bytes] = [blob, blob]
+
+    assert deep_size(values) == sys.getsizeof(values) + sys.getsizeof(blob)
+
+
+def test_deep_size_follows_cycles_once() -> None:
+    cycle: list[Any] = []
+    cycle.append(cycle)
+    pair: dict[str, Any] = {}
+    pair['other'] = {'other': pair}
+
+    assert deep_size(cycle) == sys.getsizeof(cycle)
+    # Dictionaries don't expose their string keys as referents
+    assert deep_size(pair) == 2 * sys.getsizeof(pair)
+
+
+def test_deep_size_skips_seen_and_excluded_objects() -> None:
+    blob: bytes = bytes(_BLOB_SIZE)
+    other_blob: bytes = bytes(_BLOB_SIZE)
+    first: list[bytes] = [blob]
+    second: list[bytes] = [blob]
+    seen: set[int] = set()
+
+    assert deep_size(first, seen=seen) == sys.getsizeof(first) + sys.getsizeof(blob)
+    assert deep_size(second, seen=seen) == sys.getsizeof(second)
+    assert deep_size(first, seen=seen) == 0
+    assert deep_size([other_blob], excluded={id(other_blob)}) == sys.getsizeof([other_blob])
+
+
+def test_deep_size_leaves_out_classes_and_functions() -> None:
+    values: list[Any] = [Cache, deep_size, sys]
+
+    assert deep_size(values) == sys.getsizeof(values)
+
+
+def test_shallow_usage_counts_each_component_on_its_own() -> None:
+    blob: bytes = bytes(_BLOB_SIZE)
+    first: Cache = Cache(blob)
+    second: Cache = Cache(blob)
+    usages: list[MemoryUsage] = memory_usage(_container((first, None), (second, None)))
+
+    assert usages == [
+        MemoryUsage(kind=Cache, components=2, size=shallow_size(first) + shallow_size(second))
+    ]
+    assert usages[0].size < _BLOB_SIZE
+
+
+def test_deep_usage_counts_shared_referents_once() -> None:
+    blob: bytes = bytes(_BLOB_SIZE)
+    cache: Cache = Cache(blob)
+    container: Container = _container((cache, 'primary'), (Cache(blob), 'replica'), (Service(cache), None))
+    usages: list[MemoryUsage] = memory_usage(container, deep=True)
+
+    assert [(usage.kind, usage.qualifier) for usage in usages] == [
+        (Cache, 'primary'), (Cache, 'replica'), (Service, None)
+    ]
+    # The blob is attributed to the first cache only, and the service doesn't count the cache it depends on
+    assert usages[0].size > _BLOB_SIZE
+    assert all(usage.size < _BLOB_SIZE // 10 for usage in usages[1:])
+    assert sum(usage.size for usage in usages) < 2 * _BLOB_SIZE
@@ -0,0 +1,71 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from foxhound import Container, start
+from foxhound.core.di import module_index
+from foxhound.core.di.module_index import ModuleIndex
+from foxhound.tests.conftest import WriteModule
+
+
+def _write_package(write_module: WriteModule) -> None:
+    write_module('plant.machines', '''
+        from foxhound import component as register
+
+        @register()
+        class Press:
+            pass
+    ''')
+    write_module('plant.scripts.migrate', '''
+        raise RuntimeError('must not be imported by a static scan')
+    ''')
+
+
+def test_static_scan_only_imports_modules_referencing_components(write_module: WriteModule) -> None:
+    _write_package(write_module)
+    container: Container = start('plant', static_scan=True)
+
+    assert isinstance(container.get(sys.modules['plant.machines'].Press), sys.modules['plant.machines'].Press)
+    assert 'plant.scripts.migrate' not in sys.modules
+
+
+def test_index_is_persisted_and_picks_up_changed_files(write_module: WriteModule, tmp_path: Path) -> None:
+    _write_package(write_module)
+    index_path: Path = tmp_path / 'index' / 'modules.json'
+    start('plant', static_scan=True, module_index_path=str(index_path))
+    entries: dict[str, list] = json.loads(index_path.read_text())
+
+    assert sorted(references for *_, references in entries.values()) == [False, False, True]
+
+    migrate: Path = write_module('plant.scripts.migrate', '''
+        from foxhound import component
+
+        @component()
+        class Migration:
+            pass
+    ''')
+    modules: list[str] = ModuleIndex(str(index_path)).find_component_modules(sys.modules['plant'])
+
+    assert 'plant.scripts.migrate' in modules
+    assert json.loads(index_path.read_text())[str(migrate)][2] is True
+
+
+def test_unwritable_index_does_not_fail_startup(
+        write_module: WriteModule,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def replace(source: str, destination: str) -> None:
+        raise PermissionError(destination)
+
+    _write_package(write_module)
+    index_directory: Path = tmp_path / 'index'
+    monkeypatch.setattr(module_index.os, 'replace', replace)
+
+    container: Container = start('plant', static_scan=True, module_index_path=str(index_directory / 'modules.json'))
+
+    assert isinstance(container.get(sys.modules['plant.machines'].Press), sys.modules['plant.machines'].Press)
+    assert os.listdir(index_directory) == []
@@ -0,0 +1,52 @@
+import threading
+
+import pytest
+
+from foxhound import Container, start
+from foxhound.core.di.graph.exceptions import ComponentInflationError
+from foxhound.tests.conftest import ComponentModule
+
+# Both branches must be inflating at the same time to get past it
+_branches: threading.Barrier = threading.Barrier(2, timeout=5)
+
+
+class Left:
+    def __init__(self) -> None:
+        _branches.wait()
+
+
+class Right:
+    def __init__(self) -> None:
+        _branches.wait()
+
+
+class Root:
+    def __init__(self, left: Left, right: Right) -> None:
+        self.left = left
+        self.right = right
+
+
+class Broken:
+    def __init__(self) -> None:
+        raise ValueError('broken factory')
+
+
+def test_independent_components_inflate_side_by_side(component_module: ComponentModule) -> None:
+    _branches.reset()
+    container: Container = start(component_module(Left, Right, Root), max_workers=2)
+    root: Root = container.get(Root)
+
+    assert root.left is container.get(Left)
+    assert root.right is container.get(Right)
+
+
+@pytest.mark.parametrize('max_workers', [None, 1, 4])
+def test_failing_factory_raises_the_same_error_with_and_without_a_thread_pool(
+        component_module: ComponentModule,
+        max_workers: int | None
+) -> None:
+    with pytest.raises(ComponentInflationError) as error:
+        start(component_module(Broken), max_workers=max_workers)
+
+    assert error.value.component_id == str(Broken)
+    assert isinstance(error.value.__cause__, ValueError)
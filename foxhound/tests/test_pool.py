@@ -0,0 +1,149 @@
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from foxhound import Container, PoolSettings, define_component, shutdown, start
+from foxhound.core.di.exceptions import PoolExhaustedError
+from foxhound.core.di.pool import ComponentPool
+from foxhound.tests.conftest import ComponentModule
+
+
+class Cursor:
+    def __init__(self) -> None:
+        self.closed = False
+        self.on_call: Callable[[], Any] = lambda: None
+
+    def execute(self) -> 'Cursor':
+        return self
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TracingCursor(Cursor):
+    def trace(self) -> 'Cursor':
+        return self
+
+
+def tracing_cursor() -> Cursor:
+    return TracingCursor()
+
+
+def test_pool_reuses_returned_instances() -> None:
+    pool: ComponentPool[Cursor] = ComponentPool(Cursor, PoolSettings(max_size=2))
+    cursor: Cursor = pool.borrow()
+    pool.release(cursor)
+
+    assert pool.borrow() is cursor
+    assert pool.statistics().hits == 1
+    assert pool.statistics().misses == 1
+
+
+def test_exhausted_pool_times_out() -> None:
+    pool: ComponentPool[Cursor] = ComponentPool(Cursor, PoolSettings(max_size=1, borrow_timeout=0.01))
+    pool.borrow()
+
+    with pytest.raises(PoolExhaustedError):
+        pool.borrow()
+
+
+def test_idle_instances_are_evicted_and_closed_by_a_timer() -> None:
+    pool: ComponentPool[Cursor] = ComponentPool(Cursor, PoolSettings(max_size=2, idle_timeout=0.01))
+    cursor: Cursor = pool.borrow()
+    pool.release(cursor)
+    deadline: float = time.monotonic() + 5
+
+    while not cursor.closed and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert cursor.closed
+    assert pool.statistics().evictions == 1
+
+
+def test_instances_released_after_drain_are_closed() -> None:
+    pool: ComponentPool[Cursor] = ComponentPool(Cursor, PoolSettings())
+    cursor: Cursor = pool.borrow()
+    pool.drain()
+    pool.release(cursor)
+
+    assert cursor.closed
+    assert pool.idle_instances() == []
+
+
+def test_concurrent_calls_borrow_separate_instances(component_module: ComponentModule) -> None:
+    container: Container = start(component_module(Cursor, scope='pooled', pool=PoolSettings(max_size=2)))
+    # Any, since "with" is served by the proxy rather than by Cursor
+    proxy: Any = container.get(Cursor)
+    both_borrowed: threading.Barrier = threading.Barrier(2, timeout=5)
+    results: list[Cursor] = []
+
+    def run() -> None:
+        with proxy as cursor:
+            both_borrowed.wait()
+            results.append(cursor.execute())
+
+    threads: list[threading.Thread] = [threading.Thread(target=run) for _ in range(2)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert results[0] is not results[1]
+
+
+def test_methods_of_subclasses_and_instance_callables_borrow_for_the_call(component_module: ComponentModule) -> None:
+    container: Container = start(component_module(tracing_cursor, scope='pooled'))
+    proxy: Any = container.get(Cursor)
+    pool: ComponentPool[Cursor] = container.pool(Cursor)
+
+    assert proxy.trace() in pool.idle_instances()
+
+    with proxy as cursor:
+        cursor.on_call = pool.idle_instances
+
+    trace: Callable[[], Cursor] = proxy.trace
+    on_call: Callable[[], list[Cursor]] = proxy.on_call
+
+    # Called while borrowed, so the pool has no idle instance to list
+    assert on_call() == []
+    assert trace() is cursor
+
+
+def test_proxy_is_hashed_and_compared_by_identity(component_module: ComponentModule) -> None:
+    container: Container = start(component_module(Cursor, scope='pooled', pool=PoolSettings(max_size=2)))
+    proxy: Cursor = container.get(Cursor)
+    lookup: dict[Any, str] = {proxy: 'cursor'}
+    # Held elsewhere, so a forwarded hash would borrow the other instance and miss the key
+    held: Cursor = container.pool(Cursor).borrow()
+
+    assert lookup[proxy] == 'cursor'
+    assert proxy == proxy
+    assert hash(proxy) == hash(proxy)
+
+    container.pool(Cursor).release(held)
+
+
+def test_pooled_context_managers_are_rejected() -> None:
+    class Session:
+        def __enter__(self) -> 'Session':
+            return self
+
+        def __exit__(self, *exc_info: Any) -> None:
+            pass
+
+    with pytest.raises(TypeError, match='context managers'):
+        define_component(Session, scope='pooled')
+
+
+def test_shutdown_closes_idle_instances(component_module: ComponentModule) -> None:
+    container: Container = start(component_module(Cursor, scope='pooled', pool=PoolSettings(min_size=2)))
+    idle: list[Cursor] = container.pool(Cursor).idle_instances()
+    shutdown(container)
+
+    assert len(idle) == 2
+    assert all(cursor.closed for cursor in idle)
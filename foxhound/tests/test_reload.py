@@ -0,0 +1,142 @@
+import asyncio
+import sys
+from types import ModuleType
+
+import pytest
+
+from foxhound import Container, reload, reload_async, start, start_async
+from foxhound.core.di.exceptions import IncompleteReloadError
+from foxhound.tests.conftest import WriteModule
+
+_REPOSITORIES: str = '''
+    from app.events import closed
+    from foxhound import component
+
+    @component()
+    class Repository:
+        version = {version}
+
+        def close(self) -> None:
+            closed.append(('repository', self.version))
+'''
+
+_ASYNC_REPOSITORIES: str = '''
+    from app.events import closed
+    from foxhound import component
+
+    class Repository:
+        version = {version}
+
+    @component()
+    async def repository() -> Repository:
+        return Repository()
+'''
+
+_SERVICES: str = '''
+    from app.repositories import Repository
+    from foxhound import component
+
+    @component()
+    class Service:
+        def __init__(self, repository: Repository):
+            self.repository = repository
+
+    @component()
+    class Unrelated:
+        pass
+'''
+
+
+def _write_app(write_module: WriteModule, repositories: str = _REPOSITORIES) -> None:
+    write_module('app.events', 'closed = []')
+    write_module('app.repositories', repositories.format(version=1))
+    write_module('app.services', _SERVICES)
+
+
+def _module(name: str) -> ModuleType:
+    return sys.modules[name]
+
+
+def test_reload_reinflates_changed_components_and_their_dependents(write_module: WriteModule) -> None:
+    _write_app(write_module)
+    container: Container = start('app')
+    services: ModuleType = _module('app.services')
+    unrelated: object = container.get(services.Unrelated)
+
+    write_module('app.repositories', _REPOSITORIES.format(version=2))
+    reload(container, 'app.repositories')
+    service = container.get(services.Service)
+
+    assert service.repository.version == 2
+    assert service.repository is container.get(_module('app.repositories').Repository)
+    assert container.get(services.Unrelated) is unrelated
+    assert _module('app.events').closed == [('repository', 1)]
+
+
+def test_unchanged_factory_functions_keep_their_instances(write_module: WriteModule) -> None:
+    write_module('config_app.models', '''
+        class Settings:
+            pass
+    ''')
+    # Classes are recreated by every reload, so the factory's kind lives in a module that isn't reloaded
+    write_module('config_app.settings', '''
+        from config_app.models import Settings
+        from foxhound import component
+
+        @component()
+        def settings() -> Settings:
+            return Settings()
+    ''')
+    container: Container = start('config_app')
+    settings = container.get(_module('config_app.models').Settings)
+
+    reload(container, 'config_app.settings')
+
+    assert container.get(_module('config_app.models').Settings) is settings
+
+
+def test_reload_leaving_components_of_recreated_classes_behind_is_refused(write_module: WriteModule) -> None:
+    _write_app(write_module)
+    write_module('app.factories', '''
+        from app.repositories import Repository
+        from foxhound import component
+
+        @component()
+        def replicas() -> tuple[Repository, ...]:
+            return (Repository(),)
+    ''')
+    container: Container = start('app')
+    repository_class: type = _module('app.repositories').Repository
+
+    with pytest.raises(IncompleteReloadError) as error:
+        reload(container, 'app.repositories')
+
+    assert error.value.modules == ['app.factories']
+    assert _module('app.repositories').Repository is repository_class
+
+
+def test_sync_reload_of_async_factories_is_refused_before_reimporting(write_module: WriteModule) -> None:
+    _write_app(write_module, _ASYNC_REPOSITORIES)
+    container: Container = asyncio.run(start_async('app'))
+    repository_class: type = _module('app.repositories').Repository
+
+    write_module('app.repositories', _ASYNC_REPOSITORIES.format(version=2))
+
+    with pytest.raises(TypeError, match='reload_async'):
+        reload(container, 'app.repositories')
+
+    assert _module('app.repositories').Repository is repository_class
+
+
+def test_async_reload_awaits_async_factories(write_module: WriteModule) -> None:
+    _write_app(write_module, _ASYNC_REPOSITORIES)
+
+    async def run() -> int:
+        container: Container = await start_async('app')
+        write_module('app.repositories', _ASYNC_REPOSITORIES.format(version=2))
+        await reload_async(container, 'app.repositories')
+
+        version: int = container.get(_module('app.services').Service).repository.version
+        return version
+
+    assert asyncio.run(run()) == 2
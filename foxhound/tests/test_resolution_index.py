@@ -0,0 +1,93 @@
+from collections.abc import Callable
+from typing import Any
+
+from foxhound.core.di.dependency_resolver import DependencyResolver
+from foxhound.core.di.models import ComponentDefinition, ComponentMetadata, Parameter
+from foxhound.core.di.resolution_index import ResolutionIndex
+from foxhound.core.models import Result
+
+
+class Handler:
+    pass
+
+
+class JsonHandler(Handler):
+    pass
+
+
+class XmlHandler(Handler):
+    pass
+
+
+class LoggingHandler(Handler):
+    # Decorates another handler, so it must never be resolved as its own dependency
+    def __init__(self, handler: Handler) -> None:
+        self.handler = handler
+
+
+def _definition(kind: type, qualifier: str | None = None, primary: bool = False) -> ComponentDefinition[Any]:
+    inflator: Callable[..., Any] = kind
+
+    return ComponentDefinition(
+        metadata=ComponentMetadata(id=kind.__name__, qualifier=qualifier, primary=primary, kind=kind),
+        inflator=inflator
+    )
+
+
+def _parameter(kind: type, parent: type, qualifier: str | None = None) -> Parameter:
+    return Parameter(name='handler', kind=kind, qualifier=qualifier, parent_component_id=parent.__name__)
+
+
+def test_find_returns_definitions_of_the_kind_and_its_subclasses() -> None:
+    json: ComponentDefinition[Any] = _definition(JsonHandler)
+    xml: ComponentDefinition[Any] = _definition(XmlHandler)
+    index: ResolutionIndex = ResolutionIndex([json, xml])
+
+    assert index.find(Handler) == [json, xml]
+    assert index.find(XmlHandler) == [xml]
+    assert index.find(LoggingHandler) == []
+    assert index.get('XmlHandler') is xml
+
+
+def test_find_skips_the_excluded_component() -> None:
+    json: ComponentDefinition[Any] = _definition(JsonHandler)
+    logging: ComponentDefinition[Any] = _definition(LoggingHandler)
+    index: ResolutionIndex = ResolutionIndex([json, logging])
+
+    assert index.find(Handler, excluded_component_id='LoggingHandler') == [json]
+    assert index.find(LoggingHandler, excluded_component_id='LoggingHandler') == []
+
+
+def test_find_qualified_returns_the_first_definition_with_the_qualifier() -> None:
+    json: ComponentDefinition[Any] = _definition(JsonHandler, 'default')
+    xml: ComponentDefinition[Any] = _definition(XmlHandler, 'default')
+    index: ResolutionIndex = ResolutionIndex([json, xml, _definition(LoggingHandler)])
+
+    assert index.find_qualified('default') is json
+    assert index.find_qualified('missing') is None
+    assert index.qualified_definitions() == {'default': [json, xml]}
+
+
+def test_self_excluding_candidate_resolves_to_the_only_other_component() -> None:
+    index: ResolutionIndex = ResolutionIndex([_definition(JsonHandler), _definition(LoggingHandler)])
+    result: Result[list[str]] = DependencyResolver().try_resolve(_parameter(Handler, LoggingHandler), index)
+
+    assert result.unwrap() == ['JsonHandler']
+
+
+def test_self_excluding_qualified_candidate_is_not_resolved() -> None:
+    index: ResolutionIndex = ResolutionIndex([_definition(LoggingHandler, 'logging')])
+    result: Result[list[str]] = DependencyResolver().try_resolve(
+        _parameter(Handler, LoggingHandler, 'logging'),
+        index
+    )
+
+    assert not result.successful
+    assert 'no component matching' in str(result.hint)
+
+
+def test_primary_candidate_breaks_ambiguity() -> None:
+    index: ResolutionIndex = ResolutionIndex([_definition(JsonHandler, primary=True), _definition(XmlHandler)])
+    result: Result[list[str]] = DependencyResolver().try_resolve(_parameter(Handler, LoggingHandler), index)
+
+    assert result.unwrap() == ['JsonHandler']
@@ -0,0 +1,145 @@
+import asyncio
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from foxhound import Container, child_container, shutdown, shutdown_async, start, start_async
+from foxhound.core.di.exceptions import ComponentShutdownError
+from foxhound.tests.conftest import ComponentModule
+
+closed: list[str] = []
+# Set by tests whose closes must overlap, or must never return
+_overlapping: list[threading.Barrier] = []
+_released: threading.Event = threading.Event()
+
+
+class Config:
+    def close(self) -> None:
+        closed.append('config')
+
+
+class Db:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+    def close(self) -> None:
+        closed.append('db')
+
+
+class Cache:
+    def close(self) -> None:
+        for barrier in _overlapping:
+            barrier.wait()
+
+        closed.append('cache')
+
+
+class Queue:
+    def close(self) -> None:
+        for barrier in _overlapping:
+            barrier.wait()
+
+        closed.append('queue')
+
+
+class Service:
+    def __init__(self, db: Db) -> None:
+        self.db = db
+
+    def close(self) -> None:
+        closed.append('service')
+
+
+class Stuck:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+    def close(self) -> None:
+        _released.wait()
+
+
+class Broken:
+    def close(self) -> None:
+        raise ValueError('cannot close')
+
+
+class AsyncClient:
+    async def close(self) -> None:
+        await asyncio.sleep(0)
+        closed.append('async client')
+
+
+class SlowAsyncClient:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+    async def close(self) -> None:
+        await asyncio.Event().wait()
+
+
+class Connection:
+    pass
+
+
+def connection() -> Iterator[Connection]:
+    yield Connection()
+    closed.append('connection')
+
+
+@pytest.fixture(autouse=True)
+def _reset() -> Iterator[None]:
+    closed.clear()
+    _released.clear()
+
+    yield
+
+    _overlapping.clear()
+    _released.set()
+
+
+def test_components_are_closed_after_their_dependents(component_module: ComponentModule) -> None:
+    container: Container = start(component_module(Config, Db, Service, connection))
+    shutdown(container)
+
+    assert closed.index('service') < closed.index('db') < closed.index('config')
+    assert 'connection' in closed
+    assert not container.inflated
+
+
+def test_unrelated_components_are_closed_side_by_side(component_module: ComponentModule) -> None:
+    _overlapping.append(threading.Barrier(2, timeout=5))
+    shutdown(start(component_module(Cache, Queue)))
+
+    assert sorted(closed) == ['cache', 'queue']
+
+
+def test_components_not_closing_in_time_do_not_hold_the_rest_back(component_module: ComponentModule) -> None:
+    container: Container = start(component_module(Config, Stuck, Broken, Cache))
+
+    with pytest.raises(ComponentShutdownError) as error:
+        shutdown(container, timeout=0.05)
+
+    assert isinstance(error.value.failures[str(Stuck)], TimeoutError)
+    assert isinstance(error.value.failures[str(Broken)], ValueError)
+    assert sorted(closed) == ['cache', 'config']
+
+
+def test_async_shutdown_awaits_async_closes_within_the_timeout(component_module: ComponentModule) -> None:
+    async def run() -> None:
+        container: Container = await start_async(component_module(Config, AsyncClient, SlowAsyncClient))
+        await shutdown_async(container, timeout=0.05)
+
+    with pytest.raises(ComponentShutdownError) as error:
+        asyncio.run(run())
+
+    assert list(error.value.failures) == [str(SlowAsyncClient)]
+    assert isinstance(error.value.failures[str(SlowAsyncClient)], TimeoutError)
+    assert sorted(closed) == ['async client', 'config']
+
+
+def test_child_containers_only_close_what_they_reinflated(component_module: ComponentModule) -> None:
+    container: Container = start(component_module(Config, Db, Service))
+    shutdown(child_container(container, {Db: Db(Config())}))
+
+    assert closed == ['service']
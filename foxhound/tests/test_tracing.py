@@ -0,0 +1,134 @@
+import asyncio
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from foxhound import StartupTracer, start, start_async
+from foxhound.core.di.models import TraceSpan
+from foxhound.core.di.tracing import COMPONENT_CATEGORY, PHASE_CATEGORY
+from foxhound.tests.conftest import ComponentModule
+
+
+class Clock:
+    pass
+
+
+class Mailer:
+    def __init__(self, clock: Clock) -> None:
+        self.clock = clock
+
+
+def _span(name: str, category: str, start: int, duration: int, task: str | None = None) -> TraceSpan:
+    return TraceSpan(name=name, category=category, start=start, duration=duration, thread_id=1, task=task)
+
+
+def _tracer(*spans: TraceSpan) -> StartupTracer:
+    tracer: StartupTracer = StartupTracer()
+    tracer._spans.extend(spans)
+
+    return tracer
+
+
+def test_chrome_trace_has_a_complete_event_per_span() -> None:
+    tracer: StartupTracer = _tracer(
+        _span('inflate', PHASE_CATEGORY, 1_000, 2_500_000),
+        _span('mailer', COMPONENT_CATEGORY, 5_000, 1_500, task='startup')
+    )
+
+    assert tracer.to_chrome_trace() == {
+        'traceEvents': [
+            {
+                'name': 'inflate',
+                'cat': PHASE_CATEGORY,
+                'ph': 'X',
+                'ts': 1.0,
+                'dur': 2_500.0,
+                'pid': os.getpid(),
+                'tid': 1,
+                'args': {}
+            },
+            {
+                'name': 'mailer',
+                'cat': COMPONENT_CATEGORY,
+                'ph': 'X',
+                'ts': 5.0,
+                'dur': 1.5,
+                'pid': os.getpid(),
+                'tid': 1,
+                'args': {'task': 'startup'}
+            }
+        ],
+        'displayTimeUnit': 'ms'
+    }
+
+
+def test_component_events_nest_within_the_inflate_phase(component_module: ComponentModule) -> None:
+    tracer: StartupTracer = StartupTracer()
+    start(component_module(Clock, Mailer), tracer=tracer)
+    events: list[dict[str, Any]] = tracer.to_chrome_trace()['traceEvents']
+    inflate: dict[str, Any] = next(event for event in events if event['name'] == 'inflate')
+    components: list[dict[str, Any]] = [event for event in events if event['cat'] == COMPONENT_CATEGORY]
+
+    assert [event['name'] for event in components] == [str(Clock), str(Mailer)]
+    assert all(
+        inflate['ts'] <= event['ts'] and event['ts'] + event['dur'] <= inflate['ts'] + inflate['dur']
+        for event in components
+    )
+    assert {event['tid'] for event in components} == {threading.get_ident()}
+    assert components[0]['ts'] + components[0]['dur'] <= components[1]['ts']
+
+
+def test_async_component_events_record_their_task(component_module: ComponentModule) -> None:
+    tracer: StartupTracer = StartupTracer()
+    asyncio.run(start_async(component_module(Clock, Mailer), tracer=tracer))
+
+    assert all(
+        'task' in event['args']
+        for event in tracer.to_chrome_trace()['traceEvents']
+        if event['cat'] == COMPONENT_CATEGORY
+    )
+
+
+def test_exported_chrome_trace_is_json(component_module: ComponentModule, tmp_path: Path) -> None:
+    tracer: StartupTracer = StartupTracer()
+    start(component_module(Clock, Mailer), tracer=tracer)
+    path: Path = tmp_path / 'startup.json'
+    tracer.export_chrome_trace(str(path))
+
+    assert json.loads(path.read_text()) == tracer.to_chrome_trace()
+
+
+def test_listeners_are_called_as_each_span_ends() -> None:
+    tracer: StartupTracer = StartupTracer()
+    ended: list[str] = []
+    tracer.add_listener(lambda span: ended.append(span.name))
+
+    with tracer.phase('map'), tracer.phase('map.resolve'):
+        pass
+
+    assert ended == ['map.resolve', 'map']
+    assert [span.name for span in tracer.spans()] == ended
+
+
+def test_report_lists_the_slowest_spans_per_category() -> None:
+    tracer: StartupTracer = _tracer(
+        _span('clock', COMPONENT_CATEGORY, 0, 1_000_000),
+        _span('scan', PHASE_CATEGORY, 0, 2_000_000),
+        _span('mailer', COMPONENT_CATEGORY, 0, 3_500_000),
+        _span('inflate', PHASE_CATEGORY, 0, 5_000_000)
+    )
+
+    assert tracer.report() == '\n'.join([
+        'phases (2):',
+        '       5.000 ms  inflate',
+        '       2.000 ms  scan',
+        'components (2):',
+        '       3.500 ms  mailer',
+        '       1.000 ms  clock'
+    ])
+    assert tracer.report(limit=1).splitlines() == [
+        'phases (2):', '       5.000 ms  inflate', 'components (2):', '       3.500 ms  mailer'
+    ]
+    assert StartupTracer().report() == ''
@@ -0,0 +1,90 @@
+import pytest
+
+from foxhound import start
+from foxhound.core.di.graph.exceptions import ComponentInflationError
+from foxhound.core.di.models import Component, ComponentMetadata, Parameter
+from foxhound.core.models import validate_models, validation_enabled
+from foxhound.tests.conftest import ComponentModule
+
+inflated: list[str] = []
+
+
+class Clock:
+    pass
+
+
+class Ledger:
+    pass
+
+
+class Invoice:
+    def __init__(self, clock: Clock) -> None:
+        inflated.append('invoice')
+        self.clock = clock
+
+
+def clock() -> Clock:
+    # Declared to return a Clock, but doesn't
+    ledger: Clock = Ledger()  # type: ignore[assignment]
+    return ledger
+
+
+def _mismatching_component() -> Component[object]:
+    return Component(metadata=ComponentMetadata(id='clock', kind=Clock), value=Ledger())
+
+
+@pytest.mark.parametrize('value', ['0', 'false', 'OFF'])
+def test_validation_is_disabled_by_the_environment(monkeypatch: pytest.MonkeyPatch, value: str) -> None:
+    monkeypatch.setenv('FOXHOUND_VALIDATION', value)
+
+    assert not validation_enabled()
+    validate_models([_mismatching_component()])
+
+
+@pytest.mark.parametrize('value', [None, 'true', '1'])
+def test_validation_is_enabled_by_default(monkeypatch: pytest.MonkeyPatch, value: str | None) -> None:
+    if value is None:
+        monkeypatch.delenv('FOXHOUND_VALIDATION', raising=False)
+    else:
+        monkeypatch.setenv('FOXHOUND_VALIDATION', value)
+
+    assert validation_enabled()
+
+    with pytest.raises(ValueError, match='type mismatch'):
+        validate_models([_mismatching_component()])
+
+
+def test_invalid_models_are_reported() -> None:
+    with pytest.raises(ValueError, match='must be a type or a generic alias'):
+        validate_models([Parameter(name='clock', kind='Clock', parent_component_id='invoice')])  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError, match='must be a string'):
+        validate_models([ComponentMetadata(id=1, kind=Clock)])  # type: ignore[arg-type]
+
+
+def test_mismatching_value_fails_before_its_dependents_are_inflated(
+        monkeypatch: pytest.MonkeyPatch,
+        component_module: ComponentModule
+) -> None:
+    monkeypatch.delenv('FOXHOUND_VALIDATION', raising=False)
+    inflated.clear()
+
+    with pytest.raises(ComponentInflationError) as error:
+        start(component_module(clock, Invoice))
+
+    assert error.value.component_id == str(clock)
+    assert isinstance(error.value.__cause__, ValueError)
+    assert inflated == []
+
+
+def test_mismatching_value_is_accepted_without_validation(
+        monkeypatch: pytest.MonkeyPatch,
+        component_module: ComponentModule
+) -> None:
+    monkeypatch.setenv('FOXHOUND_VALIDATION', 'false')
+    inflated.clear()
+
+    invoice: Invoice = start(component_module(clock, Invoice)).get(Invoice)
+
+    assert isinstance(invoice.clock, Ledger)
+    assert inflated == ['invoice']
@@ -0,0 +1,85 @@
+import asyncio
+import gc
+import inspect
+import weakref
+
+import pytest
+
+from foxhound import Container, start, wire
+from foxhound.tests.conftest import ComponentModule
+
+
+class Clock:
+    pass
+
+
+class Mailer:
+    def __init__(self, clock: Clock) -> None:
+        self.clock = clock
+
+
+@wire()
+def send(subject: str, mailer: Mailer, *, clock: Clock) -> tuple[str, Mailer, Clock]:
+    return subject, mailer, clock
+
+
+@wire()
+async def send_later(mailer: Mailer) -> Mailer:
+    await asyncio.sleep(0)
+    return mailer
+
+
+def test_wired_parameters_are_injected_unless_passed(component_module: ComponentModule) -> None:
+    container: Container = start(component_module(Clock, Mailer))
+    mailer: Mailer = Mailer(Clock())
+
+    assert send('hello') == ('hello', container.get(Mailer), container.get(Clock))
+    assert send('hello', mailer)[1] is mailer
+    assert send('hello', clock=mailer.clock)[2] is mailer.clock
+
+
+def test_wired_coroutine_functions_are_injected(component_module: ComponentModule) -> None:
+    container: Container = start(component_module(Clock, Mailer))
+
+    assert asyncio.run(send_later()) is container.get(Mailer)
+
+
+def test_wired_functions_follow_the_most_recently_started_container(component_module: ComponentModule) -> None:
+    start(component_module(Clock, Mailer))
+    send('hello')
+    container: Container = start(component_module(Clock, Mailer))
+
+    assert send('hello')[1] is container.get(Mailer)
+
+
+def test_rebinding_releases_the_previous_components(component_module: ComponentModule) -> None:
+    previous: weakref.ref[Mailer] = weakref.ref(start(component_module(Clock, Mailer)).get(Mailer))
+    send('hello')
+    start(component_module(Clock, Mailer))
+    gc.collect()
+
+    assert previous() is None
+
+
+def test_wired_function_keeps_the_targets_identity(component_module: ComponentModule) -> None:
+    start(component_module(Clock, Mailer))
+
+    assert send.__name__ == 'send'
+    assert 'return subject, mailer, clock' in inspect.getsource(send)
+    assert list(inspect.signature(send).parameters) == ['subject', 'mailer', 'clock']
+
+
+def test_unknown_qualified_parameters_are_rejected() -> None:
+    def notify(mailer: Mailer) -> None:
+        pass
+
+    with pytest.raises(TypeError, match='not parameters'):
+        wire({'sender': 'primary'})(notify)
+
+
+def test_injected_components_are_not_bound_as_defaults(component_module: ComponentModule) -> None:
+    start(component_module(Clock, Mailer))
+    send('hello')
+
+    assert inspect.signature(send).parameters['mailer'].default is inspect.Parameter.empty
+    assert send.__wrapped__.__defaults__ is None  # type: ignore[attr-defined]
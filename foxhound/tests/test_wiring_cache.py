@@ -0,0 +1,126 @@
+import sys
+from pathlib import Path
+
+from foxhound import Container, StartupTracer, start
+from foxhound.tests.conftest import WriteModule
+
+
+def _start(root: str, plan_path: Path) -> tuple[Container, set[str]]:
+    # Every start runs as if in a new process, importing the scanned modules again
+    for module_name in list(sys.modules):
+        if module_name.split('.')[0] in (root, 'billing'):
+            del sys.modules[module_name]
+
+    tracer: StartupTracer = StartupTracer()
+    container: Container = start(root, wiring_cache_path=str(plan_path), tracer=tracer)
+
+    return container, {span.name for span in tracer.spans()}
+
+
+def test_valid_plan_skips_scanning(write_module: WriteModule, tmp_path: Path) -> None:
+    write_module('shop.components', '''
+        from foxhound import component
+
+        @component()
+        class Inventory:
+            pass
+
+        @component()
+        class Checkout:
+            def __init__(self, inventory: Inventory):
+                self.inventory = inventory
+    ''')
+    plan_path: Path = tmp_path / 'wiring.plan'
+
+    _, phases = _start('shop', plan_path)
+    assert 'scan' in phases
+
+    container, phases = _start('shop', plan_path)
+    components = sys.modules['shop.components']
+
+    assert 'scan' not in phases
+    assert container.get(components.Checkout).inventory is container.get(components.Inventory)
+
+
+def test_plan_is_rebuilt_when_a_scanned_module_changes(write_module: WriteModule, tmp_path: Path) -> None:
+    write_module('shop.components', '''
+        from foxhound import component
+
+        @component()
+        class Inventory:
+            pass
+    ''')
+    plan_path: Path = tmp_path / 'wiring.plan'
+    _start('shop', plan_path)
+
+    write_module('shop.components', '''
+        from foxhound import component
+
+        @component()
+        class Inventory:
+            pass
+
+        @component()
+        class Checkout:
+            def __init__(self, inventory: Inventory):
+                self.inventory = inventory
+    ''')
+    container, phases = _start('shop', plan_path)
+    components = sys.modules['shop.components']
+
+    assert 'scan' in phases
+    assert container.get(components.Checkout).inventory is container.get(components.Inventory)
+
+
+def test_plan_is_rebuilt_when_an_imported_component_changes(write_module: WriteModule, tmp_path: Path) -> None:
+    write_module('billing.gateway', '''
+        from foxhound import component
+
+        @component()
+        class Ledger:
+            pass
+
+        @component()
+        class Gateway:
+            pass
+    ''')
+    write_module('shop.components', '''
+        from billing.gateway import Gateway, Ledger
+    ''')
+    plan_path: Path = tmp_path / 'wiring.plan'
+    _start('shop', plan_path)
+
+    write_module('billing.gateway', '''
+        from foxhound import component
+
+        @component()
+        class Ledger:
+            pass
+
+        @component()
+        class Gateway:
+            def __init__(self, ledger: Ledger):
+                self.ledger = ledger
+    ''')
+    container, phases = _start('shop', plan_path)
+    gateway = sys.modules['billing.gateway']
+
+    assert 'scan' in phases
+    assert container.get(gateway.Gateway).ledger is container.get(gateway.Ledger)
+
+
+def test_corrupt_plan_is_rebuilt(write_module: WriteModule, tmp_path: Path) -> None:
+    write_module('shop.components', '''
+        from foxhound import component
+
+        @component()
+        class Inventory:
+            pass
+    ''')
+    plan_path: Path = tmp_path / 'wiring.plan'
+    plan_path.write_bytes(b'not a plan')
+
+    container, phases = _start('shop', plan_path)
+
+    assert 'scan' in phases
+    assert isinstance(container.get(sys.modules['shop.components'].Inventory), sys.modules['shop.components'].Inventory)